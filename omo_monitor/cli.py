@@ -1,11 +1,12 @@
 """Command line interface for OpenCode Monitor."""
 
 import click
+import csv
 import json
 import sys
 from decimal import Decimal
 from pathlib import Path
-from typing import Optional, Dict, Any, Set
+from typing import Optional, Dict, Any, Iterable, Set
 from typing_extensions import TypedDict
 
 
@@ -54,6 +55,24 @@ def json_serializer(obj):
         return str(obj)
 
 
+def write_csv_rows(rows: Iterable[Dict[str, Any]]) -> None:
+    """Write report rows to stdout as CSV while they are being produced.
+
+    The header is taken from the first row, so nothing is buffered.
+
+    Args:
+        rows: Report rows sharing the same keys
+    """
+    writer = None
+    for row in rows:
+        if writer is None:
+            writer = csv.DictWriter(
+                sys.stdout, fieldnames=list(row), lineterminator="\n"
+            )
+            writer.writeheader()
+        writer.writerow(row)
+
+
 @click.group()
 @click.version_option(version=__version__)
 @click.option(
@@ -101,7 +120,9 @@ def cli(ctx: click.Context, config: Optional[str], verbose: bool, source: Option
                 )
                 # This will use cached data if fresh, or fetch if stale
                 provider.set_local_pricing(ctx.obj["pricing_data"])
-                models_dev_pricing = provider.get_models_dev_client().fetch_pricing()
+                models_dev_pricing = (
+                    provider.get_models_dev_client().fetch_pricing_by_name()
+                )
                 if models_dev_pricing and verbose:
                     click.echo(f"[Pricing: {len(models_dev_pricing)} models from Models.dev]")
             except Exception:
@@ -233,15 +254,13 @@ def sessions(
             ctx.exit(1)
 
         result = report_generator.generate_sessions_summary_report(
-            path, limit, output_format
+            path, limit, output_format, stream=output_format == "csv"
         )
 
         if output_format == "json":
             click.echo(json.dumps(result, indent=2, default=json_serializer))
         elif output_format == "csv":
-            click.echo(
-                "CSV data would be exported to file. Use 'export' command for file output."
-            )
+            write_csv_rows(result)
 
     except Exception as e:
         error_msg = create_user_friendly_error(e)
@@ -429,15 +448,13 @@ def daily(
     try:
         report_generator = ctx.obj["report_generator"]
         result = report_generator.generate_daily_report(
-            path, month, output_format, breakdown
+            path, month, output_format, breakdown, stream=output_format == "csv"
         )
 
         if output_format == "json":
             click.echo(json.dumps(result, indent=2, default=json_serializer))
         elif output_format == "csv":
-            click.echo(
-                "CSV data would be exported to file. Use 'export' command for file output."
-            )
+            write_csv_rows(result)
 
     except Exception as e:
         error_msg = create_user_friendly_error(e)
@@ -2089,7 +2106,7 @@ def pricing_list(ctx: click.Context, source: str):
             }
         elif source == "models.dev":
             client = provider.get_models_dev_client()
-            pricing = client.fetch_pricing()
+            pricing = client.fetch_pricing_by_name()
         else:
             pricing = provider.get_all_pricing()
 
@@ -1,5 +1,7 @@
 """Session data models for OpenCode Monitor."""
 
+import functools
+import sys
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from pathlib import Path
@@ -7,6 +9,77 @@ from decimal import Decimal
 from pydantic import BaseModel, Field, computed_field, field_validator, ConfigDict
 
 
+_MICRO = Decimal(1_000_000)
+
+# Shared zero for Decimal cost defaults and accumulators (Decimal is immutable)
+DECIMAL_ZERO = Decimal("0.0")
+
+
+@functools.lru_cache(maxsize=256)
+def price_to_micro_dollars(price: Any) -> int:
+    """Scale a per-1M-token price to integer micro-dollars.
+
+    Token counts times these prices are exact integer costs in pico-dollars
+    (1e-12 USD), which are much cheaper to add up than Decimals.
+
+    Args:
+        price: Price in USD per 1M tokens
+
+    Returns:
+        Price in micro-dollars per 1M tokens, rounded to the nearest unit
+    """
+    return int((Decimal(str(price)) * _MICRO).to_integral_value())
+
+
+def pico_dollars_to_decimal(pico_dollars: int) -> Decimal:
+    """Convert a pico-dollar cost back to a Decimal USD amount.
+
+    Args:
+        pico_dollars: Cost in 1e-12 USD
+
+    Returns:
+        Cost in USD
+    """
+    return Decimal(pico_dollars).scaleb(-12)
+
+
+def find_model_pricing(model_id: str, pricing_data: Dict[str, Any]) -> Optional[Any]:
+    """Find pricing for a model with flexible model name matching.
+
+    Args:
+        model_id: Model identifier
+        pricing_data: Dictionary of model pricing information
+
+    Returns:
+        Pricing entry or None if no match
+    """
+    # First try exact match
+    if model_id in pricing_data:
+        return pricing_data[model_id]
+
+    # Try prefix matching - extract base model name
+    # e.g., claude-opus-4.5-20251101 -> claude-opus-4.5
+    from ..utils.file_utils import FileProcessor
+
+    normalized = FileProcessor._normalize_model_name(model_id)
+
+    if normalized in pricing_data:
+        return pricing_data[normalized]
+
+    # Try finding a matching key by prefix
+    for key in pricing_data.keys():
+        if normalized.startswith(key) or key.startswith(normalized):
+            # Check if they're similar (same model family)
+            # e.g., "claude-opus-4.5" matches "claude-opus-4.5-extended"
+            if (
+                key.replace("-extended", "") == normalized
+                or normalized.replace("-extended", "") == key
+            ):
+                return pricing_data[key]
+
+    return None
+
+
 class TokenUsage(BaseModel):
     """Model for token usage data."""
 
@@ -169,6 +242,12 @@ class InteractionFile(BaseModel):
         """Ensure file path is a Path object."""
         return Path(v) if not isinstance(v, Path) else v
 
+    @field_validator("model_id", "provider_id", "agent", "mode", "category")
+    @classmethod
+    def intern_identifier(cls, v):
+        """Intern identifiers (a small, bounded set) so repeats share one object."""
+        return sys.intern(v) if isinstance(v, str) else v
+
     @computed_field
     @property
     def file_name(self) -> str:
@@ -198,32 +277,7 @@ class InteractionFile(BaseModel):
         Returns:
             Calculated cost in USD
         """
-        pricing = None
-
-        # First try exact match
-        if self.model_id in pricing_data:
-            pricing = pricing_data[self.model_id]
-        else:
-            # Try prefix matching - extract base model name
-            # e.g., claude-opus-4.5-20251101 -> claude-opus-4.5
-            from ..utils.file_utils import FileProcessor
-
-            normalized = FileProcessor._normalize_model_name(self.model_id)
-
-            if normalized in pricing_data:
-                pricing = pricing_data[normalized]
-            else:
-                # Try finding a matching key by prefix
-                for key in pricing_data.keys():
-                    if normalized.startswith(key) or key.startswith(normalized):
-                        # Check if they're similar (same model family)
-                        # e.g., "claude-opus-4.5" matches "claude-opus-4.5-extended"
-                        if (
-                            key.replace("-extended", "") == normalized
-                            or normalized.replace("-extended", "") == key
-                        ):
-                            pricing = pricing_data[key]
-                            break
+        pricing = find_model_pricing(self.model_id, pricing_data)
 
         if pricing is None:
             return Decimal("0.0")
@@ -244,6 +298,30 @@ class InteractionFile(BaseModel):
 
         return cost
 
+    def calculate_cost_pico(self, pricing_data: Dict[str, Any]) -> int:
+        """Calculate cost for this interaction as integer pico-dollars.
+
+        Same value as calculate_cost, for callers that sum many costs;
+        convert the total with pico_dollars_to_decimal.
+
+        Args:
+            pricing_data: Dictionary of model pricing information
+
+        Returns:
+            Calculated cost in 1e-12 USD
+        """
+        pricing = find_model_pricing(self.model_id, pricing_data)
+
+        if pricing is None:
+            return 0
+
+        return (
+            self.tokens.input * price_to_micro_dollars(pricing.input)
+            + self.tokens.output * price_to_micro_dollars(pricing.output)
+            + self.tokens.cache_write * price_to_micro_dollars(pricing.cache_write)
+            + self.tokens.cache_read * price_to_micro_dollars(pricing.cache_read)
+        )
+
 
 class SessionData(BaseModel):
     """Model for a complete OpenCode session."""
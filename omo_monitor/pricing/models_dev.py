@@ -3,12 +3,17 @@
 Fetches and caches model pricing from https://models.dev/api.json
 """
 
+import functools
 import json
 import os
-from datetime import datetime, timedelta
-from decimal import Decimal
+import re
+import time
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Tuple
+
+from ..utils.file_utils import write_atomic
 
 try:
     import requests
@@ -16,6 +21,12 @@ try:
 except ImportError:
     HAS_REQUESTS = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 def get_pricing_cache_path() -> Path:
     """Get path for pricing cache file.
@@ -34,9 +45,66 @@ def get_pricing_cache_path() -> Path:
     return cache_dir / "models_pricing.json"
 
 
+_DATE_SUFFIX_RE = re.compile(r"-\d{8}$")
+_CLAUDE_VERSION_RE = re.compile(r"claude-(opus|sonnet|haiku)-(\d+)-(\d+)")
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_model_name(model_id: str) -> str:
+    """Normalize model name for matching.
+
+    Args:
+        model_id: Raw model ID
+
+    Returns:
+        Normalized model name
+    """
+    model_id = model_id.lower()
+
+    # Strip date suffixes
+    model_id = _DATE_SUFFIX_RE.sub("", model_id)
+
+    # Normalize version separators
+    return _CLAUDE_VERSION_RE.sub(r"claude-\1-\2.\3", model_id)
+
+
+@functools.lru_cache(maxsize=256)
+def _decimal_from_str(value: str) -> Decimal:
+    """Parse a price string, cached since only a few dozen prices exist."""
+    return Decimal(value)
+
+
+def to_decimal(value: Any) -> Decimal:
+    """Convert a price value to Decimal.
+
+    Integers are converted directly; floats and strings go through a small
+    cache keyed on their string form.
+
+    Args:
+        value: Price as int, float or string
+
+    Returns:
+        Price as Decimal
+    """
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, int):
+        return Decimal(value)
+    return _decimal_from_str(str(value))
+
+
 class ModelPricingData:
     """Represents pricing data for a model."""
 
+    __slots__ = (
+        "input",
+        "output",
+        "cache_read",
+        "cache_write",
+        "context_window",
+        "session_quota",
+    )
+
     def __init__(
         self,
         input_price: Decimal,
@@ -89,12 +157,12 @@ class ModelPricingData:
             ModelPricingData instance
         """
         return cls(
-            input_price=Decimal(str(data.get("input", 0))),
-            output_price=Decimal(str(data.get("output", 0))),
-            cache_read_price=Decimal(str(data.get("cacheRead", data.get("cache_read", 0)))),
-            cache_write_price=Decimal(str(data.get("cacheWrite", data.get("cache_write", 0)))),
+            input_price=to_decimal(data.get("input", 0)),
+            output_price=to_decimal(data.get("output", 0)),
+            cache_read_price=to_decimal(data.get("cacheRead", data.get("cache_read", 0))),
+            cache_write_price=to_decimal(data.get("cacheWrite", data.get("cache_write", 0))),
             context_window=int(data.get("contextWindow", data.get("context_window", 200000))),
-            session_quota=Decimal(str(data.get("sessionQuota", data.get("session_quota", 0)))),
+            session_quota=to_decimal(data.get("sessionQuota", data.get("session_quota", 0))),
         )
 
 
@@ -117,11 +185,12 @@ class ModelsDevClient:
             api_url: Override API URL
             cache_path: Override cache file path
         """
-        self.cache_ttl = timedelta(hours=cache_ttl_hours)
+        self._cache_ttl_seconds = cache_ttl_hours * 3600
         self.api_url = api_url or self.API_URL
         self.cache_path = cache_path or get_pricing_cache_path()
         self._cached_data: Optional[Dict[str, ModelPricingData]] = None
-        self._cache_time: Optional[datetime] = None
+        self._cached_aliases: Dict[str, str] = {}
+        self._cache_time: Optional[float] = None  # time.monotonic()
 
     def fetch_pricing(self, force_refresh: bool = False) -> Dict[str, ModelPricingData]:
         """Fetch pricing data, using cache if valid.
@@ -130,7 +199,9 @@ class ModelsDevClient:
             force_refresh: Force API fetch even if cache is valid
 
         Returns:
-            Dict of model_id -> ModelPricingData
+            Dict of "provider/model" -> ModelPricingData. Bare and
+            normalized model names are resolved via get_model_pricing(),
+            or listed with fetch_pricing_by_name().
         """
         # Check memory cache
         if not force_refresh and self._is_memory_cache_valid():
@@ -140,17 +211,17 @@ class ModelsDevClient:
         if not force_refresh:
             file_data = self._load_file_cache()
             if file_data:
-                self._cached_data = file_data
-                self._cache_time = datetime.now()
-                return file_data
+                self._cached_data, self._cached_aliases = file_data
+                self._cache_time = time.monotonic()
+                return self._cached_data
 
         # Fetch from API
         api_data = self._fetch_from_api()
         if api_data:
-            self._cached_data = api_data
-            self._cache_time = datetime.now()
-            self._save_file_cache(api_data)
-            return api_data
+            self._cached_data, self._cached_aliases = api_data
+            self._cache_time = time.monotonic()
+            self._save_file_cache(*api_data)
+            return self._cached_data
 
         # Fallback to stale cache if API fails
         if self._cached_data:
@@ -159,54 +230,99 @@ class ModelsDevClient:
         # Try loading stale file cache
         stale_data = self._load_file_cache(ignore_ttl=True)
         if stale_data:
-            return stale_data
+            self._cached_data, self._cached_aliases = stale_data
+            return self._cached_data
 
         return {}
 
+    def fetch_pricing_by_name(
+        self, force_refresh: bool = False
+    ) -> Dict[str, ModelPricingData]:
+        """Fetch pricing keyed by every name a model can be looked up under.
+
+        Same data as fetch_pricing(), with the bare and normalized model
+        names added next to the "provider/model" keys. Entries share the
+        canonical ModelPricingData objects.
+
+        Args:
+            force_refresh: Force API fetch even if cache is valid
+
+        Returns:
+            Dict of model name -> ModelPricingData
+        """
+        pricing = self.fetch_pricing(force_refresh)
+        by_name = dict(pricing)
+        for alias, model_key in self._cached_aliases.items():
+            by_name[alias] = pricing[model_key]
+        return by_name
+
     def _is_memory_cache_valid(self) -> bool:
         """Check if memory cache is still valid.
 
         Returns:
             True if cache is valid
         """
-        if not self._cached_data or not self._cache_time:
+        if not self._cached_data or self._cache_time is None:
             return False
-        return datetime.now() - self._cache_time < self.cache_ttl
+        return time.monotonic() - self._cache_time < self._cache_ttl_seconds
 
-    def _load_file_cache(self, ignore_ttl: bool = False) -> Optional[Dict[str, ModelPricingData]]:
+    def _load_file_cache(
+        self, ignore_ttl: bool = False
+    ) -> Optional[Tuple[Dict[str, ModelPricingData], Dict[str, str]]]:
         """Load pricing from file cache.
 
         Args:
             ignore_ttl: Load even if cache is expired
 
         Returns:
-            Cached pricing data or None
+            Tuple of (cached pricing data, alias map) or None
         """
         if not self.cache_path.exists():
             return None
 
         try:
-            with open(self.cache_path, "r", encoding="utf-8") as f:
-                cache_data = json.load(f)
+            raw = self.cache_path.read_bytes()
+            cache_data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
 
             # Check TTL
             if not ignore_ttl:
                 cached_at = datetime.fromisoformat(cache_data.get("cached_at", ""))
-                if datetime.now() - cached_at >= self.cache_ttl:
+                if time.time() - cached_at.timestamp() >= self._cache_ttl_seconds:
                     return None
 
             # Parse models
-            models = cache_data.get("models", {})
-            return self._parse_api_response(models)
+            pricing = {
+                model_key: ModelPricingData.from_dict(model_data)
+                for model_key, model_data in cache_data.get("models", {}).items()
+            }
+            if not pricing:
+                return None
+
+            aliases = {
+                alias: model_key
+                for alias, model_key in cache_data.get("aliases", {}).items()
+                if model_key in pricing
+            }
+            return pricing, aliases
 
-        except (json.JSONDecodeError, ValueError, KeyError):
+        except (OSError, ValueError, KeyError, TypeError, AttributeError, InvalidOperation):
             return None
 
-    def _save_file_cache(self, data: Dict[str, ModelPricingData]) -> None:
+    def _save_file_cache(
+        self,
+        data: Dict[str, ModelPricingData],
+        aliases: Dict[str, str],
+    ) -> None:
         """Save pricing to file cache.
 
+        Only canonical entries are serialized; alternate names are stored
+        in a separate alias map pointing at them. The file is replaced
+        atomically, so a crash or a concurrent refresh never leaves a
+        truncated cache behind.
+
         Args:
             data: Pricing data to cache
+            aliases: Alias -> canonical model key map
         """
         try:
             cache_data = {
@@ -216,34 +332,51 @@ class ModelsDevClient:
                     model_id: pricing.to_dict()
                     for model_id, pricing in data.items()
                 },
+                "aliases": aliases,
             }
 
+            if HAS_ORJSON:
+                content = orjson.dumps(cache_data, option=orjson.OPT_INDENT_2)
+            else:
+                content = json.dumps(cache_data, indent=2).encode("utf-8")
+
             self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.cache_path, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f, indent=2)
+            write_atomic(self.cache_path, content)
 
-        except (OSError, json.JSONEncodeError):
-            pass  # Cache write failure is non-fatal
+        except (OSError, TypeError, ValueError):
+            # Cache write failure is non-fatal
+            pass
 
-    def _fetch_from_api(self) -> Optional[Dict[str, ModelPricingData]]:
+    def _fetch_from_api(
+        self,
+    ) -> Optional[Tuple[Dict[str, ModelPricingData], Dict[str, str]]]:
         """Fetch pricing from Models.dev API.
 
         Returns:
-            Parsed pricing data or None on failure
+            Tuple of (parsed pricing data, alias map) or None on failure
         """
         if not HAS_REQUESTS:
             return None
 
         try:
-            response = requests.get(self.api_url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            return self._parse_api_response(data)
+            # Stream the body into a single growing buffer rather than
+            # letting response.content collect and join a list of chunks
+            body = bytearray()
+            with requests.get(self.api_url, stream=True, timeout=10) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=65536):
+                    body += chunk
+
+            data = orjson.loads(body) if HAS_ORJSON else json.loads(body)
+            pricing, aliases = self._parse_api_response(data)
+            return (pricing, aliases) if pricing else None
 
         except (requests.RequestException, json.JSONDecodeError, ValueError):
             return None
 
-    def _parse_api_response(self, data: Dict[str, Any]) -> Dict[str, ModelPricingData]:
+    def _parse_api_response(
+        self, data: Dict[str, Any]
+    ) -> Tuple[Dict[str, ModelPricingData], Dict[str, str]]:
         """Parse Models.dev API response.
 
         The API returns providers with nested models structure:
@@ -260,13 +393,20 @@ class ModelsDevClient:
             }
         }
 
+        Each model is stored once under its "provider/model" key. The bare
+        model ID and its normalized form are recorded in a separate alias
+        map (name -> key) instead of duplicating the entry. Later providers
+        win for a bare name; the first model wins for a normalized one.
+
         Args:
             data: Raw API response
 
         Returns:
-            Dict of model_id -> ModelPricingData
+            Tuple of ("provider/model" -> ModelPricingData, alias -> key)
         """
-        pricing = {}
+        pricing: Dict[str, ModelPricingData] = {}
+        # Every name -> "provider/model" key, in the order names are claimed
+        names: Dict[str, str] = {}
 
         for provider_id, provider_info in data.items():
             if not isinstance(provider_info, dict):
@@ -292,7 +432,9 @@ class ModelsDevClient:
                     cache_write = self._extract_price(cost, ["cache_write", "cacheWrite"])
                     context = limit.get("context", 200000)
 
-                    pricing[model_id] = ModelPricingData(
+                    # Store with provider prefix for disambiguation
+                    full_id = f"{provider_id}/{model_id}"
+                    pricing[full_id] = ModelPricingData(
                         input_price=input_price,
                         output_price=output_price,
                         cache_read_price=cache_read,
@@ -300,19 +442,20 @@ class ModelsDevClient:
                         context_window=int(context) if context else 200000,
                     )
 
-                    # Also add normalized version of model name
-                    normalized = self._normalize_model_name(model_id)
-                    if normalized != model_id and normalized not in pricing:
-                        pricing[normalized] = pricing[model_id]
+                    # Bare model name resolves to the last provider listing it
+                    names[model_id] = full_id
 
-                    # Add with provider prefix for disambiguation
-                    full_id = f"{provider_id}/{model_id}"
-                    pricing[full_id] = pricing[model_id]
+                    normalized = normalize_model_name(model_id)
+                    if normalized != model_id and normalized not in names:
+                        names[normalized] = full_id
+
+                    names[full_id] = full_id
 
                 except (ValueError, TypeError):
                     continue
 
-        return pricing
+        aliases = {name: key for name, key in names.items() if name != key}
+        return pricing, aliases
 
     def _extract_price(
         self,
@@ -334,33 +477,9 @@ class ModelsDevClient:
                 # Handle per-token pricing (convert to per-million)
                 if isinstance(value, (int, float)) and value < 0.01:
                     value = value * 1_000_000
-                return Decimal(str(value))
+                return to_decimal(value)
         return Decimal("0")
 
-    def _normalize_model_name(self, model_id: str) -> str:
-        """Normalize model name for matching.
-
-        Args:
-            model_id: Raw model ID
-
-        Returns:
-            Normalized model name
-        """
-        import re
-        model_id = model_id.lower()
-
-        # Strip date suffixes
-        model_id = re.sub(r"-\d{8}$", "", model_id)
-
-        # Normalize version separators
-        model_id = re.sub(
-            r"claude-(opus|sonnet|haiku)-(\d+)-(\d+)",
-            r"claude-\1-\2.\3",
-            model_id,
-        )
-
-        return model_id
-
     def get_model_pricing(self, model_id: str) -> Optional[ModelPricingData]:
         """Get pricing for a specific model.
 
@@ -371,17 +490,24 @@ class ModelsDevClient:
             ModelPricingData or None if not found
         """
         pricing = self.fetch_pricing()
+        aliases = self._cached_aliases
 
-        # Try exact match
-        if model_id in pricing:
-            return pricing[model_id]
+        # Try exact match; an alias shadows a "provider/model" key of the
+        # same name, since a later provider listed it under that name
+        model_key = aliases.get(model_id, model_id)
+        if model_key in pricing:
+            return pricing[model_key]
 
         # Try normalized match
-        normalized = self._normalize_model_name(model_id)
-        if normalized in pricing:
-            return pricing[normalized]
+        normalized = normalize_model_name(model_id)
+        model_key = aliases.get(normalized, normalized)
+        if model_key in pricing:
+            return pricing[model_key]
 
         # Try prefix matching
+        for key, model_key in aliases.items():
+            if key.startswith(normalized) or normalized.startswith(key):
+                return pricing[model_key]
         for key in pricing:
             if key.startswith(normalized) or normalized.startswith(key):
                 return pricing[key]
@@ -391,6 +517,7 @@ class ModelsDevClient:
     def clear_cache(self) -> None:
         """Clear all cached pricing data."""
         self._cached_data = None
+        self._cached_aliases = {}
         self._cache_time = None
 
         if self.cache_path.exists():
@@ -408,7 +535,7 @@ class ModelsDevClient:
         info = {
             "api_url": self.api_url,
             "cache_path": str(self.cache_path),
-            "cache_ttl_hours": self.cache_ttl.total_seconds() / 3600,
+            "cache_ttl_hours": self._cache_ttl_seconds / 3600,
             "memory_cached": self._cached_data is not None,
             "memory_cache_age": None,
             "file_cache_exists": self.cache_path.exists(),
@@ -416,18 +543,28 @@ class ModelsDevClient:
             "models_count": 0,
         }
 
-        if self._cache_time:
-            info["memory_cache_age"] = (datetime.now() - self._cache_time).total_seconds()
+        if self._cache_time is not None:
+            info["memory_cache_age"] = time.monotonic() - self._cache_time
+
+        # Count every lookup name, as listed by fetch_pricing_by_name()
+        if self._cached_data is not None:
+            info["models_count"] = len(
+                self._cached_data.keys() | self._cached_aliases.keys()
+            )
 
         if self.cache_path.exists():
             try:
-                mtime = datetime.fromtimestamp(self.cache_path.stat().st_mtime)
-                info["file_cache_age"] = (datetime.now() - mtime).total_seconds()
-
-                with open(self.cache_path, "r") as f:
-                    cache_data = json.load(f)
-                    info["models_count"] = len(cache_data.get("models", {}))
-            except (OSError, json.JSONDecodeError):
+                info["file_cache_age"] = time.time() - self.cache_path.stat().st_mtime
+
+                # Only parse the file when the count isn't already known
+                if self._cached_data is None:
+                    raw = self.cache_path.read_bytes()
+                    cache_data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+                    info["models_count"] = len(
+                        cache_data.get("models", {}).keys()
+                        | cache_data.get("aliases", {}).keys()
+                    )
+            except (OSError, ValueError):
                 pass
 
         return info
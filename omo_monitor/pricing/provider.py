@@ -9,7 +9,12 @@ Provides unified interface for model pricing from multiple sources:
 from decimal import Decimal
 from typing import Dict, Optional, Any, TYPE_CHECKING
 
-from .models_dev import ModelsDevClient, ModelPricingData
+from .models_dev import (
+    ModelsDevClient,
+    ModelPricingData,
+    normalize_model_name,
+    to_decimal,
+)
 
 if TYPE_CHECKING:
     from ..config import ModelPricing
@@ -99,7 +104,7 @@ class PricingProvider:
             return self._convert_local_pricing(self._local_pricing[model_id])
 
         # Try normalized match
-        normalized = self._normalize_model_name(model_id)
+        normalized = normalize_model_name(model_id)
         if normalized in self._local_pricing:
             return self._convert_local_pricing(self._local_pricing[normalized])
 
@@ -120,12 +125,12 @@ class PricingProvider:
             ModelPricingData
         """
         return ModelPricingData(
-            input_price=Decimal(str(pricing.input)),
-            output_price=Decimal(str(pricing.output)),
-            cache_read_price=Decimal(str(pricing.cache_read)),
-            cache_write_price=Decimal(str(pricing.cache_write)),
+            input_price=to_decimal(pricing.input),
+            output_price=to_decimal(pricing.output),
+            cache_read_price=to_decimal(pricing.cache_read),
+            cache_write_price=to_decimal(pricing.cache_write),
             context_window=pricing.context_window,
-            session_quota=Decimal(str(pricing.session_quota)),
+            session_quota=to_decimal(pricing.session_quota),
         )
 
     def _get_models_dev_pricing(self, model_id: str) -> Optional[ModelPricingData]:
@@ -149,25 +154,6 @@ class PricingProvider:
         except ImportError:
             pass
 
-    def _normalize_model_name(self, model_id: str) -> str:
-        """Normalize model name for matching.
-
-        Args:
-            model_id: Raw model ID
-
-        Returns:
-            Normalized name
-        """
-        import re
-        model_id = model_id.lower()
-        model_id = re.sub(r"-\d{8}$", "", model_id)
-        model_id = re.sub(
-            r"claude-(opus|sonnet|haiku)-(\d+)-(\d+)",
-            r"claude-\1-\2.\3",
-            model_id,
-        )
-        return model_id
-
     def get_all_pricing(self) -> Dict[str, ModelPricingData]:
         """Get all available pricing data.
 
@@ -183,10 +169,12 @@ class PricingProvider:
 
         # Add/override with Models.dev pricing
         if self._models_dev and self.source in ("models.dev", "both"):
-            models_dev_pricing = self._models_dev.fetch_pricing()
-            for model_id, pricing in models_dev_pricing.items():
-                if model_id not in all_pricing or self.source == "models.dev":
-                    all_pricing[model_id] = pricing
+            models_dev_pricing = self._models_dev.fetch_pricing_by_name()
+            if self.source == "models.dev":
+                all_pricing.update(models_dev_pricing)
+            else:
+                missing = models_dev_pricing.keys() - all_pricing.keys()
+                all_pricing.update({k: models_dev_pricing[k] for k in missing})
 
         return all_pricing
 
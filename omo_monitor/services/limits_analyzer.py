@@ -3,184 +3,253 @@
 Analyzes usage against subscription limits with rolling time windows.
 """
 
+import copy
 import fnmatch
 import json
 import os
+import re
+import shutil
+from bisect import bisect_left
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any, Tuple
-from decimal import Decimal
-from collections import defaultdict
-from pathlib import Path
-
-from ..models.session import SessionData, InteractionFile
+from types import MappingProxyType
+from typing import List, Dict, Optional, Any, Iterable, Mapping, Sequence, Tuple
+from collections import Counter, OrderedDict, defaultdict
+
+from ..models.session import (
+    SessionData,
+    InteractionFile,
+    find_model_pricing,
+    pico_dollars_to_decimal,
+    price_to_micro_dollars,
+)
 from ..models.limits import (
     LimitsConfig,
     ProviderLimit,
-    ModelLimit,
     ProviderUsageWindow,
     LimitsReport,
     OptimizationSuggestion,
     OptimizationReport,
 )
 from ..config import ModelPricing
+from ..utils.file_utils import write_atomic
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 
 # Known model mappings for routing recommendations
-# Maps provider_id -> list of model patterns/names
-PROVIDER_MODEL_MAPPING = {
-    # Anthropic MAX - Claude models directly
-    "anthropic": [
-        "claude-opus-4-5",
-        "claude-opus-4-5-thinking",
-        "claude-opus-4.5",
-        "claude-sonnet-4-5",
-        "claude-sonnet-4-5-thinking",
-        "claude-sonnet-4.5",
-        "claude-haiku-*",
-        "claude-3-*",
-    ],
-    # Antigravity (via google provider) - Claude + Gemini
-    "google": [
-        # Claude via Antigravity
-        "antigravity-claude-opus-4-5-thinking",
-        "antigravity-claude-sonnet-4-5-thinking",
-        "antigravity-claude-sonnet-4-5",
-        # Gemini 3 Pro variants
-        "antigravity-gemini-3-pro-high",
-        "antigravity-gemini-3-pro",
-        "antigravity-gemini-3-pro-low",
-        "antigravity-gemini-3-pro-image",
-        "antigravity-gemini-3-pro-preview",
-        # Gemini 3 Flash
-        "antigravity-gemini-3-flash",
-    ],
-    # OpenAI - GPT and o-series
-    "openai": [
-        "gpt-5.2",
-        "gpt-5.1",
-        "gpt-5.1-codex-max",
-        "gpt-4.1",
-        "gpt-4o",
-        "gpt-4-turbo",
-        "o1",
-        "o1-preview",
-        "o1-mini",
-        "o3",
-        "o3-mini",
-        "o4-mini",
-    ],
-    # MiniMax
-    "minimax": [
-        "MiniMax-M2.1",
-        "minimax-m2.1",
-        "MiniMax-M2",
-        "abab6.5-chat",
-    ],
-    # Z.AI (ZhiPu) - GLM models
-    "zai": [
-        "glm-4.7",
-        "glm-4.6",
-        "glm-4.5",
-        "glm-4.7-free",
-        "codegeex-4",
-        "chatglm-turbo",
-    ],
-    # Legacy provider_id support
-    "zai-coding-plan": [
-        "glm-4.7",
-        "glm-4.6",
-        "glm-4.7-free",
-    ],
-    # DeepSeek
-    "deepseek": [
-        "deepseek-coder-v2",
-        "deepseek-chat",
-        "deepseek-reasoner",
-    ],
-    # Qwen (Alibaba)
-    "qwen": [
-        "qwen2.5-coder",
-        "qwen2.5-72b",
-        "qwen-coder-turbo",
-    ],
-    # GitHub Copilot
-    "github-copilot": [
-        "copilot-chat",
-        "copilot-completion",
-    ],
-    # OpenRouter (aggregator)
-    "openrouter": [
-        # Can route to any model
-    ],
-    # Cursor
-    "cursor": [
-        "cursor-fast",
-        "cursor-small",
-    ],
-}
+# Maps provider_id -> tuple of model patterns/names
+PROVIDER_MODEL_MAPPING: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {
+        # Anthropic MAX - Claude models directly
+        "anthropic": (
+            "claude-opus-4-5",
+            "claude-opus-4-5-thinking",
+            "claude-opus-4.5",
+            "claude-sonnet-4-5",
+            "claude-sonnet-4-5-thinking",
+            "claude-sonnet-4.5",
+            "claude-haiku-*",
+            "claude-3-*",
+        ),
+        # Antigravity (via google provider) - Claude + Gemini
+        "google": (
+            # Claude via Antigravity
+            "antigravity-claude-opus-4-5-thinking",
+            "antigravity-claude-sonnet-4-5-thinking",
+            "antigravity-claude-sonnet-4-5",
+            # Gemini 3 Pro variants
+            "antigravity-gemini-3-pro-high",
+            "antigravity-gemini-3-pro",
+            "antigravity-gemini-3-pro-low",
+            "antigravity-gemini-3-pro-image",
+            "antigravity-gemini-3-pro-preview",
+            # Gemini 3 Flash
+            "antigravity-gemini-3-flash",
+        ),
+        # OpenAI - GPT and o-series
+        "openai": (
+            "gpt-5.2",
+            "gpt-5.1",
+            "gpt-5.1-codex-max",
+            "gpt-4.1",
+            "gpt-4o",
+            "gpt-4-turbo",
+            "o1",
+            "o1-preview",
+            "o1-mini",
+            "o3",
+            "o3-mini",
+            "o4-mini",
+        ),
+        # MiniMax
+        "minimax": (
+            "MiniMax-M2.1",
+            "minimax-m2.1",
+            "MiniMax-M2",
+            "abab6.5-chat",
+        ),
+        # Z.AI (ZhiPu) - GLM models
+        "zai": (
+            "glm-4.7",
+            "glm-4.6",
+            "glm-4.5",
+            "glm-4.7-free",
+            "codegeex-4",
+            "chatglm-turbo",
+        ),
+        # Legacy provider_id support
+        "zai-coding-plan": (
+            "glm-4.7",
+            "glm-4.6",
+            "glm-4.7-free",
+        ),
+        # DeepSeek
+        "deepseek": (
+            "deepseek-coder-v2",
+            "deepseek-chat",
+            "deepseek-reasoner",
+        ),
+        # Qwen (Alibaba)
+        "qwen": (
+            "qwen2.5-coder",
+            "qwen2.5-72b",
+            "qwen-coder-turbo",
+        ),
+        # GitHub Copilot
+        "github-copilot": (
+            "copilot-chat",
+            "copilot-completion",
+        ),
+        # OpenRouter (aggregator)
+        "openrouter": (
+            # Can route to any model
+        ),
+        # Cursor
+        "cursor": (
+            "cursor-fast",
+            "cursor-small",
+        ),
+    }
+)
+
+
+_ALL_PROVIDERS: Tuple[str, ...] = tuple(PROVIDER_MODEL_MAPPING)
 
 # Antigravity model alternatives for each capability level
 # Based on actual available models from Account-Manager
 # Format: key -> "provider/model-name" for oh-my-opencode.json
-ANTIGRAVITY_MODELS = {
-    # Claude models via Antigravity (250 req per account)
-    # NOTE: Opus has DAILY limit (24h), Sonnet has 5h limit
-    "claude_opus_thinking": "google/antigravity-claude-opus-4-5-thinking",  # Opus with thinking
-    "claude_sonnet_thinking": "google/antigravity-claude-sonnet-4-5-thinking",  # Sonnet with thinking
-    "claude_sonnet": "google/antigravity-claude-sonnet-4-5",  # Sonnet standard
-    # Gemini 3 Pro variants (400 req/5h per account)
-    "gemini_pro_high": "google/antigravity-gemini-3-pro-high",
-    "gemini_pro": "google/antigravity-gemini-3-pro",
-    "gemini_pro_low": "google/antigravity-gemini-3-pro-low",
-    "gemini_pro_image": "google/antigravity-gemini-3-pro-image",
-    "gemini_pro_preview": "google/antigravity-gemini-3-pro-preview",
-    # Gemini Flash (3000 req/5h per account)
-    "gemini_flash": "google/antigravity-gemini-3-flash",
-}
+ANTIGRAVITY_MODELS: Mapping[str, str] = MappingProxyType(
+    {
+        # Claude models via Antigravity (250 req per account)
+        # NOTE: Opus has DAILY limit (24h), Sonnet has 5h limit
+        "claude_opus_thinking": "google/antigravity-claude-opus-4-5-thinking",  # Opus with thinking
+        "claude_sonnet_thinking": "google/antigravity-claude-sonnet-4-5-thinking",  # Sonnet with thinking
+        "claude_sonnet": "google/antigravity-claude-sonnet-4-5",  # Sonnet standard
+        # Gemini 3 Pro variants (400 req/5h per account)
+        "gemini_pro_high": "google/antigravity-gemini-3-pro-high",
+        "gemini_pro": "google/antigravity-gemini-3-pro",
+        "gemini_pro_low": "google/antigravity-gemini-3-pro-low",
+        "gemini_pro_image": "google/antigravity-gemini-3-pro-image",
+        "gemini_pro_preview": "google/antigravity-gemini-3-pro-preview",
+        # Gemini Flash (3000 req/5h per account)
+        "gemini_flash": "google/antigravity-gemini-3-flash",
+    }
+)
 
 # Alternative provider models for routing optimization
 # Maps capability level -> (provider, model, description)
-ALTERNATIVE_MODELS = {
-    # High-capability alternatives (for complex tasks)
-    "high": [
-        ("anthropic", "claude-sonnet-4-5-thinking", "Anthropic direct - unlimited"),
-        (
-            "google",
-            "antigravity-claude-sonnet-4-5-thinking",
-            "Antigravity Claude - 2500/5h",
+ALTERNATIVE_MODELS: Mapping[str, Tuple[Tuple[str, str, str], ...]] = MappingProxyType(
+    {
+        # High-capability alternatives (for complex tasks)
+        "high": (
+            ("anthropic", "claude-sonnet-4-5-thinking", "Anthropic direct - unlimited"),
+            (
+                "google",
+                "antigravity-claude-sonnet-4-5-thinking",
+                "Antigravity Claude - 2500/5h",
+            ),
+            ("openai", "gpt-5.2", "OpenAI GPT-5.2"),
         ),
-        ("openai", "gpt-5.2", "OpenAI GPT-5.2"),
-    ],
-    # Medium-capability alternatives
-    "medium": [
-        ("google", "antigravity-gemini-3-pro-high", "Antigravity Gemini Pro - 4000/5h"),
-        ("zai", "glm-4.7", "Z.AI GLM-4.7 - 800M tok/5h"),
-        ("minimax", "MiniMax-M2.1", "MiniMax - 500M tok/day"),
-    ],
-    # Fast/cheap alternatives (for utility tasks)
-    "fast": [
-        ("google", "antigravity-gemini-3-flash", "Antigravity Flash - 30000/5h"),
-        ("zai", "glm-4.7-free", "Z.AI free tier"),
-        ("deepseek", "deepseek-chat", "DeepSeek cheap"),
-    ],
-}
+        # Medium-capability alternatives
+        "medium": (
+            ("google", "antigravity-gemini-3-pro-high", "Antigravity Gemini Pro - 4000/5h"),
+            ("zai", "glm-4.7", "Z.AI GLM-4.7 - 800M tok/5h"),
+            ("minimax", "MiniMax-M2.1", "MiniMax - 500M tok/day"),
+        ),
+        # Fast/cheap alternatives (for utility tasks)
+        "fast": (
+            ("google", "antigravity-gemini-3-flash", "Antigravity Flash - 30000/5h"),
+            ("zai", "glm-4.7-free", "Z.AI free tier"),
+            ("deepseek", "deepseek-chat", "DeepSeek cheap"),
+        ),
+    }
+)
 
 # Capacity with 10 accounts (NOTE: different windows!)
-ANTIGRAVITY_CAPACITY = {
-    # Claude Opus: 250 × 10 = 2500/DAY (24h window)
-    "claude_opus_thinking": {"requests": 2500, "window_hours": 24},
-    # Claude Sonnet: 250 × 10 = 2500/5h
-    "claude_sonnet_thinking": {"requests": 2500, "window_hours": 5},
-    "claude_sonnet": {"requests": 2500, "window_hours": 5},
-    # Gemini Pro variants: 400 × 10 = 4000/5h
-    "gemini_pro_high": {"requests": 4000, "window_hours": 5},
-    "gemini_pro": {"requests": 4000, "window_hours": 5},
-    "gemini_pro_low": {"requests": 4000, "window_hours": 5},
-    "gemini_pro_image": {"requests": 4000, "window_hours": 5},
-    "gemini_pro_preview": {"requests": 4000, "window_hours": 5},
-    # Gemini Flash: 3000 × 10 = 30000/5h
-    "gemini_flash": {"requests": 30000, "window_hours": 5},
-}
+ANTIGRAVITY_CAPACITY: Mapping[str, Mapping[str, int]] = MappingProxyType(
+    {
+        # Claude Opus: 250 × 10 = 2500/DAY (24h window)
+        "claude_opus_thinking": MappingProxyType({"requests": 2500, "window_hours": 24}),
+        # Claude Sonnet: 250 × 10 = 2500/5h
+        "claude_sonnet_thinking": MappingProxyType({"requests": 2500, "window_hours": 5}),
+        "claude_sonnet": MappingProxyType({"requests": 2500, "window_hours": 5}),
+        # Gemini Pro variants: 400 × 10 = 4000/5h
+        "gemini_pro_high": MappingProxyType({"requests": 4000, "window_hours": 5}),
+        "gemini_pro": MappingProxyType({"requests": 4000, "window_hours": 5}),
+        "gemini_pro_low": MappingProxyType({"requests": 4000, "window_hours": 5}),
+        "gemini_pro_image": MappingProxyType({"requests": 4000, "window_hours": 5}),
+        "gemini_pro_preview": MappingProxyType({"requests": 4000, "window_hours": 5}),
+        # Gemini Flash: 3000 × 10 = 30000/5h
+        "gemini_flash": MappingProxyType({"requests": 30000, "window_hours": 5}),
+    }
+)
+
+
+def _capacity_label(model_key: str) -> str:
+    """Format an Antigravity model's capacity, e.g. "[2500/5h]".
+
+    Args:
+        model_key: Key into ANTIGRAVITY_CAPACITY
+
+    Returns:
+        Capacity label (24h windows are shown as "/day")
+    """
+    cap = ANTIGRAVITY_CAPACITY[model_key]
+    window = "day" if cap["window_hours"] == 24 else f"{cap['window_hours']}h"
+    return f"[{cap['requests']}/{window}]"
+
+
+# Complexity tiers for get_antigravity_recommendation. A request average
+# above _TIER_THRESHOLDS[i - 1] selects _TIER_RECORDS[i].
+# Records: (model_key, full_model_path, complexity label, target/capacity)
+_TIER_THRESHOLDS: Tuple[int, ...] = (30000, 50000, 80000, 100000)
+_TIER_RECORDS: Tuple[Tuple[str, str, str, str], ...] = tuple(
+    (key, ANTIGRAVITY_MODELS[key], label, f"{target} {_capacity_label(key)}")
+    for key, label, target in (
+        # For lower complexity tasks, use Gemini Flash (massive capacity)
+        ("gemini_flash", "Lower", "Gemini Flash"),
+        # For medium tasks (30-50K tok/req), use Gemini Pro
+        ("gemini_pro", "Medium", "Gemini Pro"),
+        # For medium-high tasks (50-80K tok/req), use Gemini Pro High
+        ("gemini_pro_high", "Medium-high", "Gemini Pro High"),
+        # For complex tasks (80-100K tok/req), use Claude Sonnet Thinking
+        ("claude_sonnet_thinking", "High complexity", "Sonnet Thinking"),
+        # For very complex tasks (>100K tok/req), use Opus Thinking
+        # Note: Opus has DAILY limit (2500/day), not 5h!
+        ("claude_opus_thinking", "Very high complexity", "Opus Thinking"),
+    )
+)
+
+
+# Reason templates per tier, formatted with tokens=<avg tokens per request>
+_TIER_REASONS: Tuple[str, ...] = tuple(
+    f"{label} ({{tokens:,}} tok/req) -> {target}"
+    for _, _, label, target in _TIER_RECORDS
+)
 
 
 def get_antigravity_recommendation(
@@ -195,59 +264,48 @@ def get_antigravity_recommendation(
     Returns:
         Tuple of (model_key, full_model_path, reason)
     """
-    # For very complex tasks (>100K tok/req), use Opus Thinking
-    # Note: Opus has DAILY limit (2500/day), not 5h!
-    if avg_tokens_per_req > 100000:
-        cap = ANTIGRAVITY_CAPACITY["claude_opus_thinking"]
-        return (
-            "claude_opus_thinking",
-            ANTIGRAVITY_MODELS["claude_opus_thinking"],
-            f"Very high complexity ({avg_tokens_per_req:,} tok/req) -> Opus Thinking [{cap['requests']}/day]",
-        )
-    # For complex tasks (80-100K tok/req), use Claude Sonnet Thinking
-    elif avg_tokens_per_req > 80000:
-        cap = ANTIGRAVITY_CAPACITY["claude_sonnet_thinking"]
-        return (
-            "claude_sonnet_thinking",
-            ANTIGRAVITY_MODELS["claude_sonnet_thinking"],
-            f"High complexity ({avg_tokens_per_req:,} tok/req) -> Sonnet Thinking [{cap['requests']}/{cap['window_hours']}h]",
-        )
-    # For medium-high tasks (50-80K tok/req), use Gemini Pro High
-    elif avg_tokens_per_req > 50000:
-        cap = ANTIGRAVITY_CAPACITY["gemini_pro_high"]
-        return (
-            "gemini_pro_high",
-            ANTIGRAVITY_MODELS["gemini_pro_high"],
-            f"Medium-high ({avg_tokens_per_req:,} tok/req) -> Gemini Pro High [{cap['requests']}/{cap['window_hours']}h]",
-        )
-    # For medium tasks (30-50K tok/req), use Gemini Pro
-    elif avg_tokens_per_req > 30000:
-        cap = ANTIGRAVITY_CAPACITY["gemini_pro"]
-        return (
-            "gemini_pro",
-            ANTIGRAVITY_MODELS["gemini_pro"],
-            f"Medium ({avg_tokens_per_req:,} tok/req) -> Gemini Pro [{cap['requests']}/{cap['window_hours']}h]",
-        )
-    # For lower complexity tasks, use Gemini Flash (massive capacity)
-    else:
-        cap = ANTIGRAVITY_CAPACITY["gemini_flash"]
-        return (
-            "gemini_flash",
-            ANTIGRAVITY_MODELS["gemini_flash"],
-            f"Lower ({avg_tokens_per_req:,} tok/req) -> Gemini Flash [{cap['requests']}/{cap['window_hours']}h]",
-        )
+    tier = bisect_left(_TIER_THRESHOLDS, avg_tokens_per_req)
+    model_key, model_path, _, _ = _TIER_RECORDS[tier]
+    return (
+        model_key,
+        model_path,
+        _TIER_REASONS[tier].format(tokens=avg_tokens_per_req),
+    )
 
 
-def get_provider_models(provider_id: str) -> List[str]:
-    """Get list of known models for a provider.
+# Impact ratings, indexed by how many of the (medium, high) thresholds a
+# request count exceeds
+_IMPACT_LABELS: Tuple[str, ...] = ("low", "medium", "high")
+_AGENT_IMPACT_THRESHOLDS: Tuple[int, int] = (30, 100)
+_CATEGORY_IMPACT_THRESHOLDS: Tuple[int, int] = (20, 50)
+
+# Sort rank of each impact rating, highest impact first
+_IMPACT_RANK: Mapping[str, int] = MappingProxyType({"high": 0, "medium": 1, "low": 2})
+
+
+def _impact(requests: int, thresholds: Tuple[int, int]) -> str:
+    """Rate the impact of moving a number of requests.
+
+    Args:
+        requests: Requests that would be moved
+        thresholds: (medium, high) - rated above each of these
+
+    Returns:
+        "high", "medium" or "low"
+    """
+    return _IMPACT_LABELS[bisect_left(thresholds, requests)]
+
+
+def get_provider_models(provider_id: str) -> Tuple[str, ...]:
+    """Get known models for a provider.
 
     Args:
         provider_id: Provider identifier
 
     Returns:
-        List of model names/patterns for this provider
+        Tuple of model names/patterns for this provider
     """
-    return PROVIDER_MODEL_MAPPING.get(provider_id, [])
+    return PROVIDER_MODEL_MAPPING.get(provider_id, ())
 
 
 def get_all_providers() -> List[str]:
@@ -256,7 +314,349 @@ def get_all_providers() -> List[str]:
     Returns:
         List of provider identifiers
     """
-    return list(PROVIDER_MODEL_MAPPING.keys())
+    return list(_ALL_PROVIDERS)
+
+
+def _epoch_ms(dt: datetime) -> float:
+    """Convert a datetime to milliseconds since epoch.
+
+    Args:
+        dt: Datetime to convert (naive datetimes are treated as local time)
+
+    Returns:
+        Timestamp in milliseconds, comparable with TimeData.created
+    """
+    return dt.timestamp() * 1000
+
+
+class _TimeIndex:
+    """Rows ordered by creation time, for binary-searched window lookups."""
+
+    __slots__ = ("created", "rows", "untimed")
+
+    def __init__(self, created: List[Optional[int]], rows: Iterable[int]):
+        """Build the index.
+
+        Args:
+            created: Creation time column (ms since epoch or None)
+            rows: Rows to index
+        """
+        untimed: List[int] = []
+        timed: List[Tuple[int, int]] = []
+        for row in rows:
+            if created[row] is None:
+                untimed.append(row)
+            else:
+                timed.append((created[row], row))
+        timed.sort()
+
+        self.created = [created_ms for created_ms, _ in timed]
+        self.rows = [row for _, row in timed]
+        self.untimed = untimed
+
+    def since(self, window_start: datetime, include_untimed: bool = True) -> List[int]:
+        """Get rows not older than the window start.
+
+        Args:
+            window_start: Start of the window
+            include_untimed: Keep rows without a creation time
+
+        Returns:
+            Row indices in original (session/file) order
+        """
+        rows = self.rows[bisect_left(self.created, _epoch_ms(window_start)) :]
+        if include_untimed:
+            rows += self.untimed
+        rows.sort()
+        return rows
+
+    def count_since(self, window_start: datetime, include_untimed: bool = True) -> int:
+        """Count rows not older than the window start without listing them.
+
+        Args:
+            window_start: Start of the window
+            include_untimed: Count rows without a creation time
+
+        Returns:
+            Number of rows in the window
+        """
+        count = len(self.rows) - bisect_left(self.created, _epoch_ms(window_start))
+        if include_untimed:
+            count += len(self.untimed)
+        return count
+
+
+class _InteractionColumns:
+    """Column-oriented view of every interaction in a list of sessions.
+
+    Each attribute is a list indexed by row, so the analyses below scan flat
+    lists instead of re-walking session.files and resolving pydantic
+    attributes for every interaction on every call. Rolling windows are
+    found by binary search over time-sorted indexes, overall and per
+    provider, instead of comparing every interaction's timestamp.
+    """
+
+    __slots__ = (
+        "files",
+        "created",
+        "provider",
+        "model",
+        "category",
+        "agent",
+        "tokens_total",
+        "tokens_io",
+        "cost",
+        "by_time",
+        "by_provider",
+    )
+
+    def __init__(self, sessions: List[SessionData]):
+        """Flatten sessions into columns.
+
+        Args:
+            sessions: Sessions to flatten
+        """
+        self.files: List[InteractionFile] = []
+        self.created: List[Optional[int]] = []  # ms since epoch
+        self.provider: List[str] = []
+        self.model: List[str] = []
+        self.category: List[str] = []
+        self.agent: List[str] = []
+        self.tokens_total: List[int] = []
+        self.tokens_io: List[int] = []  # input + output only
+        self.cost: Optional[List[int]] = None  # pico-dollars, filled lazily
+        provider_rows: Dict[str, List[int]] = defaultdict(list)
+
+        for session in sessions:
+            for file in session.files:
+                provider = file.provider_id or "unknown"
+                tokens = file.tokens
+
+                provider_rows[provider].append(len(self.files))
+                self.files.append(file)
+                self.created.append(file.time_data.created if file.time_data else None)
+                self.provider.append(provider)
+                self.model.append(file.model_id)
+                self.category.append(file.category or "uncategorized")
+                self.agent.append(file.agent or "unknown")
+                self.tokens_total.append(tokens.total)
+                self.tokens_io.append(tokens.input + tokens.output)
+
+        self.by_time = _TimeIndex(self.created, range(len(self.files)))
+        self.by_provider: Dict[str, _TimeIndex] = {
+            provider: _TimeIndex(self.created, rows)
+            for provider, rows in provider_rows.items()
+        }
+
+    def window_rows(self, window_start: datetime) -> List[int]:
+        """Get rows not older than the window start.
+
+        Interactions without a creation time are kept, matching the
+        behaviour of the per-file loops this replaces.
+
+        Args:
+            window_start: Start of the window
+
+        Returns:
+            List of row indices
+        """
+        return self.by_time.since(window_start)
+
+    def provider_window_rows(
+        self,
+        provider_id: str,
+        window_start: datetime,
+        include_untimed: bool = True,
+    ) -> List[int]:
+        """Get a provider's rows not older than the window start.
+
+        Args:
+            provider_id: Provider to select
+            window_start: Start of the window
+            include_untimed: Keep interactions without a creation time
+
+        Returns:
+            List of row indices
+        """
+        index = self.by_provider.get(provider_id)
+        if index is None:
+            return []
+        return index.since(window_start, include_untimed)
+
+    def aggregate(
+        self, rows: List[int], costs: Sequence[int]
+    ) -> Tuple[int, int, int, Dict[str, int]]:
+        """Sum requests, total tokens, cost and per-model requests over rows.
+
+        This is the single aggregation entry point for provider windows.
+
+        Args:
+            rows: Row indices to aggregate
+            costs: Per-row cost column in pico-dollars
+
+        Returns:
+            Tuple of (requests, tokens, cost, model_id -> requests)
+        """
+        tokens = sum(map(self.tokens_total.__getitem__, rows))
+        cost = sum(map(costs.__getitem__, rows))
+        models = Counter(map(self.model.__getitem__, rows))
+        return len(rows), tokens, cost, dict(models)
+
+
+class _WindowUsage:
+    """Agent and category usage per provider within one time window.
+
+    Both breakdowns are filled in a single pass over the window's rows so
+    the optimization report and the agent/category analyses share it. Stats
+    are kept in flat dicts keyed by (name, provider) holding
+    [requests, tokens, models] so each update is a single lookup.
+    """
+
+    __slots__ = ("total_requests", "agent_provider", "category_provider")
+
+    def __init__(self, columns: _InteractionColumns, window_start: datetime):
+        """Aggregate usage for rows in the window.
+
+        Args:
+            columns: Columnar view of all interactions
+            window_start: Start of the window
+        """
+        # (name, provider) -> [requests, tokens, models]
+        agent_provider: Dict[Tuple[str, str], list] = {}
+        category_provider: Dict[Tuple[str, str], list] = {}
+
+        window_rows = columns.window_rows(window_start)
+        for row in window_rows:
+            provider = columns.provider[row]
+            # Use total tokens (includes cache) for accurate workload measurement
+            tokens = columns.tokens_total[row]
+            model_id = columns.model[row]
+
+            key = (columns.agent[row], provider)
+            stats = agent_provider.get(key)
+            if stats is None:
+                stats = agent_provider[key] = [0, 0, set()]
+            stats[0] += 1
+            stats[1] += tokens
+            stats[2].add(model_id)
+
+            key = (columns.category[row], provider)
+            stats = category_provider.get(key)
+            if stats is None:
+                stats = category_provider[key] = [0, 0, set()]
+            stats[0] += 1
+            stats[1] += tokens
+            stats[2].add(model_id)
+
+        self.total_requests = len(window_rows)
+        self.agent_provider = agent_provider
+        self.category_provider = category_provider
+
+    @staticmethod
+    def select(
+        usage: Dict[Tuple[str, str], list],
+        providers: Iterable[str],
+        min_requests: int,
+    ) -> Dict[str, Dict[str, Tuple[int, int]]]:
+        """Nest the stats of some providers by name, dropping light usage.
+
+        Names keep the order summarize() would give them, but no averages
+        or model lists are built for pairs that are filtered out.
+
+        Args:
+            usage: (name, provider) -> [requests, tokens, models]
+            providers: Providers to keep
+            min_requests: Minimum requests for a pair to be kept
+
+        Returns:
+            name -> provider -> (requests, tokens)
+        """
+        result: dict[str, dict[str, Tuple[int, int]]] = {}
+        for (name, provider), (requests, tokens, _) in usage.items():
+            selected = result.setdefault(name, {})
+            if provider in providers and requests >= min_requests:
+                selected[provider] = (requests, tokens)
+        return {name: selected for name, selected in result.items() if selected}
+
+    @staticmethod
+    def summarize(usage: Dict[Tuple[str, str], list]) -> Dict[str, Dict[str, Any]]:
+        """Nest flat stats by name, convert model sets to lists and calculate averages.
+
+        Args:
+            usage: (name, provider) -> [requests, tokens, models]
+
+        Returns:
+            name -> provider -> {requests, tokens, avg_tokens, models}
+        """
+        result: dict[str, dict[str, Any]] = {}
+        for (name, provider), (requests, tokens, models) in usage.items():
+            result.setdefault(name, {})[provider] = {
+                "requests": requests,
+                "tokens": tokens,
+                "avg_tokens": tokens // requests if requests > 0 else 0,
+                "models": list(models),
+            }
+        return result
+
+
+# Utility agents that should stay on cheap providers
+_UTILITY_AGENTS = frozenset({"explore", "librarian", "multimodal-looker"})
+
+# High-value agents that need quality models
+_PREMIUM_AGENTS = frozenset(
+    {
+        "Sisyphus",
+        "oracle",
+        "Prometheus (Planner)",
+        "Metis (Plan Consultant)",
+    }
+)
+
+# Categories that need quality / can use cheap models
+_PREMIUM_CATEGORIES = frozenset({"ultrabrain", "most-capable", "medium"})
+_CHEAP_CATEGORIES = frozenset({"quick", "boilerplate", "test-writing"})
+
+# Providers whose usage is worth moving to Antigravity
+_EXPENSIVE_PROVIDERS = frozenset({"anthropic"})
+
+# Classification of the sets above, so each routing loop does one lookup
+_AGENT_CLASS: Mapping[str, str] = MappingProxyType(
+    {
+        **dict.fromkeys(_UTILITY_AGENTS, "utility"),
+        **dict.fromkeys(_PREMIUM_AGENTS, "premium"),
+    }
+)
+_CATEGORY_CLASS: Mapping[str, str] = MappingProxyType(
+    {
+        **dict.fromkeys(_CHEAP_CATEGORIES, "cheap"),
+        **dict.fromkeys(_PREMIUM_CATEGORIES, "premium"),
+    }
+)
+
+# Minimum requests in the window before an agent / category is worth moving
+_MIN_AGENT_REQUESTS = 10
+_MIN_CATEGORY_REQUESTS = 5
+
+
+def _dump_omo_config(config: Dict[str, Any]) -> bytes:
+    """Serialize an oh-my-opencode config with 2-space indentation.
+
+    Args:
+        config: Config to serialize
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode("utf-8")
+
+
+# Number of analyze_limits reports kept per analyzer
+_LIMITS_CACHE_SIZE = 8
+
+# Number of parsed oh-my-opencode configs kept per analyzer
+_OMO_CONFIG_CACHE_SIZE = 8
 
 
 class LimitsAnalyzer:
@@ -275,6 +675,113 @@ class LimitsAnalyzer:
         """
         self.limits_config = limits_config
         self.pricing_data = pricing_data
+        self._columns: Optional[_InteractionColumns] = None
+        self._columns_sessions: Optional[List[SessionData]] = None
+        self._columns_size: Optional[Tuple[int, int]] = None
+        self._window_usage: Optional[_WindowUsage] = None
+        self._window_usage_key: Optional[Tuple[_InteractionColumns, datetime]] = None
+        # (reference_time, window_hours_override) -> report, most recent last;
+        # cleared whenever the columns are rebuilt
+        self._limits_cache: OrderedDict[
+            Tuple[datetime, Optional[int]], LimitsReport
+        ] = OrderedDict()
+        # (abspath, mtime_ns, size) -> parsed oh-my-opencode config
+        self._omo_config_cache: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+    def _get_columns(self, sessions: List[SessionData]) -> _InteractionColumns:
+        """Get the columnar view of sessions, rebuilding it only when needed.
+
+        The view is reused while the same sessions list is passed in and its
+        size is unchanged, so a report calling several analyses flattens the
+        data once.
+
+        Args:
+            sessions: Sessions to analyze
+
+        Returns:
+            _InteractionColumns for these sessions
+        """
+        size = (len(sessions), sum(len(session.files) for session in sessions))
+        if (
+            self._columns is None
+            or self._columns_sessions is not sessions
+            or self._columns_size != size
+        ):
+            self._columns = _InteractionColumns(sessions)
+            self._columns_sessions = sessions
+            self._columns_size = size
+            self._limits_cache.clear()
+        return self._columns
+
+    def _get_costs(self, columns: _InteractionColumns) -> List[int]:
+        """Get the per-row cost column, computing it on first use.
+
+        Costs are integers in pico-dollars (1e-12 USD): prices per 1M
+        tokens are scaled to micro-dollars once per distinct model, so each
+        row is an exact integer product and window sums never allocate
+        Decimals. Convert with ``pico_dollars_to_decimal`` at the boundary.
+
+        Args:
+            columns: Columnar view of all interactions
+
+        Returns:
+            List of costs in pico-dollars, indexed by row
+        """
+        if columns.cost is not None:
+            return columns.cost
+
+        model_prices: dict[str, Optional[Tuple[int, int, int, int]]] = {}
+        costs: List[int] = []
+
+        for file, model_id in zip(columns.files, columns.model):
+            if model_id in model_prices:
+                prices = model_prices[model_id]
+            else:
+                pricing = find_model_pricing(model_id, self.pricing_data)
+                prices = model_prices[model_id] = (
+                    (
+                        price_to_micro_dollars(pricing.input),
+                        price_to_micro_dollars(pricing.output),
+                        price_to_micro_dollars(pricing.cache_write),
+                        price_to_micro_dollars(pricing.cache_read),
+                    )
+                    if pricing is not None
+                    else None
+                )
+
+            if prices is None:
+                costs.append(0)
+                continue
+
+            tokens = file.tokens
+            costs.append(
+                tokens.input * prices[0]
+                + tokens.output * prices[1]
+                + tokens.cache_write * prices[2]
+                + tokens.cache_read * prices[3]
+            )
+
+        columns.cost = costs
+        return costs
+
+    def _get_window_usage(
+        self, sessions: List[SessionData], window_start: datetime
+    ) -> _WindowUsage:
+        """Get agent/category usage for a window, reusing the last result.
+
+        Args:
+            sessions: Sessions to analyze
+            window_start: Start of the window
+
+        Returns:
+            _WindowUsage for the window
+        """
+        columns = self._get_columns(sessions)
+        key = (columns, window_start)
+        if self._window_usage is None or self._window_usage_key != key:
+            self._window_usage = _WindowUsage(columns, window_start)
+            self._window_usage_key = key
+        return self._window_usage
 
     def analyze_limits(
         self,
@@ -295,20 +802,18 @@ class LimitsAnalyzer:
         if reference_time is None:
             reference_time = datetime.now()
 
-        # Collect all interactions across sessions
-        all_interactions: List[tuple[InteractionFile, str]] = []  # (file, session_id)
-        for session in sessions:
-            for file in session.files:
-                all_interactions.append((file, session.session_id))
+        # Interactions are grouped by provider when the columns are built
+        columns = self._get_columns(sessions)
 
-        # Group by provider
-        provider_interactions: dict[str, List[InteractionFile]] = defaultdict(list)
-        all_providers_seen: set[str] = set()
+        # Reports derived from the same data are reused; callers must treat
+        # the returned report as read-only
+        cache_key = (reference_time, window_hours_override)
+        cached = self._limits_cache.get(cache_key)
+        if cached is not None:
+            self._limits_cache.move_to_end(cache_key)
+            return cached
 
-        for interaction, _ in all_interactions:
-            provider_id = interaction.provider_id or "unknown"
-            all_providers_seen.add(provider_id)
-            provider_interactions[provider_id].append(interaction)
+        all_providers_seen: set[str] = set(columns.by_provider)
 
         # Analyze each configured provider
         provider_usage_list: List[ProviderUsageWindow] = []
@@ -320,7 +825,7 @@ class LimitsAnalyzer:
 
                 usage = self._analyze_provider_window(
                     provider_limit,
-                    provider_interactions.get(provider_limit.provider_id, []),
+                    columns,
                     reference_time,
                     window_hours_override,
                 )
@@ -332,18 +837,22 @@ class LimitsAnalyzer:
         # Generate recommendations
         recommendations = self._generate_recommendations(provider_usage_list)
 
-        return LimitsReport(
+        report = LimitsReport(
             generated_at=reference_time,
             window_end=reference_time,
             provider_usage=provider_usage_list,
             unconfigured_providers=sorted(unconfigured),
             recommendations=recommendations,
         )
+        self._limits_cache[cache_key] = report
+        if len(self._limits_cache) > _LIMITS_CACHE_SIZE:
+            self._limits_cache.popitem(last=False)
+        return report
 
     def _analyze_provider_window(
         self,
         provider_limit: ProviderLimit,
-        interactions: List[InteractionFile],
+        columns: _InteractionColumns,
         reference_time: datetime,
         window_hours_override: Optional[int] = None,
     ) -> ProviderUsageWindow:
@@ -351,7 +860,7 @@ class LimitsAnalyzer:
 
         Args:
             provider_limit: Provider's configured limits
-            interactions: All interactions for this provider
+            columns: Columnar view of all interactions
             reference_time: Reference time for window
             window_hours_override: Override window hours (ignores provider config)
 
@@ -367,25 +876,16 @@ class LimitsAnalyzer:
         window_start = reference_time - timedelta(hours=window_hours)
 
         # Filter interactions within window
-        window_interactions: List[InteractionFile] = []
-        for interaction in interactions:
-            if interaction.time_data and interaction.time_data.created_datetime:
-                if interaction.time_data.created_datetime >= window_start:
-                    window_interactions.append(interaction)
-
-        # Calculate usage (use total tokens for accurate workload)
-        requests_used = len(window_interactions)
-        tokens_used = sum(i.tokens.total for i in window_interactions)
-
-        # Calculate cost
-        cost_used = Decimal("0.0")
-        for interaction in window_interactions:
-            cost_used += interaction.calculate_cost(self.pricing_data)
-
-        # Track models used
-        models_used: dict[str, int] = defaultdict(int)
-        for interaction in window_interactions:
-            models_used[interaction.model_id] += 1
+        window_rows = columns.provider_window_rows(
+            provider_limit.provider_id, window_start, include_untimed=False
+        )
+
+        # Calculate usage (use total tokens for accurate workload), cost
+        # and track models used
+        requests_used, tokens_used, cost_raw, models_used = columns.aggregate(
+            window_rows, self._get_costs(columns)
+        )
+        cost_used = pico_dollars_to_decimal(cost_raw)
 
         # Calculate effective limits (accounting for multi-account)
         requests_limit = provider_limit.effective_requests_per_window
@@ -415,7 +915,7 @@ class LimitsAnalyzer:
             requests_limit=requests_limit,
             tokens_limit=tokens_limit,
             monthly_cost_limit=provider_limit.monthly_cost_limit,
-            models_used=dict(models_used),
+            models_used=models_used,
         )
 
     def _generate_recommendations(
@@ -497,39 +997,44 @@ class LimitsAnalyzer:
             lambda: {"requests": 0, "tokens": 0, "limit": None, "models_matched": []}
         )
 
-        for session in sessions:
-            for file in session.files:
-                if file.provider_id != provider_id:
-                    continue
+        # Compile each glob once; fnmatch.fnmatch would re-check its pattern
+        # cache on every call. Patterns and names go through normcase to
+        # keep fnmatch's platform semantics.
+        compiled_limits = [
+            (
+                re.compile(fnmatch.translate(os.path.normcase(model_limit.model_pattern))),
+                model_limit,
+            )
+            for model_limit in provider_limit.model_limits
+        ]
 
-                if file.time_data and file.time_data.created_datetime:
-                    if file.time_data.created_datetime < window_start:
-                        continue
-
-                # Match to model limit pattern
-                matched_pattern = None
-                for model_limit in provider_limit.model_limits:
-                    if fnmatch.fnmatch(file.model_id, model_limit.model_pattern):
-                        matched_pattern = model_limit.model_pattern
-                        if model_limit.requests_per_window:
-                            model_usage[matched_pattern]["limit"] = (
-                                model_limit.requests_per_window
-                                * provider_limit.account_count
-                            )
-                        break
+        # Total requests and tokens per distinct model first, so each model
+        # is matched against the patterns only once
+        columns = self._get_columns(sessions)
+        window_rows = columns.provider_window_rows(provider_id, window_start)
+        model_requests = Counter(map(columns.model.__getitem__, window_rows))
+        model_tokens: dict[str, int] = dict.fromkeys(model_requests, 0)
+        for row in window_rows:
+            model_tokens[columns.model[row]] += columns.tokens_io[row]
+
+        for model_id, requests in model_requests.items():
+            # Match to model limit pattern
+            name = os.path.normcase(model_id)
+            model_limit = next(
+                (limit for regex, limit in compiled_limits if regex.match(name)),
+                None,
+            )
+            if not model_limit or not model_limit.model_pattern:
+                continue
 
-                if matched_pattern:
-                    model_usage[matched_pattern]["requests"] += 1
-                    model_usage[matched_pattern]["tokens"] += (
-                        file.tokens.input + file.tokens.output
-                    )
-                    if (
-                        file.model_id
-                        not in model_usage[matched_pattern]["models_matched"]
-                    ):
-                        model_usage[matched_pattern]["models_matched"].append(
-                            file.model_id
-                        )
+            usage = model_usage[model_limit.model_pattern]
+            if model_limit.requests_per_window:
+                usage["limit"] = (
+                    model_limit.requests_per_window * provider_limit.account_count
+                )
+            usage["requests"] += requests
+            usage["tokens"] += model_tokens[model_id]
+            usage["models_matched"].append(model_id)
 
         return dict(model_usage)
 
@@ -572,22 +1077,27 @@ class LimitsAnalyzer:
             if p.requests_utilization is not None and p.requests_utilization < 50
         ]
 
-        # Analyze category -> provider patterns
-        category_provider_usage: dict[str, dict[str, int]] = defaultdict(
-            lambda: defaultdict(int)
-        )
-        total_requests = 0
-
-        for session in sessions:
-            for file in session.files:
-                if file.time_data and file.time_data.created_datetime:
-                    if file.time_data.created_datetime < window_start:
-                        continue
+        # Nothing can be moved without both a source and a target, so skip
+        # the category scan and only count the window's requests
+        if not overloaded or not underutilized:
+            return OptimizationReport(
+                generated_at=reference_time,
+                analysis_period_hours=hours,
+                overloaded_providers=overloaded,
+                underutilized_providers=underutilized,
+                suggestions=[],
+                total_requests_analyzed=self._get_columns(
+                    sessions
+                ).by_time.count_since(window_start),
+                requests_movable=0,
+            )
 
-                category = file.category or "uncategorized"
-                provider = file.provider_id or "unknown"
-                category_provider_usage[category][provider] += 1
-                total_requests += 1
+        # Analyze category -> provider patterns
+        window_usage = self._get_window_usage(sessions, window_start)
+        total_requests = window_usage.total_requests
+        category_provider_usage: dict[str, dict[str, int]] = defaultdict(dict)
+        for (category, provider), stats in window_usage.category_provider.items():
+            category_provider_usage[category][provider] = stats[0]
 
         # Generate suggestions
         suggestions: List[OptimizationSuggestion] = []
@@ -694,41 +1204,9 @@ class LimitsAnalyzer:
             reference_time = datetime.now()
 
         window_start = reference_time - timedelta(hours=hours)
+        window_usage = self._get_window_usage(sessions, window_start)
 
-        # agent -> provider -> stats
-        agent_provider_stats: dict[str, dict[str, dict[str, Any]]] = defaultdict(
-            lambda: defaultdict(lambda: {"requests": 0, "tokens": 0, "models": set()})
-        )
-
-        for session in sessions:
-            for file in session.files:
-                if file.time_data and file.time_data.created_datetime:
-                    if file.time_data.created_datetime < window_start:
-                        continue
-
-                agent = file.agent or "unknown"
-                provider = file.provider_id or "unknown"
-
-                agent_provider_stats[agent][provider]["requests"] += 1
-                # Use total tokens (includes cache) for accurate workload measurement
-                agent_provider_stats[agent][provider]["tokens"] += file.tokens.total
-                agent_provider_stats[agent][provider]["models"].add(file.model_id)
-
-        # Convert sets to lists and calculate averages
-        result: dict[str, dict[str, Any]] = {}
-        for agent, providers in agent_provider_stats.items():
-            result[agent] = {}
-            for provider, stats in providers.items():
-                result[agent][provider] = {
-                    "requests": stats["requests"],
-                    "tokens": stats["tokens"],
-                    "avg_tokens": stats["tokens"] // stats["requests"]
-                    if stats["requests"] > 0
-                    else 0,
-                    "models": list(stats["models"]),
-                }
-
-        return result
+        return _WindowUsage.summarize(window_usage.agent_provider)
 
     def analyze_category_provider_usage(
         self,
@@ -750,40 +1228,9 @@ class LimitsAnalyzer:
             reference_time = datetime.now()
 
         window_start = reference_time - timedelta(hours=hours)
+        window_usage = self._get_window_usage(sessions, window_start)
 
-        # category -> provider -> stats
-        cat_provider_stats: dict[str, dict[str, dict[str, Any]]] = defaultdict(
-            lambda: defaultdict(lambda: {"requests": 0, "tokens": 0, "models": set()})
-        )
-
-        for session in sessions:
-            for file in session.files:
-                if file.time_data and file.time_data.created_datetime:
-                    if file.time_data.created_datetime < window_start:
-                        continue
-
-                category = file.category or "uncategorized"
-                provider = file.provider_id or "unknown"
-
-                cat_provider_stats[category][provider]["requests"] += 1
-                cat_provider_stats[category][provider]["tokens"] += file.tokens.total
-                cat_provider_stats[category][provider]["models"].add(file.model_id)
-
-        # Convert sets to lists and calculate averages
-        result: dict[str, dict[str, Any]] = {}
-        for category, providers in cat_provider_stats.items():
-            result[category] = {}
-            for provider, stats in providers.items():
-                result[category][provider] = {
-                    "requests": stats["requests"],
-                    "tokens": stats["tokens"],
-                    "avg_tokens": stats["tokens"] // stats["requests"]
-                    if stats["requests"] > 0
-                    else 0,
-                    "models": list(stats["models"]),
-                }
-
-        return result
+        return _WindowUsage.summarize(window_usage.category_provider)
 
     def generate_routing_recommendations(
         self,
@@ -791,6 +1238,7 @@ class LimitsAnalyzer:
         omo_config_path: Optional[str] = None,
         hours: int = 24,
         reference_time: Optional[datetime] = None,
+        include_reasons: bool = True,
     ) -> List[Dict[str, Any]]:
         """Generate specific routing recommendations based on usage patterns.
 
@@ -806,17 +1254,22 @@ class LimitsAnalyzer:
             omo_config_path: Path to oh-my-opencode.json
             hours: Analysis window in hours
             reference_time: Reference time
+            include_reasons: Format the human-readable "reason" of each
+                recommendation (None otherwise, e.g. when only applying them)
 
         Returns:
-            List of recommendation dicts
+            List of recommendation dicts, empty when Antigravity has no spare
+            capacity (use analyze_limits for the provider status itself)
         """
         if reference_time is None:
             reference_time = datetime.now()
 
         recommendations: List[Dict[str, Any]] = []
+        sort_keys: List[Tuple[int, int]] = []
 
-        # Load oh-my-opencode config if available
-        omo_config = self._load_omo_config(omo_config_path)
+        # Nothing to move without usage
+        if not sessions:
+            return recommendations
 
         # Get current limits status
         limits_report = self.analyze_limits(sessions, reference_time)
@@ -829,69 +1282,62 @@ class LimitsAnalyzer:
 
         google_capacity = underutilized_capacity.get("google", 0)
 
-        # Utility agents that should stay on cheap providers
-        utility_agents = {"explore", "librarian", "multimodal-looker"}
+        # Every recommendation needs Antigravity capacity for at least
+        # _MIN_CATEGORY_REQUESTS requests, so skip the usage analysis when
+        # there isn't any
+        if google_capacity < _MIN_CATEGORY_REQUESTS:
+            return recommendations
 
-        # High-value agents that need quality models
-        premium_agents = {
-            "Sisyphus",
-            "oracle",
-            "Prometheus (Planner)",
-            "Metis (Plan Consultant)",
-        }
-
-        # Categories that need quality
-        premium_categories = {"ultrabrain", "most-capable", "medium"}
-        cheap_categories = {"quick", "boilerplate", "test-writing"}
+        # Load oh-my-opencode config if available
+        omo_config = self._load_omo_config(omo_config_path) or {}
+        agents_config = omo_config.get("agents", {})
+        categories_config = omo_config.get("categories", {})
+
+        # Only expensive providers with significant usage are worth moving
+        # away from, so select just those pairs from the window's usage
+        window_usage = self._get_window_usage(
+            sessions, reference_time - timedelta(hours=hours)
+        )
 
         # =============== AGENT RECOMMENDATIONS ===============
-        agent_usage = self.analyze_agent_provider_usage(sessions, hours, reference_time)
-        expensive_providers = {"anthropic"}
+        agent_usage = _WindowUsage.select(
+            window_usage.agent_provider, _EXPENSIVE_PROVIDERS, _MIN_AGENT_REQUESTS
+        )
 
         for agent, providers in agent_usage.items():
-            for provider, stats in providers.items():
-                # Skip utility agents - they're fine on cheap providers
-                if agent in utility_agents:
-                    continue
-
-                # Only recommend for expensive providers with significant usage
-                if provider not in expensive_providers or stats["requests"] < 10:
-                    continue
+            # Skip utility agents - they're fine on cheap providers
+            agent_kind = _AGENT_CLASS.get(agent, "regular")
+            if agent_kind == "utility":
+                continue
 
+            for provider, (requests, tokens) in providers.items():
                 # Check if Antigravity has capacity
-                if google_capacity < stats["requests"]:
+                if google_capacity < requests:
                     continue
 
-                avg_tokens = stats["avg_tokens"]
+                avg_tokens = tokens // requests
 
                 # Get current model from config
-                current_model = None
-                if omo_config and "agents" in omo_config:
-                    agent_config = omo_config["agents"].get(agent, {})
-                    current_model = agent_config.get("model")
+                current_model = agents_config.get(agent, {}).get("model")
 
                 # Determine recommendation based on agent type and complexity
-                if agent in premium_agents:
+                # (reasons are templates, only formatted when requested)
+                if agent_kind == "premium":
                     # Premium agents need high-capability Antigravity models
                     if avg_tokens > 80000:
                         suggested_model = ANTIGRAVITY_MODELS["claude_opus_thinking"]
-                        reason = f"Premium agent, high complexity ({avg_tokens:,} tok/req) -> Opus Thinking"
+                        reason = "Premium agent, high complexity ({tokens:,} tok/req) -> Opus Thinking"
                     else:
                         suggested_model = ANTIGRAVITY_MODELS["claude_sonnet_thinking"]
-                        reason = f"Premium agent ({avg_tokens:,} tok/req) -> Claude Sonnet Thinking"
+                        reason = "Premium agent ({tokens:,} tok/req) -> Claude Sonnet Thinking"
                 else:
                     # Regular agents - use complexity-based recommendation
-                    _, suggested_model, reason = get_antigravity_recommendation(
-                        avg_tokens
-                    )
+                    tier = bisect_left(_TIER_THRESHOLDS, avg_tokens)
+                    suggested_model = _TIER_RECORDS[tier][1]
+                    reason = _TIER_REASONS[tier]
 
-                impact = (
-                    "high"
-                    if stats["requests"] > 100
-                    else "medium"
-                    if stats["requests"] > 30
-                    else "low"
-                )
+                impact = _impact(requests, _AGENT_IMPACT_THRESHOLDS)
+                sort_keys.append((_IMPACT_RANK[impact], -requests))
 
                 recommendations.append(
                     {
@@ -901,19 +1347,24 @@ class LimitsAnalyzer:
                         "current_model": current_model or f"{provider}/*",
                         "suggested_provider": "google",
                         "suggested_model": suggested_model,
-                        "reason": reason,
-                        "requests_moved": stats["requests"],
-                        "tokens_moved": stats["tokens"],
+                        "reason": (
+                            reason.format(name=agent, tokens=avg_tokens)
+                            if include_reasons
+                            else None
+                        ),
+                        "requests_moved": requests,
+                        "tokens_moved": tokens,
                         "avg_tokens": avg_tokens,
                         "impact": impact,
-                        "antigravity_capacity_remaining": google_capacity
-                        - stats["requests"],
+                        "antigravity_capacity_remaining": google_capacity - requests,
                     }
                 )
 
         # =============== CATEGORY RECOMMENDATIONS ===============
-        category_usage = self.analyze_category_provider_usage(
-            sessions, hours, reference_time
+        category_usage = _WindowUsage.select(
+            window_usage.category_provider,
+            _EXPENSIVE_PROVIDERS,
+            _MIN_CATEGORY_REQUESTS,
         )
 
         for category, providers in category_usage.items():
@@ -921,50 +1372,39 @@ class LimitsAnalyzer:
             if category == "uncategorized":
                 continue
 
-            for provider, stats in providers.items():
-                # Only recommend for expensive providers with significant usage
-                if provider not in expensive_providers or stats["requests"] < 5:
-                    continue
-
+            category_kind = _CATEGORY_CLASS.get(category, "regular")
+            for provider, (requests, tokens) in providers.items():
                 # Check if Antigravity has capacity
-                if google_capacity < stats["requests"]:
+                if google_capacity < requests:
                     continue
 
-                avg_tokens = stats["avg_tokens"]
+                avg_tokens = tokens // requests
 
                 # Get current model from config
-                current_model = None
-                if omo_config and "categories" in omo_config:
-                    cat_config = omo_config["categories"].get(category, {})
-                    current_model = cat_config.get("model")
+                current_model = categories_config.get(category, {}).get("model")
 
                 # Determine recommendation based on category purpose
-                if category in premium_categories:
+                # (reasons are templates, only formatted when requested)
+                if category_kind == "premium":
                     # Premium categories need high-capability models
                     if avg_tokens > 80000:
                         suggested_model = ANTIGRAVITY_MODELS["claude_opus_thinking"]
-                        reason = f"Premium category '{category}' ({avg_tokens:,} tok/req) -> Opus Thinking"
+                        reason = "Premium category '{name}' ({tokens:,} tok/req) -> Opus Thinking"
                     else:
                         suggested_model = ANTIGRAVITY_MODELS["claude_sonnet_thinking"]
-                        reason = f"Premium category '{category}' ({avg_tokens:,} tok/req) -> Claude Sonnet"
-                elif category in cheap_categories:
+                        reason = "Premium category '{name}' ({tokens:,} tok/req) -> Claude Sonnet"
+                elif category_kind == "cheap":
                     # Cheap categories can use Flash
                     suggested_model = ANTIGRAVITY_MODELS["gemini_flash"]
-                    reason = f"Quick category '{category}' ({avg_tokens:,} tok/req) -> Gemini Flash"
+                    reason = "Quick category '{name}' ({tokens:,} tok/req) -> Gemini Flash"
                 else:
                     # Use complexity-based recommendation
-                    _, suggested_model, reason = get_antigravity_recommendation(
-                        avg_tokens
-                    )
-                    reason = f"Category '{category}': {reason}"
-
-                impact = (
-                    "high"
-                    if stats["requests"] > 50
-                    else "medium"
-                    if stats["requests"] > 20
-                    else "low"
-                )
+                    tier = bisect_left(_TIER_THRESHOLDS, avg_tokens)
+                    suggested_model = _TIER_RECORDS[tier][1]
+                    reason = "Category '{name}': " + _TIER_REASONS[tier]
+
+                impact = _impact(requests, _CATEGORY_IMPACT_THRESHOLDS)
+                sort_keys.append((_IMPACT_RANK[impact], -requests))
 
                 recommendations.append(
                     {
@@ -974,23 +1414,23 @@ class LimitsAnalyzer:
                         "current_model": current_model or f"{provider}/*",
                         "suggested_provider": "google",
                         "suggested_model": suggested_model,
-                        "reason": reason,
-                        "requests_moved": stats["requests"],
-                        "tokens_moved": stats["tokens"],
+                        "reason": (
+                            reason.format(name=category, tokens=avg_tokens)
+                            if include_reasons
+                            else None
+                        ),
+                        "requests_moved": requests,
+                        "tokens_moved": tokens,
                         "avg_tokens": avg_tokens,
                         "impact": impact,
-                        "antigravity_capacity_remaining": google_capacity
-                        - stats["requests"],
+                        "antigravity_capacity_remaining": google_capacity - requests,
                     }
                 )
 
-        # Sort by impact (high first) and requests moved
-        impact_order = {"high": 0, "medium": 1, "low": 2}
-        recommendations.sort(
-            key=lambda x: (impact_order.get(x["impact"], 3), -x["requests_moved"])
-        )
-
-        return recommendations
+        # Sort by impact (high first) and requests moved, using the keys
+        # recorded as each recommendation was added
+        order = sorted(range(len(recommendations)), key=sort_keys.__getitem__)
+        return [recommendations[i] for i in order]
 
     def _load_omo_config(
         self, config_path: Optional[str] = None
@@ -1001,7 +1441,8 @@ class LimitsAnalyzer:
             config_path: Optional explicit path
 
         Returns:
-            Parsed config dict or None
+            Parsed config dict or None. The dict is shared with the cache,
+            so copy it before modifying.
         """
         if config_path is None:
             # Try standard locations
@@ -1014,14 +1455,29 @@ class LimitsAnalyzer:
                     config_path = path
                     break
 
-        if config_path and os.path.exists(config_path):
-            try:
-                with open(config_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
-
-        return None
+        if not config_path:
+            return None
+
+        # Reuse the parsed config while the file is unchanged
+        try:
+            stat = os.stat(config_path)
+        except OSError:
+            return None
+        key = (os.path.abspath(config_path), stat.st_mtime_ns, stat.st_size)
+        if key in self._omo_config_cache:
+            return self._omo_config_cache[key]
+
+        try:
+            with open(config_path, "rb") as f:
+                data = f.read()
+            config = orjson.loads(data) if HAS_ORJSON else json.loads(data)
+        except (ValueError, IOError):
+            return None
+
+        self._omo_config_cache[key] = config
+        if len(self._omo_config_cache) > _OMO_CONFIG_CACHE_SIZE:
+            del self._omo_config_cache[next(iter(self._omo_config_cache))]
+        return config
 
     def apply_routing_recommendations(
         self,
@@ -1047,6 +1503,7 @@ class LimitsAnalyzer:
         config = self._load_omo_config(omo_config_path)
         if not config:
             return {}, "Error: Could not load oh-my-opencode.json"
+        config = copy.deepcopy(config)
 
         changes: List[str] = []
 
@@ -1077,14 +1534,17 @@ class LimitsAnalyzer:
                 omo_config_path + f".bak.{datetime.now().strftime('%Y-%m-%dT%H-%M-%S')}"
             )
             try:
-                import shutil
-
-                shutil.copy2(omo_config_path, backup_path)
+                new_content = _dump_omo_config(config)
+                with open(omo_config_path, "rb") as f:
+                    unchanged = f.read() == new_content
 
-                with open(omo_config_path, "w", encoding="utf-8") as f:
-                    json.dump(config, f, indent=2)
+                if unchanged:
+                    summary += "\n\nConfig already up to date - nothing written"
+                else:
+                    shutil.copy2(omo_config_path, backup_path)
+                    write_atomic(omo_config_path, new_content)
 
-                summary += f"\n\nConfig saved! Backup at: {backup_path}"
+                    summary += f"\n\nConfig saved! Backup at: {backup_path}"
             except IOError as e:
                 summary += f"\n\nError saving config: {e}"
         elif dry_run:
@@ -1,13 +1,18 @@
 """Live monitoring service for OpenCode Monitor."""
 
+import heapq
+import os
 import sys
 import time
 import threading
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from operator import itemgetter
 from decimal import Decimal
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from stat import S_ISDIR
+from typing import Optional, Dict, Any, List, Tuple, Callable
 from rich.live import Live
 from rich.console import Console
 from rich.layout import Layout
@@ -18,59 +23,131 @@ from rich.columns import Columns
 from rich.tree import Tree
 
 # Platform-specific keyboard input with threading
-from queue import Queue, Empty
+from queue import Queue, Empty, Full
 
-_key_queue: Queue = Queue()
-_keyboard_thread_started = False
+# Bounded so a held key or pasted burst cannot pile up stale input
+_KEY_QUEUE_SIZE = 16
+_key_queue: Queue = Queue(maxsize=_KEY_QUEUE_SIZE)
+_keyboard_thread: Optional[threading.Thread] = None
+# Stop event of the current listener; each listener gets its own so one left
+# blocked in msvcrt.getwch() can't be revived by a restart
+_keyboard_stop: Optional[threading.Event] = None
+# Self-pipe used to wake the blocking POSIX listener on shutdown
+_keyboard_wakeup_fds: Optional[Tuple[int, int]] = None
+
+
+def _put_key(key: str) -> None:
+    """Queue a keypress, dropping it if the queue is full."""
+    try:
+        _key_queue.put_nowait(key)
+    except Full:
+        pass
 
 
 def _start_keyboard_listener():
-    """Start background thread for keyboard input."""
-    global _keyboard_thread_started
-    if _keyboard_thread_started:
+    """Start background thread for keyboard input.
+
+    The thread blocks until a key arrives instead of polling, so it is idle
+    without input and keys are queued as soon as they are typed.
+    """
+    global _keyboard_thread, _keyboard_stop, _keyboard_wakeup_fds
+    if _keyboard_thread is not None and _keyboard_thread.is_alive():
         return
-    _keyboard_thread_started = True
+    if _keyboard_wakeup_fds is not None:
+        # A previous listener exited on its own (e.g. stdin is not a tty)
+        os.close(_keyboard_wakeup_fds[1])
+        _keyboard_wakeup_fds = None
+    stop = _keyboard_stop = threading.Event()
 
-    def listen():
-        if sys.platform == "win32":
+    if sys.platform == "win32":
+
+        def listen():
             import msvcrt
 
-            while True:
+            while not stop.is_set():
                 try:
-                    if msvcrt.kbhit():
-                        key = msvcrt.getch()
-                        # Handle special keys (arrows, etc.)
-                        if key in (b"\x00", b"\xe0"):
-                            special = msvcrt.getch()
-                            # Arrow keys: H=up, P=down, K=left, M=right
-                            if special == b"H":
-                                _key_queue.put("k")  # up -> k
-                            elif special == b"P":
-                                _key_queue.put("j")  # down -> j
-                        else:
-                            _key_queue.put(key.decode("utf-8", errors="ignore").lower())
-                    time.sleep(0.05)
+                    key = msvcrt.getwch()  # Blocks until a key is pressed
+                    # Once stopped, drop the key unless a newer listener is
+                    # running; then queue it for that one and exit the loop
+                    if stop.is_set() and _keyboard_stop is None:
+                        break
+                    # Handle special keys (arrows, etc.)
+                    if key in ("\x00", "\xe0"):
+                        special = msvcrt.getwch()
+                        # Arrow keys: H=up, P=down, K=left, M=right
+                        if special == "H":
+                            _put_key("k")  # up -> k
+                        elif special == "P":
+                            _put_key("j")  # down -> j
+                    else:
+                        _put_key(key.lower())
                 except Exception:
                     break
-        else:
+
+    else:
+        wakeup_read, wakeup_write = os.pipe()
+        _keyboard_wakeup_fds = (wakeup_read, wakeup_write)
+
+        def listen():
             import select
             import tty
             import termios
 
-            old_settings = termios.tcgetattr(sys.stdin)
             try:
-                tty.setcbreak(sys.stdin.fileno())
-                while True:
-                    if select.select([sys.stdin], [], [], 0.1)[0]:
-                        key = sys.stdin.read(1)
-                        _key_queue.put(key.lower())
+                old_settings = termios.tcgetattr(sys.stdin)
+            except Exception:
+                os.close(wakeup_read)
+                return
+            stdin_fd = sys.stdin.fileno()
+            try:
+                tty.setcbreak(stdin_fd)
+                while not stop.is_set():
+                    # Blocks until input arrives or the wakeup pipe is written
+                    readable = select.select([stdin_fd, wakeup_read], [], [])[0]
+                    if wakeup_read in readable:
+                        break
+                    # Read the raw fd so a burst of keys is not left sitting
+                    # in sys.stdin's buffer where select() cannot see it
+                    data = os.read(stdin_fd, 64)
+                    if not data:
+                        break
+                    for key in data.decode("utf-8", errors="ignore"):
+                        _put_key(key.lower())
             except Exception:
                 pass
             finally:
                 termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
+                os.close(wakeup_read)
 
-    thread = threading.Thread(target=listen, daemon=True)
-    thread.start()
+    _keyboard_thread = threading.Thread(target=listen, daemon=True)
+    _keyboard_thread.start()
+
+
+def _stop_keyboard_listener(timeout: float = 1.0) -> None:
+    """Stop the keyboard listener thread and restore the terminal.
+
+    Args:
+        timeout: Seconds to wait for the thread to exit
+    """
+    global _keyboard_thread, _keyboard_stop, _keyboard_wakeup_fds
+    if _keyboard_stop is not None:
+        _keyboard_stop.set()
+        _keyboard_stop = None
+    if _keyboard_wakeup_fds is not None:
+        wakeup_write = _keyboard_wakeup_fds[1]
+        _keyboard_wakeup_fds = None
+        try:
+            os.write(wakeup_write, b"\0")
+        except OSError:
+            pass  # Listener already exited and closed its end
+        finally:
+            os.close(wakeup_write)
+    # On Windows getwch() cannot be interrupted; the daemon thread exits on
+    # the next keypress or with the process. Its stop event stays set, so a
+    # listener started meanwhile runs alongside it only until then.
+    if _keyboard_thread is not None and sys.platform != "win32":
+        _keyboard_thread.join(timeout)
+    _keyboard_thread = None
 
 
 def get_key() -> Optional[str]:
@@ -81,7 +158,28 @@ def get_key() -> Optional[str]:
         return None
 
 
-from ..models.session import SessionData, InteractionFile, TokenUsage
+def _wait_for_key(timeout: float) -> Optional[str]:
+    """Wait up to timeout seconds for a keypress.
+
+    Args:
+        timeout: Maximum seconds to wait
+
+    Returns:
+        The key, or None if none arrived in time
+    """
+    try:
+        return _key_queue.get(timeout=timeout)
+    except Empty:
+        return None
+
+
+from ..models.session import (
+    SessionData,
+    InteractionFile,
+    TokenUsage,
+    DECIMAL_ZERO,
+    pico_dollars_to_decimal,
+)
 from ..models.limits import LimitsConfig, ProviderLimit
 from ..utils.file_utils import FileProcessor
 from ..ui.dashboard import DashboardUI
@@ -93,6 +191,133 @@ if TYPE_CHECKING:
     from ..utils.data_source import DataSource
 
 
+# Maximum number of parsed sessions kept in memory
+_SESSION_CACHE_SIZE = 256
+
+# Threads used to read changed sessions concurrently
+_SESSION_LOAD_WORKERS = 8
+
+# Provider card progress bars, indexed by the number of filled cells
+_PROVIDER_BAR_WIDTH = 16
+_PROVIDER_BARS: Tuple[str, ...] = tuple(
+    "█" * filled + "░" * (_PROVIDER_BAR_WIDTH - filled)
+    for filled in range(_PROVIDER_BAR_WIDTH + 1)
+)
+
+# A session listing is reused until the base directory changes or it gets
+# this old (seconds); the age limit catches sessions nested below it
+_SESSION_LIST_MAX_AGE = 30.0
+
+
+# Named defaultdict factories for the aggregate dashboard (costs in pico-dollars)
+def _new_project_stats() -> Dict[str, Any]:
+    return {
+        "sessions": 0,
+        "interactions": 0,
+        "tokens": TokenUsage(),
+        "cost": 0,
+        "latest_time": None,
+        "latest_ts": -1.0,
+        "latest_model": None,
+        "cache_rate": 0.0,
+    }
+
+
+def _new_provider_usage() -> Dict[str, Any]:
+    return {"requests": 0, "tokens": 0, "cost": 0}
+
+
+def _new_category_stats() -> Dict[str, Any]:
+    return {"requests": 0, "cost": 0}
+
+
+def _new_category_usage() -> defaultdict:
+    return defaultdict(_new_category_stats)
+
+
+def _new_agent_usage() -> defaultdict:
+    return defaultdict(_new_category_usage)
+
+
+def _new_model_usage() -> defaultdict:
+    return defaultdict(_new_agent_usage)
+
+
+def _provider_totals(provider_data: dict) -> Tuple[Decimal, int]:
+    """Sum cost and requests over a provider's usage hierarchy."""
+    total_cost = 0
+    total_reqs = 0
+    for model_data in provider_data.values():
+        for agent_data in model_data.values():
+            for cat_stats in agent_data.values():
+                total_cost += cat_stats["cost"]
+                total_reqs += cat_stats["requests"]
+    return pico_dollars_to_decimal(total_cost), total_reqs
+
+
+def _model_totals(model_data: dict) -> Tuple[Decimal, int]:
+    """Sum cost and requests over a model's usage hierarchy."""
+    total_cost = 0
+    total_reqs = 0
+    for agent_data in model_data.values():
+        for cat_stats in agent_data.values():
+            total_cost += cat_stats["cost"]
+            total_reqs += cat_stats["requests"]
+    return pico_dollars_to_decimal(total_cost), total_reqs
+
+
+def _agent_totals(agent_data: dict) -> Tuple[Decimal, int]:
+    """Sum cost and requests over an agent's categories."""
+    total_cost = 0
+    total_reqs = 0
+    for cat_stats in agent_data.values():
+        total_cost += cat_stats["cost"]
+        total_reqs += cat_stats["requests"]
+    return pico_dollars_to_decimal(total_cost), total_reqs
+
+
+# model_id -> (provider, short model name); model ids are a small, bounded set
+_MODEL_PARSE: Dict[str, Tuple[str, str]] = {}
+
+
+def _parse_model_id(model_id: str) -> Tuple[str, str]:
+    """Split a model id like "provider/.../model" into (provider, model).
+
+    Ids without a provider prefix map to ("unknown", model_id).
+    """
+    parsed = _MODEL_PARSE.get(model_id)
+    if parsed is None:
+        if "/" in model_id:
+            provider_id, rest = model_id.split("/", 1)
+            parsed = (provider_id, rest.rsplit("/", 1)[-1])
+        else:
+            parsed = ("unknown", model_id)
+        _MODEL_PARSE[model_id] = parsed
+    return parsed
+
+
+def _project_activity_label(
+    now: datetime, latest_time: Optional[datetime]
+) -> Tuple[str, str]:
+    """Get a project card's (status icon, time ago) from its last activity."""
+    if not latest_time:
+        return "[dim]○[/dim]", "--"
+    seconds = (now - latest_time).total_seconds()
+    if seconds < 60:
+        return "[green]●[/green]", f"{int(seconds)}s"
+    elif seconds < 600:
+        return "[yellow]●[/yellow]", f"{int(seconds / 60)}m"
+    return "[red]●[/red]", f"{int(seconds / 60)}m"
+
+
+def _stream_time_label(now: datetime, modification_time: datetime) -> str:
+    """Get the right-aligned time-ago label for a live stream entry."""
+    seconds = (now - modification_time).total_seconds()
+    if seconds < 60:
+        return f"{int(seconds):>3}s"
+    return f"{int(seconds / 60):>3}m"
+
+
 class LiveMonitor:
     """Service for live monitoring of AI coding sessions."""
 
@@ -126,10 +351,47 @@ class LiveMonitor:
         self._current_base_path: Optional[str] = None
         self._tick_count = 0
 
-        # Session cache with mtime tracking to reduce I/O
-        self._session_cache: Dict[str, SessionData] = {}  # session_path -> SessionData
-        self._session_mtime: Dict[str, float] = {}  # session_path -> last mtime
-        self._last_dir_scan_tick = 0  # Last tick when we scanned directories
+        # Session cache with mtime tracking to reduce I/O (LRU, most recent
+        # last): session_path -> (session, (latest mtime, size) when loaded)
+        self._session_cache: OrderedDict[
+            str, Tuple[SessionData, Tuple[float, int]]
+        ] = OrderedDict()
+        # base_path -> (base directory mtime, monotonic time, session paths)
+        self._session_list_cache: Dict[
+            Optional[str], Tuple[Optional[float], float, List[Path]]
+        ] = {}
+        # (data fingerprint, merged aggregate) from the last dashboard render
+        self._aggregate_cache: Optional[Tuple[Any, tuple]] = None
+        # panel name -> (fingerprint of its inputs, rendered panel)
+        self._panel_cache: Dict[str, Tuple[Any, Panel]] = {}
+        # session_path -> (session, per-file stats, stats by day ordinal,
+        # newest mtime, most recently modified file)
+        self._file_stats_cache: Dict[
+            str,
+            Tuple[
+                SessionData,
+                List[tuple],
+                Dict[int, List[tuple]],
+                float,
+                Optional[InteractionFile],
+            ],
+        ] = {}
+        # Created on first use by _load_sessions_modified_since
+        self._session_load_pool: Optional[ThreadPoolExecutor] = None
+        # session_path -> (session, day, summary of that day's files)
+        self._session_summary_cache: Dict[
+            str, Tuple[SessionData, int, Optional[Dict[str, Any]]]
+        ] = {}
+        # session_path -> (session, lowercased project name and file paths)
+        self._project_keys_cache: Dict[
+            str, Tuple[SessionData, Tuple[str, Tuple[str, ...]]]
+        ] = {}
+        # session_path -> (session, (total tokens, start timestamp))
+        self._burn_inputs_cache: Dict[
+            str, Tuple[SessionData, Tuple[int, Optional[float]]]
+        ] = {}
+        # session_path -> (session, total cost of all its files)
+        self._session_cost_cache: Dict[str, Tuple[SessionData, Decimal]] = {}
 
         # UI state for keybindings
         self._view_mode = "grid"  # "grid" or "list"
@@ -142,18 +404,200 @@ class LiveMonitor:
         self._selected_provider_filter: Optional[str] = None  # Filter by provider
         self._show_help = False  # Toggle help overlay
         self._available_providers: List[str] = []  # For filter cycling
+        # (UI state, text) from the last _get_keybindings_help call
+        self._keybindings_help_cache: Optional[Tuple[tuple, str]] = None
+
+    def _find_sessions(self, base_path: str, refresh: bool = False) -> List[Path]:
+        """Find session paths, reusing the last listing while it is current.
+
+        Adding or removing a session directory changes the base directory's
+        mtime, so the listing is reused until that changes or it is older
+        than _SESSION_LIST_MAX_AGE (for data sources that nest sessions in
+        subdirectories). All callers share the same listing.
+
+        Args:
+            base_path: Path to directory containing sessions
+            refresh: List again even if the cached listing looks current
 
-    def _find_sessions(self, base_path: str) -> List[Path]:
-        """Find session paths using data source or FileProcessor."""
+        Returns:
+            List of session paths
+        """
+        try:
+            base_mtime = (
+                Path(base_path).expanduser().stat().st_mtime if base_path else None
+            )
+        except OSError:
+            base_mtime = None
+        now = time.monotonic()
+
+        cached = self._session_list_cache.get(base_path)
+        if (
+            not refresh
+            and cached is not None
+            and cached[0] == base_mtime
+            and now - cached[1] < _SESSION_LIST_MAX_AGE
+        ):
+            return cached[2]
+
+        session_paths = self._list_sessions(base_path)
+        self._session_list_cache[base_path] = (base_mtime, now, session_paths)
+        return session_paths
+
+    def _list_sessions(self, base_path: str) -> List[Path]:
+        """List session paths using data source or FileProcessor."""
         if self._data_source:
             return self._data_source.find_sessions(base_path)
-        return self._find_sessions(base_path)
+        return FileProcessor.find_session_directories(base_path)
 
-    def _load_session(self, session_path: Path) -> Optional[SessionData]:
-        """Load a session using data source or FileProcessor."""
+    def _read_session(self, session_path: Path) -> Optional[SessionData]:
+        """Parse a session from disk using data source or FileProcessor."""
         if self._data_source:
             return self._data_source.load_session(session_path)
-        return self._load_session(session_path)
+        return FileProcessor.load_session_data(session_path)
+
+    @staticmethod
+    def _session_fingerprint(session_path: Path) -> Tuple[float, int]:
+        """Get a cheap fingerprint that changes whenever a session changes.
+
+        SQLite databases (Crush) in WAL mode append new rows to the "-wal"
+        file and only fold them into the database at checkpoints, so that
+        file is included too.
+
+        Args:
+            session_path: Session directory or file
+
+        Returns:
+            Tuple of (latest mtime of the path and its JSON or WAL files,
+            total size)
+
+        Raises:
+            OSError: If the session cannot be stat'ed
+        """
+        stat = session_path.stat()
+        mtime = stat.st_mtime
+        size = stat.st_size
+        if S_ISDIR(stat.st_mode):
+            # One directory read; DirEntry avoids glob's pattern matching
+            # and extra path objects per file
+            with os.scandir(session_path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json"):
+                        entry_mtime = entry.stat().st_mtime
+                        if entry_mtime > mtime:
+                            mtime = entry_mtime
+        elif session_path.suffix == ".db":
+            try:
+                wal_stat = os.stat(f"{session_path}-wal")
+            except OSError:
+                pass  # Not in WAL mode, or fully checkpointed
+            else:
+                mtime = max(mtime, wal_stat.st_mtime)
+                size += wal_stat.st_size
+        return mtime, size
+
+    def _load_session(self, session_path: Path) -> Optional[SessionData]:
+        """Load a session, reusing the cached copy while it is unchanged.
+
+        Args:
+            session_path: Session directory or file
+
+        Returns:
+            SessionData or None if loading failed
+        """
+        key = str(session_path)
+        try:
+            fingerprint = self._session_fingerprint(session_path)
+        except OSError:
+            # File system error, try to return cached version
+            return self._get_any_cached_session(key)
+
+        cached = self._get_unchanged_session(key, fingerprint)
+        if cached is not None:
+            return cached
+
+        session = self._read_session(session_path)
+        if session:
+            self._cache_session(key, session, fingerprint)
+        return session
+
+    def _get_unchanged_session(
+        self, key: str, fingerprint: Tuple[float, int]
+    ) -> Optional[SessionData]:
+        """Return the cached session if it was loaded with this fingerprint."""
+        cached = self._session_cache.get(key)
+        if cached is not None and cached[1] == fingerprint:
+            self._session_cache.move_to_end(key)
+            return cached[0]
+        return None
+
+    def _get_any_cached_session(self, key: str) -> Optional[SessionData]:
+        """Return the cached session whether or not it is still current."""
+        cached = self._session_cache.get(key)
+        return cached[0] if cached is not None else None
+
+    def _cache_session(
+        self, key: str, session: SessionData, fingerprint: Tuple[float, int]
+    ) -> None:
+        """Store a freshly loaded session, evicting the least recently used."""
+        self._session_cache[key] = (session, fingerprint)
+        self._session_cache.move_to_end(key)
+        if len(self._session_cache) > _SESSION_CACHE_SIZE:
+            self._session_cache.popitem(last=False)
+
+    def _load_sessions_modified_since(
+        self, session_paths: List[Path], since: float
+    ) -> List[Optional[SessionData]]:
+        """Load sessions that have files modified after a point in time.
+
+        Checking mtimes first skips parsing sessions that cannot contain
+        any file from the period being shown. Unchanged sessions come from
+        the cache; the rest are read concurrently, since loading is mostly
+        waiting on file I/O.
+
+        Args:
+            session_paths: Session directories or files
+            since: POSIX timestamp; older sessions are skipped
+
+        Returns:
+            SessionData (or None if older or failed to load) per path, in order
+        """
+        sessions: List[Optional[SessionData]] = []
+        to_read: List[Tuple[int, Path, Tuple[float, int]]] = []
+
+        for session_path in session_paths:
+            key = str(session_path)
+            try:
+                fingerprint = self._session_fingerprint(session_path)
+            except OSError:
+                # File system error, try to return cached version
+                sessions.append(self._get_any_cached_session(key))
+                continue
+            if fingerprint[0] < since:
+                sessions.append(None)
+                continue
+            cached = self._get_unchanged_session(key, fingerprint)
+            if cached is None:
+                to_read.append((len(sessions), session_path, fingerprint))
+            sessions.append(cached)
+
+        if len(to_read) > 1:
+            if self._session_load_pool is None:
+                self._session_load_pool = ThreadPoolExecutor(
+                    max_workers=_SESSION_LOAD_WORKERS
+                )
+            loaded = self._session_load_pool.map(
+                self._read_session, [session_path for _, session_path, _ in to_read]
+            )
+        else:
+            loaded = (
+                self._read_session(session_path) for _, session_path, _ in to_read
+            )
+
+        for (index, session_path, fingerprint), session in zip(to_read, loaded):
+            if session:
+                self._cache_session(str(session_path), session, fingerprint)
+            sessions[index] = session
+        return sessions
 
     def _load_all_sessions(
         self, base_path: Optional[str] = None, limit: Optional[int] = None
@@ -166,18 +610,43 @@ class LiveMonitor:
         return []
 
     def _get_most_recent_session(self, base_path: str) -> Optional[SessionData]:
-        """Get most recent session using data source or FileProcessor."""
+        """Get most recent session using data source or FileProcessor.
+
+        If the session has not changed since it was cached, the cached copy
+        is returned, so values derived from it (cost, latest file, burn rate
+        inputs) are computed once and shared between callers.
+        """
         if self._data_source:
             sessions = self._data_source.load_all_sessions(base_path, limit=1)
-            return sessions[0] if sessions else None
-        return self._get_most_recent_session(base_path)
+            session = sessions[0] if sessions else None
+        else:
+            session = FileProcessor.get_most_recent_session(base_path)
+        if session is None:
+            return None
+
+        try:
+            fingerprint = self._session_fingerprint(session.session_path)
+        except OSError:
+            return session
+        # A fresh load is not cached itself: it may predate the fingerprint
+        cached = self._get_unchanged_session(str(session.session_path), fingerprint)
+        return cached if cached is not None else session
 
     def _handle_keypress(self) -> bool:
-        """Handle keyboard input. Returns True if should continue, False to quit."""
-        key = get_key()
-        if key is None:
-            return True
+        """Handle all pending keyboard input.
 
+        Returns:
+            True if should continue, False to quit
+        """
+        while True:
+            key = get_key()
+            if key is None:
+                return True
+            if not self._dispatch_key(key):
+                return False
+
+    def _dispatch_key(self, key: str) -> bool:
+        """Apply a single keypress. Returns True if should continue, False to quit."""
         # Q - Quit
         if key == "q":
             self._should_quit = True
@@ -243,8 +712,36 @@ class LiveMonitor:
 
         return True
 
+    def _refresh_wait(self, last_update: float) -> float:
+        """Seconds until the next scheduled refresh.
+
+        Args:
+            last_update: time.monotonic() of the last refresh
+
+        Returns:
+            Seconds to wait; a full interval while paused, since only a
+            keypress can resume
+        """
+        if self._paused:
+            return float(self._refresh_interval)
+        return max(0.0, last_update + self._refresh_interval - time.monotonic())
+
     def _get_keybindings_help(self) -> str:
-        """Return keybindings help text."""
+        """Return keybindings help text.
+
+        The text only depends on a few UI settings, so it is rebuilt only
+        when one of them changes.
+        """
+        state = (
+            self._paused,
+            self._refresh_interval,
+            self._selected_provider_filter,
+            self._view_mode,
+        )
+        cached = self._keybindings_help_cache
+        if cached is not None and cached[0] == state:
+            return cached[1]
+
         status = (
             "[yellow]PAUSED[/yellow]"
             if self._paused
@@ -255,7 +752,7 @@ class LiveMonitor:
             if self._selected_provider_filter
             else "[dim]all[/dim]"
         )
-        return (
+        help_text = (
             f"[dim]Q[/dim] Quit  "
             f"[dim]R[/dim] Refresh  "
             f"[dim]V[/dim] View:{self._view_mode}  "
@@ -266,6 +763,8 @@ class LiveMonitor:
             f"[dim]J/K[/dim] Nav  "
             f"[dim]?[/dim] Help"
         )
+        self._keybindings_help_cache = (state, help_text)
+        return help_text
 
     def start_monitoring(
         self,
@@ -328,14 +827,15 @@ class LiveMonitor:
                 console=self.console,
                 transient=False,  # Keep output visible
             ) as live:
-                last_update = 0.0
+                # The initial dashboard was just rendered by Live()
+                last_update = time.monotonic()
                 while not self._should_quit:
                     # Handle keyboard input
                     if not self._handle_keypress():
                         break
 
                     # Update display if not paused and interval elapsed (or force refresh)
-                    current_time = time.time()
+                    current_time = time.monotonic()
                     if self._force_refresh or (
                         not self._paused
                         and current_time - last_update >= self._refresh_interval
@@ -363,11 +863,18 @@ class LiveMonitor:
                         last_update = current_time
                         self._force_refresh = False
 
-                    # Small sleep to prevent CPU spinning
-                    time.sleep(0.1)
+                    # Sleep until the next refresh is due; a keypress wakes us early
+                    key = _wait_for_key(self._refresh_wait(last_update))
+                    if key is not None and not self._dispatch_key(key):
+                        break
 
         except KeyboardInterrupt:
             pass  # Clean exit
+        finally:
+            _stop_keyboard_listener()
+            if self._session_load_pool is not None:
+                self._session_load_pool.shutdown(wait=True)
+                self._session_load_pool = None
 
     def _start_aggregate_monitoring(self, base_path: str, refresh_interval: int = 10):
         """Start aggregate monitoring across all projects.
@@ -387,24 +894,242 @@ class LiveMonitor:
             console=self.console,
             screen=True,  # Use alternate screen buffer (no flicker)
         ) as live:
-            last_update = 0.0
+            # The initial dashboard was just rendered by Live()
+            last_update = time.monotonic()
             while not self._should_quit:
                 # Handle keyboard input
                 if not self._handle_keypress():
                     break
 
                 # Update display if not paused and interval elapsed (or force refresh)
-                current_time = time.time()
+                current_time = time.monotonic()
                 if self._force_refresh or (
                     not self._paused
                     and current_time - last_update >= self._refresh_interval
                 ):
+                    self._tick_count += 1
                     live.update(self._generate_aggregate_dashboard(base_path))
                     last_update = current_time
                     self._force_refresh = False
 
-                # Small sleep to prevent CPU spinning
-                time.sleep(0.1)
+                # Sleep until the next refresh is due; a keypress wakes us early
+                key = _wait_for_key(self._refresh_wait(last_update))
+                if key is not None and not self._dispatch_key(key):
+                    break
+
+    def _derive_file_stats(self, file: InteractionFile) -> tuple:
+        """Compute the per-file values the aggregate dashboard needs.
+
+        Args:
+            file: Interaction file
+
+        Returns:
+            Tuple of (file, modification_time, cost in pico-dollars, tokens,
+            provider_id, hierarchy_provider, model_name, agent_name,
+            category_name, mtime), where tokens is (input, output,
+            cache_write, cache_read) and mtime is modification_time as a
+            POSIX timestamp for cheap comparisons
+        """
+        # Extract provider from model_id; the hierarchy prefers
+        # file.provider_id when available
+        provider_id, model_name = _parse_model_id(file.model_id)
+        tokens = file.tokens
+        modification_time = file.modification_time
+
+        return (
+            file,
+            modification_time,
+            file.calculate_cost_pico(self.pricing_data),
+            (tokens.input, tokens.output, tokens.cache_write, tokens.cache_read),
+            provider_id,
+            file.provider_id or provider_id,
+            model_name,
+            file.agent or "unknown",
+            file.category or "unknown",
+            modification_time.timestamp() if modification_time else -1.0,
+        )
+
+    def _get_file_stats_entry(
+        self, session: SessionData
+    ) -> Tuple[
+        SessionData,
+        List[tuple],
+        Dict[int, List[tuple]],
+        float,
+        Optional[InteractionFile],
+    ]:
+        """Get derived per-file stats, computed once per loaded session.
+
+        Sessions are only re-parsed when they change on disk, so the stats
+        stay valid for as long as the same SessionData is returned.
+
+        Args:
+            session: Session to get stats for
+
+        Returns:
+            Tuple of (session, _derive_file_stats rows in file order, the
+            same rows grouped by modification day ordinal, newest mtime,
+            most recently modified file or None if there are no files)
+        """
+        key = str(session.session_path)
+        cached = self._file_stats_cache.get(key)
+        if cached is not None and cached[0] is session:
+            return cached
+
+        rows = [self._derive_file_stats(file) for file in session.files]
+        rows_by_day: Dict[int, List[tuple]] = {}
+        for row in rows:
+            if row[1]:
+                rows_by_day.setdefault(row[1].toordinal(), []).append(row)
+        latest_ts = max(map(itemgetter(9), rows), default=-1.0)
+        latest_file = max(rows, key=itemgetter(1))[0] if rows else None
+
+        entry = (session, rows, rows_by_day, latest_ts, latest_file)
+        self._file_stats_cache.pop(key, None)
+        self._file_stats_cache[key] = entry
+        if len(self._file_stats_cache) > _SESSION_CACHE_SIZE:
+            del self._file_stats_cache[next(iter(self._file_stats_cache))]
+        return entry
+
+    def _summarize_session(
+        self, session: SessionData, day: int
+    ) -> Optional[Dict[str, Any]]:
+        """Sum up a session's files from one day for the aggregate dashboard.
+
+        Args:
+            session: Session to summarize
+            day: Proleptic ordinal of the day (date.toordinal()); only files
+                modified on this day are counted
+
+        Returns:
+            Summary dict, or None if the session has no files from that day.
+            Keys are kept in the order files first use them so that merging
+            summaries in session order matches a file-by-file aggregation.
+        """
+        # Rows are grouped by day when the session is loaded, so no per-file
+        # filter pass is needed here
+        rows = self._get_file_stats_entry(session)[2].get(day)
+        if not rows:
+            return None
+
+        # Column-wise sums run in C rather than one += per file and field
+        # (input, output, cache_write, cache_read)
+        tokens = [sum(column) for column in zip(*map(itemgetter(3), rows))]
+        cost = sum(map(itemgetter(2), rows))  # pico-dollars
+        providers: Dict[str, List[int]] = {}  # provider -> [requests, tokens, cost]
+        hierarchy: Dict[Tuple[str, str, str, str], List[int]] = {}
+        latest_time: Optional[datetime] = None
+        latest_ts = -1.0
+        latest_model: Optional[str] = None
+        recent: List[Tuple[datetime, InteractionFile]] = []
+
+        for (
+            file,
+            modification_time,
+            file_cost,
+            file_tokens,
+            provider_id,
+            hierarchy_provider,
+            model_name,
+            agent_name,
+            category_name,
+            mtime,
+        ) in rows:
+            usage = providers.get(provider_id)
+            if usage is None:
+                usage = providers[provider_id] = [0, 0, 0]
+            usage[0] += 1
+            usage[1] += sum(file_tokens)
+            usage[2] += file_cost
+
+            leaf_key = (hierarchy_provider, model_name, agent_name, category_name)
+            leaf = hierarchy.get(leaf_key)
+            if leaf is None:
+                leaf = hierarchy[leaf_key] = [0, 0]
+            leaf[0] += 1
+            leaf[1] += file_cost
+
+            if mtime > latest_ts:
+                latest_ts = mtime
+                latest_time = modification_time
+                latest_model = model_name
+
+            recent.append((modification_time, file))
+
+        # The dashboard only ever shows the four most recent files
+        recent = heapq.nlargest(4, recent, key=itemgetter(0))
+        return {
+            "interactions": len(rows),
+            "tokens": tokens,
+            "cost": cost,
+            "providers": providers,
+            "hierarchy": hierarchy,
+            "latest_time": latest_time,
+            "latest_ts": latest_ts,
+            "latest_model": latest_model,
+            "recent": recent,
+        }
+
+    def _session_latest_ts(self, session: SessionData) -> float:
+        """Get the newest file modification timestamp in a session.
+
+        Uses the value cached with the loaded session's file stats instead
+        of stat'ing every file again.
+        """
+        return self._get_file_stats_entry(session)[3]
+
+    def _session_latest_file(self, session: SessionData) -> Optional[InteractionFile]:
+        """Get the most recently modified file of a session.
+
+        Uses the value cached with the loaded session's file stats, so each
+        call is O(1) instead of stat'ing every file.
+        """
+        return self._get_file_stats_entry(session)[4]
+
+    def _get_session_summary(
+        self, session: SessionData, day: int
+    ) -> Optional[Dict[str, Any]]:
+        """Get a session's daily summary, recomputed only when it changes.
+
+        Args:
+            session: Session to summarize
+            day: Ordinal of the day to summarize
+
+        Returns:
+            Summary from _summarize_session, or None if nothing happened that day
+        """
+        key = str(session.session_path)
+        cached = self._session_summary_cache.get(key)
+        if cached is not None and cached[0] is session and cached[1] == day:
+            return cached[2]
+
+        summary = self._summarize_session(session, day)
+        self._session_summary_cache.pop(key, None)
+        self._session_summary_cache[key] = (session, day, summary)
+        if len(self._session_summary_cache) > _SESSION_CACHE_SIZE:
+            del self._session_summary_cache[next(iter(self._session_summary_cache))]
+        return summary
+
+    def _session_total_cost(self, session: SessionData) -> Decimal:
+        """Get a session's total cost, recomputed only when it is reloaded.
+
+        Args:
+            session: Session to price
+
+        Returns:
+            Total cost of the session's files
+        """
+        key = str(session.session_path)
+        cached = self._session_cost_cache.get(key)
+        if cached is not None and cached[0] is session:
+            return cached[1]
+
+        total_cost = session.calculate_total_cost(self.pricing_data)
+        self._session_cost_cache.pop(key, None)
+        self._session_cost_cache[key] = (session, total_cost)
+        if len(self._session_cost_cache) > _SESSION_CACHE_SIZE:
+            del self._session_cost_cache[next(iter(self._session_cost_cache))]
+        return total_cost
 
     def _generate_aggregate_dashboard(self, base_path: str) -> Layout:
         """Generate aggregate dashboard with Control Tower design.
@@ -421,137 +1146,45 @@ class LiveMonitor:
         Returns:
             Rich layout for aggregate dashboard
         """
-        today = datetime.now().date()
+        # One clock read per refresh; days are compared as ordinals so the
+        # per-file filter does not allocate a date object per file
         now = datetime.now()
-        session_dirs = self._find_sessions(base_path)
-
-        # Aggregate stats by project AND by provider
-        project_stats: Dict[str, Dict[str, Any]] = defaultdict(
-            lambda: {
-                "sessions": 0,
-                "interactions": 0,
-                "tokens": TokenUsage(),
-                "cost": Decimal("0.0"),
-                "latest_time": None,
-                "latest_model": None,
-                "cache_rate": 0.0,
-            }
-        )
-
-        # Provider usage tracking (for limits display)
-        provider_usage: Dict[str, Dict[str, Any]] = defaultdict(
-            lambda: {
-                "requests": 0,
-                "tokens": 0,
-                "cost": Decimal("0.0"),
-            }
-        )
-
-        # Hierarchical usage tracking: provider -> model -> agent -> category
-        # Structure: {provider: {model: {agent: {category: {"requests": N, "cost": D}}}}}
-        usage_hierarchy: Dict[str, Dict[str, Dict[str, Dict[str, Dict[str, Any]]]]] = (
-            defaultdict(
-                lambda: defaultdict(
-                    lambda: defaultdict(
-                        lambda: defaultdict(
-                            lambda: {"requests": 0, "cost": Decimal("0.0")}
-                        )
-                    )
-                )
-            )
-        )
-
-        total_tokens = TokenUsage()
-        total_cost = Decimal("0.0")
-        total_sessions = 0
-        total_interactions = 0
-        recent_files: List[tuple] = []
-
-        for session_dir in session_dirs:
-            session = self._load_session(session_dir)
+        today = now.toordinal()
+        day_start = now.replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+
+        # The listing is only re-read when the base directory changed (or on
+        # demand); unchanged sessions are served from the load cache
+        session_dirs = self._find_sessions(base_path, refresh=self._force_refresh)
+
+        # Collect the daily summary of every session with activity today; a
+        # session is only re-summarized when it was reloaded from disk or the
+        # day rolled over
+        active: List[Tuple[str, Dict[str, Any]]] = []
+        for session in self._load_sessions_modified_since(session_dirs, day_start):
             if not session or not session.files:
                 continue
 
-            # Filter to today's files only
-            today_files = [
-                f
-                for f in session.files
-                if f.modification_time and f.modification_time.date() == today
-            ]
-
-            if not today_files:
-                continue
-
-            project_name = session.project_name
-            stats = project_stats[project_name]
-
-            stats["sessions"] += 1
-            stats["interactions"] += len(today_files)
-            total_sessions += 1
-            total_interactions += len(today_files)
-
-            for file in today_files:
-                # Aggregate tokens
-                stats["tokens"].input += file.tokens.input
-                stats["tokens"].output += file.tokens.output
-                stats["tokens"].cache_write += file.tokens.cache_write
-                stats["tokens"].cache_read += file.tokens.cache_read
-
-                total_tokens.input += file.tokens.input
-                total_tokens.output += file.tokens.output
-                total_tokens.cache_write += file.tokens.cache_write
-                total_tokens.cache_read += file.tokens.cache_read
-
-                # Calculate cost
-                file_cost = file.calculate_cost(self.pricing_data)
-                stats["cost"] += file_cost
-                total_cost += file_cost
-
-                # Track provider usage (extract provider from model_id)
-                provider_id = (
-                    file.model_id.split("/")[0] if "/" in file.model_id else "unknown"
-                )
-                provider_usage[provider_id]["requests"] += 1
-                provider_usage[provider_id]["tokens"] += file.tokens.total
-                provider_usage[provider_id]["cost"] += file_cost
-
-                # Track hierarchical usage: provider -> model -> agent -> category
-                # Use file.provider_id if available, otherwise parse from model_id
-                hierarchy_provider = file.provider_id or provider_id
-                model_name = (
-                    file.model_id.split("/")[-1]
-                    if "/" in file.model_id
-                    else file.model_id
-                )
-                agent_name = file.agent or "unknown"
-                category_name = file.category or "unknown"
-                usage_hierarchy[hierarchy_provider][model_name][agent_name][
-                    category_name
-                ]["requests"] += 1
-                usage_hierarchy[hierarchy_provider][model_name][agent_name][
-                    category_name
-                ]["cost"] += file_cost
-
-                # Track latest activity
-                if (
-                    stats["latest_time"] is None
-                    or file.modification_time > stats["latest_time"]
-                ):
-                    stats["latest_time"] = file.modification_time
-                    stats["latest_model"] = (
-                        file.model_id.split("/")[-1]
-                        if "/" in file.model_id
-                        else file.model_id
-                    )
+            summary = self._get_session_summary(session, today)
+            if summary is not None:
+                active.append((session.project_name, summary))
 
-                recent_files.append((project_name, file, session))
-
-            # Calculate cache rate
-            total_input = stats["tokens"].input + stats["tokens"].cache_read
-            if total_input > 0:
-                stats["cache_rate"] = (stats["tokens"].cache_read / total_input) * 100
-
-        recent_files.sort(key=lambda x: x[1].modification_time, reverse=True)
+        # Summaries are cached objects, so comparing them (identity first)
+        # tells whether anything the dashboard shows has changed
+        data_key = (today, tuple(active))
+        if self._aggregate_cache is not None and self._aggregate_cache[0] == data_key:
+            aggregate = self._aggregate_cache[1]
+        else:
+            aggregate = self._merge_session_summaries(active)
+            self._aggregate_cache = (data_key, aggregate)
+        (
+            project_stats,
+            provider_usage,
+            usage_hierarchy,
+            total_cost,
+            total_sessions,
+            total_interactions,
+            recent_files,
+        ) = aggregate
 
         # ═══════════════════════════════════════════════════════════════════════
         # BUILD LAYOUT - "Control Tower" Design
@@ -588,79 +1221,290 @@ class LiveMonitor:
             f"[dim]|[/dim]  {status}  "
             f"[dim]|[/dim]  [dim]{current_time}[/dim]"
         )
-        header = Panel(header_text, border_style="cyan", padding=(0, 1))
+        header = self._reuse_panel(
+            "header",
+            header_text,
+            lambda: Panel(
+                self._render_markup(header_text), border_style="cyan", padding=(0, 1)
+            ),
+        )
+
+        # Panels below are rebuilt only when their inputs change; the ones
+        # showing "time ago" labels also key on those labels
+        providers_panel = self._reuse_panel(
+            "providers",
+            (data_key, self.limits_config),
+            lambda: self._build_providers_panel(provider_usage),
+        )
 
+        # heapq.nlargest keeps ties in order, like a stable reversed sort
+        sorted_projects = heapq.nlargest(
+            6, project_stats.items(), key=lambda x: x[1]["cost"]
+        )  # Max 6 projects
+        project_labels = tuple(
+            _project_activity_label(now, stats["latest_time"])
+            for _, stats in sorted_projects
+        )
+        projects_panel = self._reuse_panel(
+            "projects",
+            (data_key, project_labels),
+            lambda: self._build_projects_panel(sorted_projects, project_labels),
+        )
+
+        stream_labels = tuple(
+            _stream_time_label(now, modification_time)
+            for modification_time, _, _ in recent_files
+        )
+        stream_panel = self._reuse_panel(
+            "stream",
+            (data_key, stream_labels),
+            lambda: self._build_stream_panel(recent_files, stream_labels),
+        )
+
+        breakdown_panel = self._reuse_panel(
+            "breakdown",
+            data_key,
+            lambda: self._build_breakdown_panel(usage_hierarchy),
+        )
+
+        # ─────────────────────────────────────────────────────────────────────
+        # FOOTER - Keybindings help
         # ─────────────────────────────────────────────────────────────────────
-        # PROVIDER LIMITS SECTION
+        footer_text = self._get_keybindings_help()
+        footer = self._reuse_panel(
+            "footer",
+            footer_text,
+            lambda: Panel(
+                self._render_markup(footer_text), border_style="dim", padding=(0, 1)
+            ),
+        )
+
         # ─────────────────────────────────────────────────────────────────────
+        # ASSEMBLE LAYOUT
+        # ─────────────────────────────────────────────────────────────────────
+        layout.split_column(
+            Layout(header, size=3),
+            Layout(providers_panel, size=7),
+            Layout(name="middle", ratio=1),
+            Layout(stream_panel, size=6),
+            Layout(footer, size=3),
+        )
+
+        # Middle section: Projects + Breakdown side by side
+        layout["middle"].split_row(
+            Layout(projects_panel, ratio=2),
+            Layout(breakdown_panel, ratio=1),
+        )
+
+        return layout
+
+    def _merge_session_summaries(
+        self, active: List[Tuple[str, Dict[str, Any]]]
+    ) -> tuple:
+        """Merge daily session summaries into the aggregate dashboard data.
+
+        Args:
+            active: (project name, summary) pairs in session order
+
+        Returns:
+            Tuple of (project_stats, provider_usage, usage_hierarchy,
+            total_cost, total_sessions, total_interactions, recent_files),
+            where recent_files holds the four most recent files.
+            Project and provider costs are Decimal; hierarchy costs stay in
+            pico-dollars.
+        """
+        # Aggregate stats by project AND by provider
+        project_stats: Dict[str, Dict[str, Any]] = defaultdict(_new_project_stats)
+
+        # Provider usage tracking (for limits display)
+        provider_usage: Dict[str, Dict[str, Any]] = defaultdict(_new_provider_usage)
+
+        # Hierarchical usage tracking: provider -> model -> agent -> category
+        # Structure: {provider: {model: {agent: {category: {"requests": N, "cost": P}}}}}
+        # (costs stay in pico-dollars, the totals helpers convert them)
+        usage_hierarchy: Dict[str, Dict[str, Dict[str, Dict[str, Dict[str, Any]]]]] = (
+            defaultdict(_new_model_usage)
+        )
+
+        total_cost = 0  # pico-dollars
+        total_sessions = 0
+        total_interactions = 0
+        recent_files: List[Tuple[datetime, str, InteractionFile]] = []
+
+        for project_name, summary in active:
+            stats = project_stats[project_name]
+
+            stats["sessions"] += 1
+            stats["interactions"] += summary["interactions"]
+            total_sessions += 1
+            total_interactions += summary["interactions"]
+
+            # Aggregate tokens
+            input_tokens, output_tokens, cache_write, cache_read = summary["tokens"]
+            stats["tokens"].input += input_tokens
+            stats["tokens"].output += output_tokens
+            stats["tokens"].cache_write += cache_write
+            stats["tokens"].cache_read += cache_read
+
+            # Add cost
+            stats["cost"] += summary["cost"]
+            total_cost += summary["cost"]
+
+            # Track provider usage
+            for provider_id, (requests, tokens, cost) in summary["providers"].items():
+                usage = provider_usage[provider_id]
+                usage["requests"] += requests
+                usage["tokens"] += tokens
+                usage["cost"] += cost
+
+            # Track hierarchical usage: provider -> model -> agent -> category
+            for (
+                hierarchy_provider,
+                model_name,
+                agent_name,
+                category_name,
+            ), (requests, cost) in summary["hierarchy"].items():
+                leaf = usage_hierarchy[hierarchy_provider][model_name][agent_name][
+                    category_name
+                ]
+                leaf["requests"] += requests
+                leaf["cost"] += cost
+
+            # Track latest activity
+            if summary["latest_ts"] > stats["latest_ts"]:
+                stats["latest_ts"] = summary["latest_ts"]
+                stats["latest_time"] = summary["latest_time"]
+                stats["latest_model"] = summary["latest_model"]
+
+            recent_files.extend(
+                (modification_time, project_name, file)
+                for modification_time, file in summary["recent"]
+            )
+
+        # Calculate cache rate
+        for stats in project_stats.values():
+            total_input = stats["tokens"].input + stats["tokens"].cache_read
+            if total_input > 0:
+                stats["cache_rate"] = (stats["tokens"].cache_read / total_input) * 100
+
+        recent_files = heapq.nlargest(4, recent_files, key=itemgetter(0))
+
+        # Costs were summed as integer pico-dollars; convert once for display
+        total_cost = pico_dollars_to_decimal(total_cost)
+        for stats in project_stats.values():
+            stats["cost"] = pico_dollars_to_decimal(stats["cost"])
+        for usage in provider_usage.values():
+            usage["cost"] = pico_dollars_to_decimal(usage["cost"])
+
+        return (
+            project_stats,
+            provider_usage,
+            usage_hierarchy,
+            total_cost,
+            total_sessions,
+            total_interactions,
+            recent_files,
+        )
+
+    def _reuse_panel(self, name: str, key: Any, build: Callable[[], Panel]) -> Panel:
+        """Return the panel built last time when its inputs are unchanged.
+
+        Args:
+            name: Panel slot in the dashboard
+            key: Fingerprint of everything the panel displays
+            build: Builds the panel on a cache miss
+
+        Returns:
+            Cached or newly built panel
+        """
+        cached = self._panel_cache.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        panel = build()
+        self._panel_cache[name] = (key, panel)
+        return panel
+
+    def _render_markup(self, markup: str) -> Text:
+        """Parse Rich markup into Text up front.
+
+        Live redraws several times a second and would re-parse markup
+        strings on every redraw; cached panels hold parsed Text instead.
+
+        Args:
+            markup: Rich markup string
+
+        Returns:
+            Text styled exactly as the string would be when rendered
+        """
+        # Strings inside renderables are rendered without highlighting
+        return self.console.render_str(markup, highlight=False)
+
+    def _build_providers_panel(
+        self, provider_usage: Dict[str, Dict[str, Any]]
+    ) -> Panel:
+        """Build the provider limits section of the aggregate dashboard."""
         provider_cards = []
 
         if self.limits_config and self.limits_config.providers:
             for provider in self.limits_config.providers[:4]:  # Max 4 providers
                 usage = provider_usage.get(
                     provider.provider_id,
-                    {"requests": 0, "tokens": 0, "cost": Decimal("0.0")},
+                    {"requests": 0, "tokens": 0, "cost": DECIMAL_ZERO},
                 )
                 card_text = self._create_provider_card(provider, usage)
                 provider_cards.append(
                     Panel(
-                        card_text,
+                        self._render_markup(card_text),
                         title=provider.display_name or provider.provider_id,
                         border_style="dim",
                     )
                 )
         else:
             # No limits configured - show basic provider stats
-            for provider_id, usage in sorted(
-                provider_usage.items(), key=lambda x: x[1]["cost"], reverse=True
-            )[:4]:
+            for provider_id, usage in heapq.nlargest(
+                4, provider_usage.items(), key=lambda x: x[1]["cost"]
+            ):
                 card_text = (
                     f"[dim]Requests:[/dim] [white]{usage['requests']:,}[/white]\n"
                     f"[dim]Tokens:[/dim] [white]{usage['tokens']:,}[/white]\n"
                     f"[dim]Cost:[/dim] [green]${usage['cost']:.2f}[/green]"
                 )
                 provider_cards.append(
-                    Panel(card_text, title=provider_id, border_style="dim")
+                    Panel(
+                        self._render_markup(card_text),
+                        title=provider_id,
+                        border_style="dim",
+                    )
                 )
 
         if provider_cards:
-            providers_panel = Panel(
+            return Panel(
                 Columns(provider_cards, equal=True, expand=True),
                 title="[bold]Provider Limits[/bold]",
                 border_style="blue",
             )
-        else:
-            providers_panel = Panel(
-                "[dim]No provider data[/dim]",
-                title="Provider Limits",
-                border_style="dim",
-            )
-
-        # ─────────────────────────────────────────────────────────────────────
-        # PROJECT CARDS SECTION
-        # ─────────────────────────────────────────────────────────────────────
-        project_cards = []
-        sorted_projects = sorted(
-            project_stats.items(), key=lambda x: x[1]["cost"], reverse=True
+        return Panel(
+            "[dim]No provider data[/dim]",
+            title="Provider Limits",
+            border_style="dim",
         )
 
-        for project_name, stats in sorted_projects[:6]:  # Max 6 projects
-            # Status indicator based on last activity
-            if stats["latest_time"]:
-                delta = now - stats["latest_time"]
-                if delta.total_seconds() < 60:
-                    status_icon = "[green]●[/green]"
-                    time_ago = f"{int(delta.total_seconds())}s"
-                elif delta.total_seconds() < 600:
-                    status_icon = "[yellow]●[/yellow]"
-                    time_ago = f"{int(delta.total_seconds() / 60)}m"
-                else:
-                    status_icon = "[red]●[/red]"
-                    time_ago = f"{int(delta.total_seconds() / 60)}m"
-            else:
-                status_icon = "[dim]○[/dim]"
-                time_ago = "--"
+    def _build_projects_panel(
+        self,
+        sorted_projects: List[Tuple[str, Dict[str, Any]]],
+        labels: Tuple[Tuple[str, str], ...],
+    ) -> Panel:
+        """Build the project cards section of the aggregate dashboard.
 
+        Args:
+            sorted_projects: (project name, stats) pairs to show, in order
+            labels: (status icon, time ago) for each project
+        """
+        project_cards = []
+
+        for (project_name, stats), (status_icon, time_ago) in zip(
+            sorted_projects, labels
+        ):
             # Truncate project name
             display_name = (
                 project_name[:18] + ".." if len(project_name) > 20 else project_name
@@ -680,42 +1524,41 @@ class LiveMonitor:
 
             project_cards.append(
                 Panel(
-                    "\n".join(card_lines), title=display_name, border_style="dim cyan"
+                    self._render_markup("\n".join(card_lines)),
+                    title=display_name,
+                    border_style="dim cyan",
                 )
             )
 
         if project_cards:
-            projects_panel = Panel(
+            return Panel(
                 Columns(project_cards, equal=True, expand=True),
                 title="[bold]Active Projects[/bold]",
                 border_style="cyan",
             )
-        else:
-            projects_panel = Panel(
-                "[dim]No active projects today[/dim]",
-                title="Active Projects",
-                border_style="dim",
-            )
+        return Panel(
+            "[dim]No active projects today[/dim]",
+            title="Active Projects",
+            border_style="dim",
+        )
 
-        # ─────────────────────────────────────────────────────────────────────
-        # LIVE STREAM SECTION
-        # ─────────────────────────────────────────────────────────────────────
-        stream_lines = []
-        for project_name, file, session in recent_files[:4]:
-            time_ago = now - file.modification_time
-            if time_ago.total_seconds() < 60:
-                time_str = f"{int(time_ago.total_seconds()):>3}s"
-            else:
-                time_str = f"{int(time_ago.total_seconds() / 60):>3}m"
+    def _build_stream_panel(
+        self,
+        recent_files: List[Tuple[datetime, str, InteractionFile]],
+        labels: Tuple[str, ...],
+    ) -> Panel:
+        """Build the live stream section of the aggregate dashboard.
 
+        Args:
+            recent_files: (modification time, project name, file) to show
+            labels: Time-ago label for each file
+        """
+        stream_lines = []
+        for (_, project_name, file), time_str in zip(recent_files, labels):
             short_project = (
                 project_name[:12] + ".." if len(project_name) > 14 else project_name
             )
-            model_short = (
-                file.model_id.split("/")[-1][:12]
-                if "/" in file.model_id
-                else file.model_id[:12]
-            )
+            model_short = _parse_model_id(file.model_id)[1][:12]
 
             stream_lines.append(
                 f"[dim]{time_str}[/dim] [cyan]{short_project:<14}[/cyan] "
@@ -726,123 +1569,87 @@ class LiveMonitor:
         stream_text = (
             "\n".join(stream_lines) if stream_lines else "[dim]No recent activity[/dim]"
         )
-        stream_panel = Panel(stream_text, title="Live Stream", border_style="dim")
+        return Panel(
+            self._render_markup(stream_text), title="Live Stream", border_style="dim"
+        )
 
-        # ─────────────────────────────────────────────────────────────────────
-        # USAGE BREAKDOWN TREE (full hierarchy: provider -> model -> agent -> category)
-        # ─────────────────────────────────────────────────────────────────────
+    def _build_breakdown_panel(self, usage_hierarchy: Dict[str, Any]) -> Panel:
+        """Build the usage breakdown tree (provider -> model -> agent -> category)."""
         usage_tree = Tree("[bold]Usage Breakdown[/bold]")
 
         if not usage_hierarchy:
             usage_tree.add("[dim]No data[/dim]")
         else:
-            # Calculate totals for sorting
-            def calc_provider_totals(provider_data: dict) -> tuple:
-                total_cost = Decimal("0.0")
-                total_reqs = 0
-                for model_data in provider_data.values():
-                    for agent_data in model_data.values():
-                        for cat_stats in agent_data.values():
-                            total_cost += cat_stats["cost"]
-                            total_reqs += cat_stats["requests"]
-                return total_cost, total_reqs
-
-            def calc_model_totals(model_data: dict) -> tuple:
-                total_cost = Decimal("0.0")
-                total_reqs = 0
-                for agent_data in model_data.values():
-                    for cat_stats in agent_data.values():
-                        total_cost += cat_stats["cost"]
-                        total_reqs += cat_stats["requests"]
-                return total_cost, total_reqs
-
-            def calc_agent_totals(agent_data: dict) -> tuple:
-                total_cost = Decimal("0.0")
-                total_reqs = 0
-                for cat_stats in agent_data.values():
-                    total_cost += cat_stats["cost"]
-                    total_reqs += cat_stats["requests"]
-                return total_cost, total_reqs
-
+            # Sum each level once; the totals serve as sort key and label
+            provider_totals = {
+                provider_id: _provider_totals(models_data)
+                for provider_id, models_data in usage_hierarchy.items()
+            }
             # Sort providers by cost
-            sorted_providers = sorted(
-                usage_hierarchy.items(),
-                key=lambda x: calc_provider_totals(x[1])[0],
-                reverse=True,
+            sorted_providers = heapq.nlargest(
+                3, provider_totals, key=lambda x: provider_totals[x][0]
             )
 
-            for provider_id, models_data in sorted_providers[:3]:
-                p_cost, p_reqs = calc_provider_totals(models_data)
+            for provider_id in sorted_providers:
+                models_data = usage_hierarchy[provider_id]
+                p_cost, p_reqs = provider_totals[provider_id]
                 provider_branch = usage_tree.add(
-                    f"[cyan]{provider_id}[/cyan] [dim]({p_reqs} req, [green]${p_cost:.2f}[/green])[/dim]"
+                    self._render_markup(
+                        f"[cyan]{provider_id}[/cyan] [dim]({p_reqs} req, [green]${p_cost:.2f}[/green])[/dim]"
+                    )
                 )
 
                 # Sort models by cost
-                sorted_models = sorted(
-                    models_data.items(),
-                    key=lambda x: calc_model_totals(x[1])[0],
-                    reverse=True,
+                model_totals = {
+                    model_name: _model_totals(agents_data)
+                    for model_name, agents_data in models_data.items()
+                }
+                sorted_models = heapq.nlargest(
+                    2, model_totals, key=lambda x: model_totals[x][0]
                 )
 
-                for model_name, agents_data in sorted_models[:2]:
-                    m_cost, m_reqs = calc_model_totals(agents_data)
+                for model_name in sorted_models:
+                    agents_data = models_data[model_name]
+                    m_cost, m_reqs = model_totals[model_name]
                     model_branch = provider_branch.add(
-                        f"[white]{model_name[:20]}[/white] [dim]({m_reqs} req, [green]${m_cost:.2f}[/green])[/dim]"
+                        self._render_markup(
+                            f"[white]{model_name[:20]}[/white] [dim]({m_reqs} req, [green]${m_cost:.2f}[/green])[/dim]"
+                        )
                     )
 
                     # Sort agents by requests
-                    sorted_agents = sorted(
-                        agents_data.items(),
-                        key=lambda x: calc_agent_totals(x[1])[1],
-                        reverse=True,
+                    agent_totals = {
+                        agent_name: _agent_totals(categories_data)
+                        for agent_name, categories_data in agents_data.items()
+                    }
+                    sorted_agents = heapq.nlargest(
+                        3, agent_totals, key=lambda x: agent_totals[x][1]
                     )
 
-                    for agent_name, categories_data in sorted_agents[:3]:
-                        a_cost, a_reqs = calc_agent_totals(categories_data)
+                    for agent_name in sorted_agents:
+                        categories_data = agents_data[agent_name]
+                        a_reqs = agent_totals[agent_name][1]
                         agent_branch = model_branch.add(
-                            f"[magenta]{agent_name}[/magenta] [dim]({a_reqs} req)[/dim]"
+                            self._render_markup(
+                                f"[magenta]{agent_name}[/magenta] [dim]({a_reqs} req)[/dim]"
+                            )
                         )
 
                         # Sort categories by requests
-                        sorted_categories = sorted(
+                        sorted_categories = heapq.nlargest(
+                            4,
                             categories_data.items(),
                             key=lambda x: x[1]["requests"],
-                            reverse=True,
                         )
 
-                        for cat_name, cat_stats in sorted_categories[:4]:
+                        for cat_name, cat_stats in sorted_categories:
                             agent_branch.add(
-                                f"[yellow]{cat_name}[/yellow]: {cat_stats['requests']} req"
+                                self._render_markup(
+                                    f"[yellow]{cat_name}[/yellow]: {cat_stats['requests']} req"
+                                )
                             )
 
-        breakdown_panel = Panel(
-            usage_tree, title="Breakdown", border_style="dim magenta"
-        )
-
-        # ─────────────────────────────────────────────────────────────────────
-        # FOOTER - Keybindings help
-        # ─────────────────────────────────────────────────────────────────────
-        footer_text = self._get_keybindings_help()
-        footer = Panel(footer_text, border_style="dim", padding=(0, 1))
-
-        # ─────────────────────────────────────────────────────────────────────
-        # ASSEMBLE LAYOUT
-        # ─────────────────────────────────────────────────────────────────────
-        layout.split_column(
-            Layout(header, size=3),
-            Layout(providers_panel, size=7),
-            Layout(name="middle", ratio=1),
-            Layout(stream_panel, size=6),
-            Layout(footer, size=3),
-        )
-
-        # Middle section: Projects + Breakdown side by side
-        layout["middle"].split_row(
-            Layout(projects_panel, ratio=2),
-            Layout(breakdown_panel, ratio=1),
-        )
-
-        return layout
+        return Panel(usage_tree, title="Breakdown", border_style="dim magenta")
 
     def _create_provider_card(
         self, provider: ProviderLimit, usage: Dict[str, Any]
@@ -880,9 +1687,7 @@ class LiveMonitor:
             return "\n".join(lines)
 
         # Create progress bar
-        bar_width = 16
-        filled = int(bar_width * pct / 100)
-        bar = "█" * filled + "░" * (bar_width - filled)
+        bar = _PROVIDER_BARS[int(_PROVIDER_BAR_WIDTH * pct / 100)]
 
         # Color based on percentage
         if pct >= 90:
@@ -906,7 +1711,7 @@ class LiveMonitor:
         """Get the most recent session, optionally filtered by project.
 
         Uses mtime caching to reduce I/O:
-        - Directory scan only every 6 ticks (~30s with 5s interval)
+        - Directory listing reused until the base directory changes
         - Session reload only if mtime changed
 
         Args:
@@ -916,66 +1721,77 @@ class LiveMonitor:
         Returns:
             Most recent session matching filter, or None
         """
-        # Determine if we need a full directory scan
-        # Scan every 6 ticks (~30 seconds) or on first call
-        needs_dir_scan = (
-            self._tick_count == 0
-            or self._tick_count - self._last_dir_scan_tick >= 6
-            or not self._session_cache
-        )
-
-        if needs_dir_scan:
-            self._last_dir_scan_tick = self._tick_count
-            session_dirs = self._find_sessions(base_path)
-        else:
-            # Use cached session paths
-            session_dirs = [Path(p) for p in self._session_cache.keys()]
-
+        session_dirs = self._find_sessions(base_path, refresh=self._force_refresh)
         if not session_dirs:
             return None
 
         project_lower = project_filter.lower() if project_filter else None
         matching_session: Optional[SessionData] = None
-        latest_time: Optional[datetime] = None
+        latest_ts = -1.0
 
         for session_dir in session_dirs:
-            session_path = str(session_dir)
-
             # Check mtime to decide if reload is needed
-            session = self._get_cached_session(session_path)
-            if not session:
+            session = self._get_cached_session(str(session_dir))
+            if not session or not session.files:
                 continue
 
-            # If no project filter, just find the most recent
-            if not project_lower:
-                if session.files:
-                    session_latest = max(f.modification_time for f in session.files)
-                    if latest_time is None or session_latest > latest_time:
-                        latest_time = session_latest
-                        matching_session = session
+            # Only a session newer than the best so far can change the result,
+            # so check that (cached, O(1)) before matching the project
+            session_latest = self._session_latest_ts(session)
+            if session_latest <= latest_ts:
                 continue
 
-            # Check if project matches (partial, case-insensitive)
-            matches = False
-            if project_lower in session.project_name.lower():
-                matches = True
-            else:
-                # Also check file paths
-                for file in session.files:
-                    if file.project_path and project_lower in file.project_path.lower():
-                        matches = True
-                        break
+            # Check if project matches (partial, case-insensitive), also
+            # checking each distinct file project path
+            if project_lower:
+                name_lower, project_paths_lower = self._session_project_keys(session)
+                if project_lower not in name_lower and not any(
+                    project_lower in project_path_lower
+                    for project_path_lower in project_paths_lower
+                ):
+                    continue
 
-            if matches:
-                # Find the latest file time in this session
-                if session.files:
-                    session_latest = max(f.modification_time for f in session.files)
-                    if latest_time is None or session_latest > latest_time:
-                        latest_time = session_latest
-                        matching_session = session
+            latest_ts = session_latest
+            matching_session = session
 
         return matching_session
 
+    def _session_project_keys(
+        self, session: SessionData
+    ) -> Tuple[str, Tuple[str, ...]]:
+        """Get the lowercased project names a project filter is matched against.
+
+        Computed once per loaded session, so filtering does not recount the
+        session's project name or lowercase every file path on each tick.
+
+        Args:
+            session: Session to match
+
+        Returns:
+            Tuple of (lowercased session project name, distinct lowercased
+            file project paths in first-seen order)
+        """
+        key = str(session.session_path)
+        cached = self._project_keys_cache.get(key)
+        if cached is not None and cached[0] is session:
+            return cached[1]
+
+        keys = (
+            session.project_name.lower(),
+            tuple(
+                dict.fromkeys(
+                    file.project_path.lower()
+                    for file in session.files
+                    if file.project_path
+                )
+            ),
+        )
+        self._project_keys_cache.pop(key, None)
+        self._project_keys_cache[key] = (session, keys)
+        if len(self._project_keys_cache) > _SESSION_CACHE_SIZE:
+            del self._project_keys_cache[next(iter(self._project_keys_cache))]
+        return keys
+
     def _get_cached_session(self, session_path: str) -> Optional[SessionData]:
         """Get session from cache, reloading only if mtime changed.
 
@@ -985,43 +1801,13 @@ class LiveMonitor:
         Returns:
             SessionData or None if loading failed
         """
-        try:
-            # Get current mtime of session directory
-            path_obj = Path(session_path)
-            if not path_obj.exists():
-                # Session was deleted, remove from cache
-                self._session_cache.pop(session_path, None)
-                self._session_mtime.pop(session_path, None)
-                return None
-
-            # Check mtime of the directory and its most recent file
-            current_mtime = path_obj.stat().st_mtime
-
-            # Also check mtime of JSON files in the directory
-            json_files = list(path_obj.glob("*.json"))
-            if json_files:
-                latest_file_mtime = max(f.stat().st_mtime for f in json_files)
-                current_mtime = max(current_mtime, latest_file_mtime)
-
-            cached_mtime = self._session_mtime.get(session_path)
-
-            # If mtime unchanged and we have cached data, return cache
-            if cached_mtime is not None and cached_mtime >= current_mtime:
-                cached_session = self._session_cache.get(session_path)
-                if cached_session:
-                    return cached_session
-
-            # Reload session
-            session = self._load_session(path_obj)
-            if session:
-                self._session_cache[session_path] = session
-                self._session_mtime[session_path] = current_mtime
-
-            return session
+        path_obj = Path(session_path)
+        if not path_obj.exists():
+            # Session was deleted, remove from cache
+            self._session_cache.pop(session_path, None)
+            return None
 
-        except (OSError, IOError):
-            # File system error, try to return cached version
-            return self._session_cache.get(session_path)
+        return self._load_session(path_obj)
 
     def _generate_dashboard(self, session: SessionData):
         """Generate dashboard layout for the session.
@@ -1033,9 +1819,7 @@ class LiveMonitor:
             Rich layout for the dashboard
         """
         # Get the most recent file
-        recent_file = None
-        if session.files:
-            recent_file = max(session.files, key=lambda f: f.modification_time)
+        recent_file = self._session_latest_file(session)
 
         # Calculate burn rate
         burn_rate = self._calculate_burn_rate(session)
@@ -1061,6 +1845,7 @@ class LiveMonitor:
             context_window=context_window,
             daily_cost=daily_cost,
             session_max_hours=self.session_max_hours,
+            total_cost=self._session_total_cost(session),
         )
 
     def _calculate_burn_rate(self, session: SessionData) -> float:
@@ -1072,24 +1857,50 @@ class LiveMonitor:
         Returns:
             Tokens per minute for the entire session
         """
-        # Get total tokens for the session
-        total_tokens = session.total_tokens.total
+        # Get total tokens and start timestamp (cached per loaded session)
+        total_tokens, start_ts = self._session_burn_inputs(session)
 
         # If no tokens, return 0
         if total_tokens == 0:
             return 0.0
 
         # Calculate session duration from start time to now
-        if session.start_time:
-            current_time = datetime.now()
-            session_duration = current_time - session.start_time
-            duration_minutes = session_duration.total_seconds() / 60
+        if start_ts is not None:
+            duration_minutes = (time.time() - start_ts) / 60
 
             if duration_minutes > 0:
                 return total_tokens / duration_minutes
 
         return 0.0
 
+    def _session_burn_inputs(self, session: SessionData) -> Tuple[int, Optional[float]]:
+        """Get the session values the burn rate is derived from.
+
+        Both scan every file of the session, so they are computed once per
+        loaded session instead of on every tick.
+
+        Args:
+            session: SessionData object
+
+        Returns:
+            Tuple of (total tokens, start time as a POSIX timestamp or None)
+        """
+        key = str(session.session_path)
+        cached = self._burn_inputs_cache.get(key)
+        if cached is not None and cached[0] is session:
+            return cached[1]
+
+        start_time = session.start_time
+        inputs = (
+            session.total_tokens.total,
+            start_time.timestamp() if start_time else None,
+        )
+        self._burn_inputs_cache.pop(key, None)
+        self._burn_inputs_cache[key] = (session, inputs)
+        if len(self._burn_inputs_cache) > _SESSION_CACHE_SIZE:
+            del self._burn_inputs_cache[next(iter(self._burn_inputs_cache))]
+        return inputs
+
     def _get_cached_daily_cost(self) -> Optional[Decimal]:
         """Get daily cost with caching (recalculate every 12 ticks ~ 1 minute).
 
@@ -1115,21 +1926,22 @@ class LiveMonitor:
         if not self._current_base_path:
             return None
 
-        today = datetime.now().date()
+        now = datetime.now()
+        today = now.toordinal()
+        day_start = now.replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
         session_dirs = self._find_sessions(self._current_base_path)
-        total_cost = Decimal("0.0")
+        total_cost = 0  # pico-dollars
 
-        for session_dir in session_dirs:
-            session = self._load_session(session_dir)
+        for session in self._load_sessions_modified_since(session_dirs, day_start):
             if not session or not session.files:
                 continue
 
             # Sum cost of today's files only
-            for file in session.files:
-                if file.modification_time and file.modification_time.date() == today:
-                    total_cost += file.calculate_cost(self.pricing_data)
+            summary = self._get_session_summary(session, today)
+            if summary is not None:
+                total_cost += summary["cost"]
 
-        return total_cost
+        return pico_dollars_to_decimal(total_cost)
 
     def get_session_status(self, base_path: str) -> Dict[str, Any]:
         """Get current status of the most recent session.
@@ -1144,9 +1956,7 @@ class LiveMonitor:
         if not recent_session:
             return {"status": "no_sessions", "message": "No sessions found"}
 
-        recent_file = None
-        if recent_session.files:
-            recent_file = max(recent_session.files, key=lambda f: f.modification_time)
+        recent_file = self._session_latest_file(recent_session)
 
         # Calculate how long ago the last activity was
         last_activity = None
@@ -1170,7 +1980,7 @@ class LiveMonitor:
             "session_id": recent_session.session_id,
             "interaction_count": recent_session.interaction_count,
             "total_tokens": recent_session.total_tokens.total,
-            "total_cost": float(recent_session.calculate_total_cost(self.pricing_data)),
+            "total_cost": float(self._session_total_cost(recent_session)),
             "models_used": recent_session.models_used,
             "last_activity_seconds": last_activity,
             "activity_status": activity_status,
@@ -1197,9 +2007,7 @@ class LiveMonitor:
         if not recent_session:
             return None
 
-        recent_file = None
-        if recent_session.files:
-            recent_file = max(recent_session.files, key=lambda f: f.modification_time)
+        recent_file = self._session_latest_file(recent_session)
 
         return {
             "timestamp": time.time(),
@@ -1207,9 +2015,7 @@ class LiveMonitor:
                 "id": recent_session.session_id,
                 "interaction_count": recent_session.interaction_count,
                 "total_tokens": recent_session.total_tokens.model_dump(),
-                "total_cost": float(
-                    recent_session.calculate_total_cost(self.pricing_data)
-                ),
+                "total_cost": float(self._session_total_cost(recent_session)),
                 "models_used": recent_session.models_used,
             },
             "recent_interaction": {
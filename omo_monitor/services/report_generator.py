@@ -1,13 +1,12 @@
 """Report generation service for OpenCode Monitor."""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
 from datetime import date, datetime
-from decimal import Decimal
 from collections import defaultdict
 from rich.console import Console
 from rich.panel import Panel
 
-from ..models.session import SessionData
+from ..models.session import SessionData, pico_dollars_to_decimal
 from ..models.analytics import (
     DailyUsage,
     WeeklyUsage,
@@ -25,6 +24,7 @@ from ..ui.tables import TableFormatter
 from ..services.session_analyzer import SessionAnalyzer
 from ..services.limits_analyzer import LimitsAnalyzer
 from ..config import ModelPricing
+from ..utils.time_utils import TimeUtils, WEEKDAY_NAMES
 
 
 class ReportGenerator:
@@ -40,50 +40,143 @@ class ReportGenerator:
         self.analyzer = analyzer
         self.table_formatter = TableFormatter(console)
         self.console = console or Console()
+        # (base_path, limit) -> sessions loaded for that request
+        self._sessions_cache: Dict[
+            Tuple[Optional[str], Optional[int]], List[SessionData]
+        ] = {}
+        # report kind -> output format -> handler, for the breakdown reports
+        # whose table/json/csv renderers all take the same single argument
+        self._breakdown_dispatch: Dict[str, Dict[str, Any]] = {
+            "models": {
+                "table": self._display_models_breakdown_table,
+                "json": self._format_models_breakdown_json,
+                "csv": self._format_models_breakdown_csv,
+            },
+            "projects": {
+                "table": self._display_projects_breakdown_table,
+                "json": self._format_projects_breakdown_json,
+                "csv": self._format_projects_breakdown_csv,
+            },
+            "categories": {
+                "table": self._display_categories_breakdown_table,
+                "json": self._format_categories_breakdown_json,
+                "csv": self._format_categories_breakdown_csv,
+            },
+            "skills": {
+                "table": self._display_skills_breakdown_table,
+                "json": self._format_skills_breakdown_json,
+                "csv": self._format_skills_breakdown_csv,
+            },
+            "omo": {
+                "table": self._display_omo_report_table,
+                "json": self._format_omo_report_json,
+                "csv": self._format_omo_report_csv,
+            },
+        }
+
+    def _load_sessions(
+        self, base_path: Optional[str], limit: Optional[int] = None
+    ) -> List[SessionData]:
+        """Load sessions, reusing the result of an earlier identical request.
+
+        Reports generated back to back for the same path then parse the
+        session directory only once.
+
+        Args:
+            base_path: Path to directory containing sessions
+            limit: Maximum number of sessions to analyze
+
+        Returns:
+            List of SessionData objects (a new list, safe to modify)
+        """
+        key = (base_path, limit)
+        sessions = self._sessions_cache.get(key)
+        if sessions is None:
+            sessions = self.analyzer.analyze_all_sessions(base_path, limit)
+            self._sessions_cache[key] = sessions
+        return list(sessions)
+
+    def invalidate_cache(self) -> None:
+        """Forget loaded sessions so the next report reads them again."""
+        self._sessions_cache.clear()
+
+    def _render_breakdown(
+        self, kind: str, output_format: str, breakdown: Any, report_data: Any
+    ) -> Any:
+        """Render a breakdown report through its dispatch table entry.
+
+        Args:
+            kind: Report kind key in the dispatch table
+            output_format: Output format ("table", "json", "csv")
+            breakdown: Breakdown model passed to the handler
+            report_data: Value returned for table or unknown formats
 
-    def _get_model_breakdown_for_sessions(
+        Returns:
+            Formatted json/csv data, or report_data otherwise
+        """
+        handler = self._breakdown_dispatch[kind].get(output_format)
+        if handler is None:
+            return report_data
+        result = handler(breakdown)
+        return report_data if result is None else result
+
+    def _aggregate_sessions(
         self, sessions: List[SessionData]
-    ) -> List[Dict[str, Any]]:
-        """Calculate per-model breakdown for a set of sessions.
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Calculate totals and per-model breakdown for a set of sessions.
+
+        Both come out of a single pass over the files, so a table row and
+        its model sub-rows don't walk the same files twice.
 
         Args:
             sessions: List of sessions to analyze
 
         Returns:
-            List of model breakdown dicts sorted by cost descending
+            Tuple of (totals dict, model breakdown dicts sorted by cost
+            descending); totals has sessions, interactions, tokens and cost
         """
-        model_data: Dict[str, Dict[str, Any]] = {}
-
-        for session in sessions:
+        # model -> [sessions, interactions, tokens, cost in pico-dollars,
+        # index of the last session counted]; one dict lookup per file, then
+        # list slot updates. Files are visited session by session, so a model
+        # is counted once per session by comparing against the last index.
+        model_data: Dict[str, List[Any]] = {}
+        pricing = self.analyzer.pricing_data
+
+        for index, session in enumerate(sessions):
             for file in session.files:
-                model = file.model_id
-                if model not in model_data:
-                    model_data[model] = {
-                        "sessions": set(),
-                        "interactions": 0,
-                        "tokens": 0,
-                        "cost": Decimal("0.0"),
-                    }
-                model_data[model]["sessions"].add(session.session_id)
-                model_data[model]["interactions"] += 1
-                model_data[model]["tokens"] += file.tokens.total
-                model_data[model]["cost"] += file.calculate_cost(
-                    self.analyzer.pricing_data
-                )
+                row = model_data.get(file.model_id)
+                if row is None:
+                    row = model_data[file.model_id] = [0, 0, 0, 0, -1]
+                if row[4] != index:
+                    row[0] += 1
+                    row[4] = index
+                row[1] += 1
+                row[2] += file.tokens.total
+                row[3] += file.calculate_cost_pico(pricing)
 
         results = []
-        for model, data in model_data.items():
+        total_interactions = total_tokens = total_cost = 0
+        for model, (session_count, interactions, tokens, cost, _) in model_data.items():
+            total_interactions += interactions
+            total_tokens += tokens
+            total_cost += cost
             results.append(
                 {
                     "model": model,
-                    "sessions": len(data["sessions"]),
-                    "interactions": data["interactions"],
-                    "tokens": data["tokens"],
-                    "cost": data["cost"],
+                    "sessions": session_count,
+                    "interactions": interactions,
+                    "tokens": tokens,
+                    "cost": pico_dollars_to_decimal(cost),
                 }
             )
 
-        return sorted(results, key=lambda x: x["cost"], reverse=True)
+        totals = {
+            "sessions": len(sessions),
+            "interactions": total_interactions,
+            "tokens": total_tokens,
+            "cost": pico_dollars_to_decimal(total_cost),
+        }
+        return totals, sorted(results, key=lambda x: x["cost"], reverse=True)
 
     def generate_single_session_report(
         self, session_path: str, output_format: str = "table"
@@ -122,19 +215,27 @@ class ReportGenerator:
         return report_data
 
     def generate_sessions_summary_report(
-        self, base_path: str, limit: Optional[int] = None, output_format: str = "table"
-    ) -> Dict[str, Any]:
+        self,
+        base_path: str,
+        limit: Optional[int] = None,
+        output_format: str = "table",
+        stream: bool = False,
+    ) -> Union[Dict[str, Any], Iterator[Dict[str, Any]]]:
         """Generate summary report for all sessions.
 
         Args:
             base_path: Path to directory containing sessions
             limit: Maximum number of sessions to analyze
             output_format: Output format ("table", "json", "csv")
+            stream: With csv output, return an iterator of rows instead of a list
 
         Returns:
-            Report data
+            Report data, or an iterator of CSV rows when streaming
         """
-        sessions = self.analyzer.analyze_all_sessions(base_path, limit)
+        sessions = self._load_sessions(base_path, limit)
+        if stream and output_format == "csv":
+            return self._iter_sessions_summary_csv(sessions)
+
         summary = self.analyzer.get_sessions_summary(sessions)
 
         report_data = {
@@ -158,23 +259,24 @@ class ReportGenerator:
         month: Optional[str] = None,
         output_format: str = "table",
         breakdown: bool = False,
-    ) -> Dict[str, Any]:
+        stream: bool = False,
+    ) -> Union[Dict[str, Any], Iterator[Dict[str, Any]]]:
         """Generate daily breakdown report.
 
         Args:
             base_path: Path to directory containing sessions
             month: Optional month filter (YYYY-MM format)
             output_format: Output format ("table", "json", "csv")
+            breakdown: Show per-model breakdown
+            stream: With csv output, return an iterator of rows instead of a list
 
         Returns:
-            Report data
+            Report data, or an iterator of CSV rows when streaming
         """
-        sessions = self.analyzer.analyze_all_sessions(base_path)
+        sessions = self._load_sessions(base_path)
 
         # Apply month filter if specified
         if month:
-            from ..utils.time_utils import TimeUtils
-
             month_data = TimeUtils.parse_month_string(month)
             if month_data:
                 year, month_num = month_data
@@ -184,6 +286,8 @@ class ReportGenerator:
                 )
 
         daily_usage = self.analyzer.create_daily_breakdown(sessions)
+        if stream and output_format == "csv":
+            return self._iter_daily_breakdown_csv(daily_usage)
 
         report_data = {
             "type": "daily_breakdown",
@@ -220,12 +324,10 @@ class ReportGenerator:
         Returns:
             Report data
         """
-        sessions = self.analyzer.analyze_all_sessions(base_path)
+        sessions = self._load_sessions(base_path)
 
         # Apply year filter if specified
         if year:
-            from ..utils.time_utils import TimeUtils
-
             start_date, end_date = TimeUtils.get_year_range(year)
             sessions = self.analyzer.filter_sessions_by_date(
                 sessions, start_date, end_date
@@ -269,12 +371,10 @@ class ReportGenerator:
         Returns:
             Report data
         """
-        sessions = self.analyzer.analyze_all_sessions(base_path)
+        sessions = self._load_sessions(base_path)
 
         # Apply year filter if specified
         if year:
-            from ..utils.time_utils import TimeUtils
-
             start_date, end_date = TimeUtils.get_year_range(year)
             sessions = self.analyzer.filter_sessions_by_date(
                 sessions, start_date, end_date
@@ -319,15 +419,13 @@ class ReportGenerator:
         Returns:
             Report data
         """
-        sessions = self.analyzer.analyze_all_sessions(base_path)
+        sessions = self._load_sessions(base_path)
 
         # Apply project filter if specified
         if project:
             sessions = self.analyzer.filter_sessions_by_project(sessions, project)
 
         # Parse date filters
-        from ..utils.time_utils import TimeUtils
-
         parsed_start_date = (
             TimeUtils.parse_date_string(start_date) if start_date else None
         )
@@ -348,14 +446,9 @@ class ReportGenerator:
             },
         }
 
-        if output_format == "table":
-            self._display_models_breakdown_table(model_breakdown)
-        elif output_format == "json":
-            return self._format_models_breakdown_json(model_breakdown)
-        elif output_format == "csv":
-            return self._format_models_breakdown_csv(model_breakdown)
-
-        return report_data
+        return self._render_breakdown(
+            "models", output_format, model_breakdown, report_data
+        )
 
     def generate_projects_report(
         self,
@@ -377,11 +470,9 @@ class ReportGenerator:
         Returns:
             Report data
         """
-        sessions = self.analyzer.analyze_all_sessions(base_path)
+        sessions = self._load_sessions(base_path)
 
         # Parse date filters
-        from ..utils.time_utils import TimeUtils
-
         parsed_start_date = (
             TimeUtils.parse_date_string(start_date) if start_date else None
         )
@@ -401,14 +492,9 @@ class ReportGenerator:
             },
         }
 
-        if output_format == "table":
-            self._display_projects_breakdown_table(project_breakdown)
-        elif output_format == "json":
-            return self._format_projects_breakdown_json(project_breakdown)
-        elif output_format == "csv":
-            return self._format_projects_breakdown_csv(project_breakdown)
-
-        return report_data
+        return self._render_breakdown(
+            "projects", output_format, project_breakdown, report_data
+        )
 
     def generate_agents_report(
         self,
@@ -434,15 +520,13 @@ class ReportGenerator:
         Returns:
             Report data
         """
-        sessions = self.analyzer.analyze_all_sessions(base_path)
+        sessions = self._load_sessions(base_path)
 
         # Apply project filter if specified
         if project:
             sessions = self.analyzer.filter_sessions_by_project(sessions, project)
 
         # Parse date filters
-        from ..utils.time_utils import TimeUtils
-
         parsed_start_date = (
             TimeUtils.parse_date_string(start_date) if start_date else None
         )
@@ -506,15 +590,13 @@ class ReportGenerator:
         Returns:
             Report data
         """
-        sessions = self.analyzer.analyze_all_sessions(base_path)
+        sessions = self._load_sessions(base_path)
 
         # Apply project filter if specified
         if project:
             sessions = self.analyzer.filter_sessions_by_project(sessions, project)
 
         # Parse date filters
-        from ..utils.time_utils import TimeUtils
-
         parsed_start_date = (
             TimeUtils.parse_date_string(start_date) if start_date else None
         )
@@ -535,14 +617,9 @@ class ReportGenerator:
             },
         }
 
-        if output_format == "table":
-            self._display_categories_breakdown_table(category_breakdown)
-        elif output_format == "json":
-            return self._format_categories_breakdown_json(category_breakdown)
-        elif output_format == "csv":
-            return self._format_categories_breakdown_csv(category_breakdown)
-
-        return report_data
+        return self._render_breakdown(
+            "categories", output_format, category_breakdown, report_data
+        )
 
     def generate_skills_report(
         self,
@@ -568,15 +645,13 @@ class ReportGenerator:
         Returns:
             Report data
         """
-        sessions = self.analyzer.analyze_all_sessions(base_path)
+        sessions = self._load_sessions(base_path)
 
         # Apply project filter if specified
         if project:
             sessions = self.analyzer.filter_sessions_by_project(sessions, project)
 
         # Parse date filters
-        from ..utils.time_utils import TimeUtils
-
         parsed_start_date = (
             TimeUtils.parse_date_string(start_date) if start_date else None
         )
@@ -597,14 +672,9 @@ class ReportGenerator:
             },
         }
 
-        if output_format == "table":
-            self._display_skills_breakdown_table(skill_breakdown)
-        elif output_format == "json":
-            return self._format_skills_breakdown_json(skill_breakdown)
-        elif output_format == "csv":
-            return self._format_skills_breakdown_csv(skill_breakdown)
-
-        return report_data
+        return self._render_breakdown(
+            "skills", output_format, skill_breakdown, report_data
+        )
 
     def generate_omo_report(
         self,
@@ -632,15 +702,13 @@ class ReportGenerator:
         Returns:
             Report data
         """
-        sessions = self.analyzer.analyze_all_sessions(base_path)
+        sessions = self._load_sessions(base_path)
 
         # Apply project filter if specified
         if project:
             sessions = self.analyzer.filter_sessions_by_project(sessions, project)
 
         # Parse date filters
-        from ..utils.time_utils import TimeUtils
-
         parsed_start_date = (
             TimeUtils.parse_date_string(start_date) if start_date else None
         )
@@ -661,14 +729,7 @@ class ReportGenerator:
             },
         }
 
-        if output_format == "table":
-            self._display_omo_report_table(omo_report)
-        elif output_format == "json":
-            return self._format_omo_report_json(omo_report)
-        elif output_format == "csv":
-            return self._format_omo_report_csv(omo_report)
-
-        return report_data
+        return self._render_breakdown("omo", output_format, omo_report, report_data)
 
     # Table display methods
     def _display_single_session_table(
@@ -730,16 +791,15 @@ class ReportGenerator:
             table.add_column("Cost", justify="right", style="red")
 
             for day in daily_usage:
-                day_cost = day.calculate_total_cost(self.analyzer.pricing_data)
+                totals, model_breakdown = self._aggregate_sessions(day.sessions)
                 table.add_row(
                     day.date.strftime("%Y-%m-%d"),
-                    f"{len(day.sessions)}",
-                    f"{day.total_interactions}",
-                    f"{day.total_tokens.total:,}",
-                    f"${day_cost:.2f}",
+                    f"{totals['sessions']}",
+                    f"{totals['interactions']}",
+                    f"{totals['tokens']:,}",
+                    f"${totals['cost']:.2f}",
                 )
 
-                model_breakdown = self._get_model_breakdown_for_sessions(day.sessions)
                 for model_data in model_breakdown:
                     table.add_row(
                         f"  ↳ {model_data['model']}",
@@ -771,7 +831,6 @@ class ReportGenerator:
             week_start_day: Day week starts on (0=Monday, 6=Sunday)
         """
         from rich.table import Table
-        from ..utils.time_utils import TimeUtils, WEEKDAY_NAMES
 
         title = "Weekly Usage Breakdown"
         if week_start_day != 0:
@@ -792,36 +851,44 @@ class ReportGenerator:
         table.add_column("Total Tokens", justify="right", style="white")
         table.add_column("Cost", justify="right", style="red")
 
+        pricing = self.analyzer.pricing_data
         for week in weekly_usage:
-            week_cost = week.calculate_total_cost(self.analyzer.pricing_data)
             week_label = f"{week.year}-W{week.week:02d}"
             date_range = TimeUtils.format_week_range(week.start_date, week.end_date)
 
-            table.add_row(
-                week_label,
-                date_range,
-                f"{week.total_sessions}",
-                f"{week.total_interactions}",
-                f"{week.total_tokens.total:,}",
-                f"${week_cost:.2f}",
-            )
-
             if breakdown:
                 week_sessions = []
                 for day in week.daily_usage:
                     week_sessions.extend(day.sessions)
+                totals, model_breakdown = self._aggregate_sessions(week_sessions)
+            else:
+                totals = {
+                    "sessions": week.total_sessions,
+                    "interactions": week.total_interactions,
+                    "tokens": week.total_tokens.total,
+                    "cost": week.calculate_total_cost(pricing),
+                }
+                model_breakdown = []
 
-                model_breakdown = self._get_model_breakdown_for_sessions(week_sessions)
-                for model_data in model_breakdown:
-                    table.add_row(
-                        "",
-                        f"  ↳ {model_data['model']}",
-                        f"{model_data['sessions']}",
-                        f"{model_data['interactions']}",
-                        f"{model_data['tokens']:,}",
-                        f"${model_data['cost']:.2f}",
-                        style="dim",
-                    )
+            table.add_row(
+                week_label,
+                date_range,
+                f"{totals['sessions']}",
+                f"{totals['interactions']}",
+                f"{totals['tokens']:,}",
+                f"${totals['cost']:.2f}",
+            )
+
+            for model_data in model_breakdown:
+                table.add_row(
+                    "",
+                    f"  ↳ {model_data['model']}",
+                    f"{model_data['sessions']}",
+                    f"{model_data['interactions']}",
+                    f"{model_data['tokens']:,}",
+                    f"${model_data['cost']:.2f}",
+                    style="dim",
+                )
 
         self.console.print(table)
 
@@ -844,32 +911,40 @@ class ReportGenerator:
         table.add_column("Total Tokens", justify="right", style="white")
         table.add_column("Cost", justify="right", style="red")
 
+        pricing = self.analyzer.pricing_data
         for month in monthly_usage:
-            month_cost = month.calculate_total_cost(self.analyzer.pricing_data)
-            table.add_row(
-                f"{month.year}-{month.month:02d}",
-                f"{month.total_sessions}",
-                f"{month.total_interactions}",
-                f"{month.total_tokens.total:,}",
-                f"${month_cost:.2f}",
-            )
-
             if breakdown:
                 month_sessions = []
                 for week in month.weekly_usage:
                     for day in week.daily_usage:
                         month_sessions.extend(day.sessions)
+                totals, model_breakdown = self._aggregate_sessions(month_sessions)
+            else:
+                totals = {
+                    "sessions": month.total_sessions,
+                    "interactions": month.total_interactions,
+                    "tokens": month.total_tokens.total,
+                    "cost": month.calculate_total_cost(pricing),
+                }
+                model_breakdown = []
 
-                model_breakdown = self._get_model_breakdown_for_sessions(month_sessions)
-                for model_data in model_breakdown:
-                    table.add_row(
-                        f"  ↳ {model_data['model']}",
-                        f"{model_data['sessions']}",
-                        f"{model_data['interactions']}",
-                        f"{model_data['tokens']:,}",
-                        f"${model_data['cost']:.2f}",
-                        style="dim",
-                    )
+            table.add_row(
+                f"{month.year}-{month.month:02d}",
+                f"{totals['sessions']}",
+                f"{totals['interactions']}",
+                f"{totals['tokens']:,}",
+                f"${totals['cost']:.2f}",
+            )
+
+            for model_data in model_breakdown:
+                table.add_row(
+                    f"  ↳ {model_data['model']}",
+                    f"{model_data['sessions']}",
+                    f"{model_data['interactions']}",
+                    f"{model_data['tokens']:,}",
+                    f"${model_data['cost']:.2f}",
+                    style="dim",
+                )
 
         self.console.print(table)
 
@@ -1644,37 +1719,47 @@ class ReportGenerator:
         self, sessions: List[SessionData]
     ) -> List[Dict[str, Any]]:
         """Format sessions summary for CSV export."""
-        rows = []
+        return list(self._iter_sessions_summary_csv(sessions))
+
+    def _iter_sessions_summary_csv(
+        self, sessions: List[SessionData]
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield sessions summary CSV rows one at a time."""
+        pricing = self.analyzer.pricing_data
         for session in sessions:
-            model_breakdown = session.get_model_breakdown(self.analyzer.pricing_data)
+            model_breakdown = session.get_model_breakdown(pricing)
             for model, stats in model_breakdown.items():
-                rows.append(
-                    {
-                        "session_id": session.session_id,
-                        "session_title": session.session_title,
-                        "project_name": session.project_name,
-                        "start_time": session.start_time.isoformat()
-                        if session.start_time
-                        else None,
-                        "duration_ms": session.duration_ms,
-                        "model": model,
-                        "interactions": stats["files"],
-                        "input_tokens": stats["tokens"].input,
-                        "output_tokens": stats["tokens"].output,
-                        "cache_write_tokens": stats["tokens"].cache_write,
-                        "cache_read_tokens": stats["tokens"].cache_read,
-                        "total_tokens": stats["tokens"].total,
-                        "cost": float(stats["cost"]),
-                    }
-                )
-        return rows
+                yield {
+                    "session_id": session.session_id,
+                    "session_title": session.session_title,
+                    "project_name": session.project_name,
+                    "start_time": session.start_time.isoformat()
+                    if session.start_time
+                    else None,
+                    "duration_ms": session.duration_ms,
+                    "model": model,
+                    "interactions": stats["files"],
+                    "input_tokens": stats["tokens"].input,
+                    "output_tokens": stats["tokens"].output,
+                    "cache_write_tokens": stats["tokens"].cache_write,
+                    "cache_read_tokens": stats["tokens"].cache_read,
+                    "total_tokens": stats["tokens"].total,
+                    "cost": float(stats["cost"]),
+                }
 
     def _format_daily_breakdown_csv(
         self, daily_usage: List[DailyUsage]
     ) -> List[Dict[str, Any]]:
         """Format daily breakdown for CSV export."""
-        return [
-            {
+        return list(self._iter_daily_breakdown_csv(daily_usage))
+
+    def _iter_daily_breakdown_csv(
+        self, daily_usage: List[DailyUsage]
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield daily breakdown CSV rows one at a time."""
+        pricing = self.analyzer.pricing_data
+        for day in daily_usage:
+            yield {
                 "date": day.date.isoformat(),
                 "sessions": len(day.sessions),
                 "interactions": day.total_interactions,
@@ -1683,11 +1768,9 @@ class ReportGenerator:
                 "cache_write_tokens": day.total_tokens.cache_write,
                 "cache_read_tokens": day.total_tokens.cache_read,
                 "total_tokens": day.total_tokens.total,
-                "cost": float(day.calculate_total_cost(self.analyzer.pricing_data)),
+                "cost": float(day.calculate_total_cost(pricing)),
                 "models_used": ", ".join(day.models_used),
             }
-            for day in daily_usage
-        ]
 
     def _format_weekly_breakdown_csv(
         self, weekly_usage: List[WeeklyUsage]
@@ -2157,7 +2240,7 @@ class ReportGenerator:
         """
         from datetime import datetime
 
-        sessions = self.analyzer.analyze_all_sessions(base_path)
+        sessions = self._load_sessions(base_path)
 
         # Apply project filter if specified
         if project:
@@ -2,7 +2,6 @@
 
 import threading
 from datetime import datetime, timedelta
-from decimal import Decimal
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Set
 
@@ -19,7 +18,7 @@ from textual.timer import Timer
 
 import watchfiles
 
-from ..models.session import TokenUsage, SessionData
+from ..models.session import TokenUsage, SessionData, DECIMAL_ZERO
 from ..models.limits import LimitsConfig
 from ..utils.file_utils import FileProcessor
 from ..config import ModelPricing
@@ -200,13 +199,13 @@ class AggregateMonitorApp(App):
         """Find session paths using data source or FileProcessor."""
         if self._data_source:
             return self._data_source.find_sessions(base_path)
-        return self._find_sessions(base_path)
+        return FileProcessor.find_session_directories(base_path)
 
     def _load_session(self, session_path: Path) -> Optional[SessionData]:
         """Load a session using data source or FileProcessor."""
         if self._data_source:
             return self._data_source.load_session(session_path)
-        return self._load_session(session_path)
+        return FileProcessor.load_session_data(session_path)
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -505,7 +504,7 @@ class AggregateMonitorApp(App):
         usage_hierarchy: Dict[str, Any] = {}
 
         total_tokens = TokenUsage()
-        total_cost = Decimal("0.0")
+        total_cost = DECIMAL_ZERO
         total_sessions = 0
         total_interactions = 0
         recent_files: List[tuple] = []
@@ -523,7 +522,7 @@ class AggregateMonitorApp(App):
                     "sessions": 0,
                     "interactions": 0,
                     "tokens": TokenUsage(),
-                    "cost": Decimal("0.0"),
+                    "cost": DECIMAL_ZERO,
                     "latest_time": None,
                     "latest_model": None,
                     "cache_rate": 0.0,
@@ -562,7 +561,7 @@ class AggregateMonitorApp(App):
                         provider_usage[provider_id] = {
                             "requests": 0,
                             "tokens": 0,
-                            "cost": Decimal("0.0"),
+                            "cost": DECIMAL_ZERO,
                         }
 
                     provider_usage[provider_id]["requests"] += 1
@@ -585,7 +584,7 @@ class AggregateMonitorApp(App):
                     ):
                         usage_hierarchy[provider_id][model_name][agent_name][
                             category_name
-                        ] = {"requests": 0, "cost": Decimal("0.0")}
+                        ] = {"requests": 0, "cost": DECIMAL_ZERO}
 
                     usage_hierarchy[provider_id][model_name][agent_name][category_name][
                         "requests"
@@ -671,7 +670,7 @@ class AggregateMonitorApp(App):
                 ):
                     usage_hierarchy[provider_id][model_name][agent_name][
                         category_name
-                    ] = {"requests": 0, "cost": Decimal("0.0")}
+                    ] = {"requests": 0, "cost": DECIMAL_ZERO}
 
                 usage_hierarchy[provider_id][model_name][agent_name][category_name][
                     "requests"
@@ -715,7 +714,7 @@ class AggregateMonitorApp(App):
                 ):
                     agent_hierarchy[agent_name][category_name][provider_id][
                         model_name
-                    ] = {"requests": 0, "cost": Decimal("0.0")}
+                    ] = {"requests": 0, "cost": DECIMAL_ZERO}
 
                 agent_hierarchy[agent_name][category_name][provider_id][model_name][
                     "requests"
@@ -71,9 +71,11 @@ class DashboardUI:
         pricing_data: Dict[str, Any],
         quota: Optional[Decimal] = None,
         daily_cost: Optional[Decimal] = None,
+        total_cost: Optional[Decimal] = None,
     ) -> Panel:
         """Create cost tracking panel."""
-        total_cost = session.calculate_total_cost(pricing_data)
+        if total_cost is None:
+            total_cost = session.calculate_total_cost(pricing_data)
 
         # Build cost text with optional daily total
         lines = ["[bold blue]Cost Tracking[/bold blue]"]
@@ -248,6 +250,7 @@ class DashboardUI:
         context_window: int = 200000,
         daily_cost: Optional[Decimal] = None,
         session_max_hours: float = 5.0,
+        total_cost: Optional[Decimal] = None,
     ) -> Layout:
         """Create the complete dashboard layout."""
         layout = Layout()
@@ -255,7 +258,9 @@ class DashboardUI:
         # Create panels
         header = self.create_header(session)
         token_panel = self.create_token_panel(session, recent_file)
-        cost_panel = self.create_cost_panel(session, pricing_data, quota, daily_cost)
+        cost_panel = self.create_cost_panel(
+            session, pricing_data, quota, daily_cost, total_cost
+        )
         model_panel = self.create_model_panel(session, pricing_data)
         context_panel = self.create_context_panel(recent_file, context_window)
         burn_rate_panel = self.create_burn_rate_panel(burn_rate)
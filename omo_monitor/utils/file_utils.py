@@ -3,8 +3,10 @@
 import json
 import os
 import re
+import shutil
+import tempfile
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Generator
+from typing import Dict, List, Optional, Any, Generator, Union
 from datetime import datetime
 
 from decimal import Decimal
@@ -17,6 +19,50 @@ from ..models.session import (
     ToolsConfig,
 )
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def write_atomic(path: Union[str, Path], content: bytes) -> None:
+    """Replace a file's content without ever leaving it half-written.
+
+    The content goes to a uniquely named temporary file in the same
+    directory, is synced to disk and then replaces the target, so
+    concurrent writers never rename each other's partial output into
+    place. An existing target keeps its permissions.
+
+    Args:
+        path: File to replace or create
+        content: New content
+
+    Raises:
+        OSError: If the file could not be written
+    """
+    path = os.fspath(path)
+    tmp = tempfile.NamedTemporaryFile(
+        dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp", delete=False
+    )
+    try:
+        with tmp:
+            tmp.write(content)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        try:
+            shutil.copymode(path, tmp.name)
+        except FileNotFoundError:
+            pass  # New file
+        os.replace(tmp.name, path)
+    except BaseException:
+        # Never leave a stray temp file next to the target
+        try:
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+        raise
+
 
 class FileProcessor:
     """Handles file processing and session discovery."""
@@ -72,6 +118,10 @@ class FileProcessor:
             Parsed JSON data or None if failed
         """
         try:
+            if HAS_ORJSON:
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError and
+                # also covers invalid UTF-8
+                return orjson.loads(file_path.read_bytes())
             with open(file_path, "r", encoding="utf-8") as f:
                 return json.load(f)
         except (
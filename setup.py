@@ -46,6 +46,9 @@ setup(
             "isort>=5.10.0",
             "flake8>=4.0.0",
         ],
+        "speedups": [
+            "orjson>=3.9.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -0,0 +1,43 @@
+"""Tests for file utilities."""
+
+import os
+import stat
+from unittest import mock
+
+import pytest
+
+from omo_monitor.utils.file_utils import write_atomic
+
+
+class TestWriteAtomic:
+    """Tests for atomic file writes."""
+
+    def test_replaces_content(self, tmp_path):
+        target = tmp_path / "oh-my-opencode.json"
+        target.write_bytes(b"old")
+        target.chmod(0o640)
+
+        write_atomic(str(target), b"new")
+
+        assert target.read_bytes() == b"new"
+        assert stat.S_IMODE(target.stat().st_mode) == 0o640
+        assert os.listdir(tmp_path) == ["oh-my-opencode.json"]
+
+    def test_creates_missing_file(self, tmp_path):
+        target = tmp_path / "models_pricing.json"
+
+        write_atomic(target, b"{}")
+
+        assert target.read_bytes() == b"{}"
+        assert os.listdir(tmp_path) == ["models_pricing.json"]
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path):
+        target = tmp_path / "oh-my-opencode.json"
+        target.write_bytes(b"old")
+
+        with mock.patch("os.fsync", side_effect=OSError("No space left on device")):
+            with pytest.raises(OSError):
+                write_atomic(str(target), b"new")
+
+        assert target.read_bytes() == b"old"
+        assert os.listdir(tmp_path) == ["oh-my-opencode.json"]
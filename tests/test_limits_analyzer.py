@@ -0,0 +1,256 @@
+"""Tests for the limits analyzer."""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from omo_monitor.config import ModelPricing
+from omo_monitor.models.limits import LimitsConfig, ModelLimit, ProviderLimit
+from omo_monitor.models.session import (
+    InteractionFile,
+    SessionData,
+    TimeData,
+    TokenUsage,
+)
+from omo_monitor.services.limits_analyzer import LimitsAnalyzer
+
+NOW = datetime(2026, 10, 17, 12, 0, 0)
+HOUR = timedelta(hours=1)
+ONE_MS = timedelta(milliseconds=1)
+SONNET = "claude-sonnet-4.5"
+OPUS = "claude-opus-4.5"
+
+# One session per row: (agent, category, provider, model, total tokens per
+# request, requests, created). Request counts and token averages sit on the
+# impact and tier thresholds, and some rows land exactly on a window start
+# or one millisecond before it.
+ROWS = [
+    ("hephaestus", None, "anthropic", SONNET, 30001, 100, NOW - HOUR),
+    ("hephaestus", None, "anthropic", SONNET, 30001, 1, NOW - 24 * HOUR),
+    ("build", None, "anthropic", SONNET, 30000, 100, NOW - HOUR),
+    ("build", None, "anthropic", SONNET, 30000, 1, NOW - 24 * HOUR - ONE_MS),
+    ("Sisyphus", None, "anthropic", OPUS, 80000, 31, NOW - 2 * HOUR),
+    ("oracle", None, "anthropic", OPUS, 80001, 30, NOW - 2 * HOUR),
+    ("helper", None, "anthropic", SONNET, 1000, 9, NOW - 2 * HOUR),
+    ("explore", "writing", "anthropic", SONNET, 50001, 51, NOW - 3 * HOUR),
+    ("explore", "artistry", "anthropic", SONNET, 100000, 50, NOW - 3 * HOUR),
+    ("explore", "unspecified-high", "anthropic", SONNET, 100001, 21, NOW - 3 * HOUR),
+    ("explore", "unspecified-low", "anthropic", SONNET, 2000, 20, NOW - 3 * HOUR),
+    ("explore", "tiny", "anthropic", SONNET, 2000, 4, NOW - 3 * HOUR),
+    ("explore", None, "anthropic", OPUS, 1000, 1, NOW - 5 * HOUR),
+    ("explore", None, "anthropic", OPUS, 1000, 1, NOW - 5 * HOUR - ONE_MS),
+    ("explore", "quick", "openai", "gpt-4o", 1000, 50, NOW - 2 * HOUR),
+    ("explore", None, None, "gpt-4o", 1000, 2, None),
+]
+
+
+def make_sessions():
+    sessions = []
+    for index, row in enumerate(ROWS):
+        agent, category, provider, model, tokens, requests, created = row
+        time_data = None
+        if created is not None:
+            time_data = TimeData(created=int(created.timestamp() * 1000))
+        files = [
+            InteractionFile(
+                file_path=Path(f"/sessions/ses{index}/msg{i}.json"),
+                session_id=f"ses{index}",
+                model_id=model,
+                provider_id=provider,
+                agent=agent,
+                category=category,
+                tokens=TokenUsage(input=tokens - 1000, output=200, cache_read=800),
+                time_data=time_data,
+            )
+            for i in range(requests)
+        ]
+        sessions.append(
+            SessionData(
+                session_id=f"ses{index}",
+                session_path=Path(f"/sessions/ses{index}"),
+                files=files,
+            )
+        )
+    return sessions
+
+
+@pytest.fixture
+def analyzer():
+    config = LimitsConfig(
+        providers=[
+            ProviderLimit(
+                provider_id="anthropic",
+                requests_per_window=519,
+                model_limits=[
+                    ModelLimit(model_pattern="claude-opus-*", requests_per_window=50),
+                    ModelLimit(model_pattern="claude-*", requests_per_window=400),
+                ],
+            ),
+            ProviderLimit(
+                provider_id="google", requests_per_window=100, account_count=10
+            ),
+            ProviderLimit(provider_id="openai", requests_per_window=100),
+        ]
+    )
+    pricing = {
+        model: ModelPricing(
+            input=Decimal("3"),
+            output=Decimal("15"),
+            cacheWrite=Decimal("3.75"),
+            cacheRead=Decimal("0.3"),
+            contextWindow=200000,
+            sessionQuota=Decimal("0"),
+        )
+        for model in ["claude-sonnet-4.5", "claude-opus-4.5", "gpt-4o"]
+    }
+    return LimitsAnalyzer(config, pricing)
+
+
+@pytest.fixture
+def sessions():
+    return make_sessions()
+
+
+class TestAnalysis:
+    """Tests pinning limits and optimization results on fixed sessions."""
+
+    def test_analyze_limits(self, analyzer, sessions):
+        report = analyzer.analyze_limits(sessions, NOW)
+        usage = {u.provider_id: u for u in report.provider_usage}
+
+        # The row at exactly NOW - 5h counts, the one 1 ms earlier does not
+        anthropic = usage["anthropic"]
+        assert anthropic.window_start == NOW - 5 * HOUR
+        assert anthropic.requests_used == 417
+        assert anthropic.tokens_used == 20588202
+        assert anthropic.cost_used == Decimal("61.864686")
+        assert anthropic.models_used == {
+            "claude-opus-4.5": 62,
+            "claude-sonnet-4.5": 355,
+        }
+        assert anthropic.utilization_status == "warning"
+
+        assert usage["google"].requests_used == 0
+        assert usage["google"].requests_limit == 1000
+        assert usage["openai"].requests_used == 50
+        assert usage["openai"].cost_used == Decimal("0.162")
+        assert usage["openai"].requests_utilization == 50.0
+        assert report.recommendations == [
+            "anthropic: Only 102 requests remaining in current 5h window"
+        ]
+
+    def test_analyze_limits_window_override(self, analyzer, sessions):
+        report = analyzer.analyze_limits(sessions, NOW, window_hours_override=24)
+        usage = {u.provider_id: u for u in report.provider_usage}
+
+        # The row at exactly NOW - 24h counts, the one 1 ms earlier does not
+        assert usage["anthropic"].requests_used == 419
+
+    def test_analyze_model_limits(self, analyzer, sessions):
+        usage = analyzer.analyze_model_limits(sessions, "anthropic", NOW)
+
+        assert {
+            pattern: (stats["requests"], stats["tokens"], stats["limit"])
+            for pattern, stats in usage.items()
+        } == {
+            "claude-opus-*": (62, 4831430, 50),
+            "claude-*": (355, 15423172, 400),
+        }
+
+    def test_generate_optimization_report(self, analyzer, sessions):
+        report = analyzer.generate_optimization_report(sessions, 24, NOW)
+
+        assert report.overloaded_providers == ["anthropic"]
+        # openai at exactly 50% utilization is not underutilized
+        assert report.underutilized_providers == ["google"]
+        assert report.total_requests_analyzed == 471
+        assert report.requests_movable == 419
+        assert [(s.category, s.potential_savings) for s in report.suggestions] == [
+            ("uncategorized", "~273 req freed from anthropic"),
+            ("writing", "~51 req freed from anthropic"),
+            ("artistry", "~50 req freed from anthropic"),
+            ("unspecified-high", "~21 req freed from anthropic"),
+            ("unspecified-low", "~20 req freed from anthropic"),
+            ("tiny", "~4 req freed from anthropic"),
+        ]
+
+    def test_agent_and_category_usage(self, analyzer, sessions):
+        agents = analyzer.analyze_agent_provider_usage(sessions, 24, NOW)
+        categories = analyzer.analyze_category_provider_usage(sessions, 24, NOW)
+
+        def summarize(usage):
+            return {
+                name: {
+                    provider: (stats["requests"], stats["avg_tokens"])
+                    for provider, stats in providers.items()
+                }
+                for name, providers in usage.items()
+            }
+
+        assert summarize(agents) == {
+            "hephaestus": {"anthropic": (101, 30001)},
+            "build": {"anthropic": (100, 30000)},
+            "Sisyphus": {"anthropic": (31, 80000)},
+            "oracle": {"anthropic": (30, 80001)},
+            "helper": {"anthropic": (9, 1000)},
+            "explore": {
+                "anthropic": (148, 65541),
+                "openai": (50, 1000),
+                "unknown": (2, 1000),
+            },
+        }
+        assert summarize(categories) == {
+            "uncategorized": {"anthropic": (273, 40004), "unknown": (2, 1000)},
+            "writing": {"anthropic": (51, 50001)},
+            "artistry": {"anthropic": (50, 100000)},
+            "unspecified-high": {"anthropic": (21, 100001)},
+            "unspecified-low": {"anthropic": (20, 2000)},
+            "tiny": {"anthropic": (4, 2000)},
+            "quick": {"openai": (50, 1000)},
+        }
+
+    def test_generate_routing_recommendations(self, analyzer, sessions):
+        recommendations = analyzer.generate_routing_recommendations(
+            sessions, "/nonexistent/oh-my-opencode.json", 24, NOW
+        )
+
+        assert [
+            (r["type"], r["name"], r["requests_moved"], r["impact"])
+            for r in recommendations
+        ] == [
+            ("agent", "hephaestus", 101, "high"),
+            ("category", "writing", 51, "high"),
+            ("agent", "build", 100, "medium"),
+            ("category", "artistry", 50, "medium"),
+            ("agent", "Sisyphus", 31, "medium"),
+            ("category", "unspecified-high", 21, "medium"),
+            ("agent", "oracle", 30, "low"),
+            ("category", "unspecified-low", 20, "low"),
+        ]
+        assert [r["reason"] for r in recommendations] == [
+            "Medium (30,001 tok/req) -> Gemini Pro [4000/5h]",
+            "Category 'writing': Medium-high (50,001 tok/req)"
+            " -> Gemini Pro High [4000/5h]",
+            "Lower (30,000 tok/req) -> Gemini Flash [30000/5h]",
+            "Category 'artistry': High complexity (100,000 tok/req)"
+            " -> Sonnet Thinking [2500/5h]",
+            "Premium agent (80,000 tok/req) -> Claude Sonnet Thinking",
+            "Category 'unspecified-high': Very high complexity (100,001 tok/req)"
+            " -> Opus Thinking [2500/day]",
+            "Premium agent, high complexity (80,001 tok/req) -> Opus Thinking",
+            "Category 'unspecified-low': Lower (2,000 tok/req)"
+            " -> Gemini Flash [30000/5h]",
+        ]
+        assert [r["suggested_model"] for r in recommendations] == [
+            "google/antigravity-gemini-3-pro",
+            "google/antigravity-gemini-3-pro-high",
+            "google/antigravity-gemini-3-flash",
+            "google/antigravity-claude-sonnet-4-5-thinking",
+            "google/antigravity-claude-sonnet-4-5-thinking",
+            "google/antigravity-claude-opus-4-5-thinking",
+            "google/antigravity-claude-opus-4-5-thinking",
+            "google/antigravity-gemini-3-flash",
+        ]
+        assert recommendations[0]["antigravity_capacity_remaining"] == 899
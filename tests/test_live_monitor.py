@@ -0,0 +1,159 @@
+"""Tests for the live monitor's session caches."""
+
+import json
+import os
+import shutil
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from omo_monitor.config import ModelPricing
+from omo_monitor.models.session import InteractionFile, SessionData, TokenUsage
+from omo_monitor.services import live_monitor as live_monitor_module
+from omo_monitor.services.live_monitor import LiveMonitor
+
+
+class FakeDataSource:
+    """Data source reading one JSON file per interaction, counting reads."""
+
+    def __init__(self):
+        self.reads = 0
+
+    def find_sessions(self, base_path):
+        return sorted(p for p in Path(base_path).iterdir() if p.is_dir())
+
+    def load_session(self, session_path):
+        self.reads += 1
+        files = []
+        for file_path in sorted(session_path.glob("*.json")):
+            data = json.loads(file_path.read_text())
+            files.append(
+                InteractionFile(
+                    file_path=file_path,
+                    session_id=session_path.name,
+                    model_id="claude-sonnet-4",
+                    tokens=TokenUsage(input=data["input"]),
+                )
+            )
+        return SessionData(
+            session_id=session_path.name, session_path=session_path, files=files
+        )
+
+
+def write_interaction(path: Path, input_tokens: int, mtime: datetime) -> None:
+    path.write_text(json.dumps({"input": input_tokens}))
+    os.utime(path, (mtime.timestamp(), mtime.timestamp()))
+
+
+def freeze_now(monkeypatch, now: datetime) -> None:
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now
+
+    monkeypatch.setattr(live_monitor_module, "datetime", FrozenDatetime)
+
+
+@pytest.fixture
+def today_noon():
+    return datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
+
+
+@pytest.fixture
+def data_source():
+    return FakeDataSource()
+
+
+@pytest.fixture
+def monitor(tmp_path, data_source):
+    pricing = {
+        "claude-sonnet-4": ModelPricing(
+            input=Decimal("3"),
+            output=Decimal("15"),
+            cacheWrite=Decimal("3.75"),
+            cacheRead=Decimal("0.3"),
+            contextWindow=200000,
+            sessionQuota=Decimal("5"),
+        )
+    }
+    monitor = LiveMonitor(pricing, data_source=data_source)
+    monitor._current_base_path = str(tmp_path)
+    return monitor
+
+
+class TestSessionCache:
+    """Tests for reusing and invalidating parsed sessions."""
+
+    def test_unchanged_session_is_reused(self, tmp_path, monitor, data_source):
+        session_dir = tmp_path / "ses1"
+        session_dir.mkdir()
+        write_interaction(session_dir / "m1.json", 1000, datetime.now())
+
+        first = monitor._load_session(session_dir)
+        second = monitor._load_session(session_dir)
+
+        assert second is first
+        assert data_source.reads == 1
+
+    def test_modified_file_reloads_session(
+        self, tmp_path, monitor, data_source, today_noon
+    ):
+        session_dir = tmp_path / "ses1"
+        session_dir.mkdir()
+        write_interaction(session_dir / "m1.json", 1000, today_noon)
+        first = monitor._load_session(session_dir)
+
+        write_interaction(session_dir / "m1.json", 5000, today_noon + timedelta(1))
+        second = monitor._load_session(session_dir)
+
+        assert second is not first
+        assert second.files[0].tokens.input == 5000
+        assert data_source.reads == 2
+
+    def test_deleted_session_is_dropped(
+        self, tmp_path, monitor, monkeypatch, today_noon
+    ):
+        freeze_now(monkeypatch, today_noon + timedelta(hours=1))
+        for name, input_tokens in (("ses1", 1_000_000), ("ses2", 2_000_000)):
+            (tmp_path / name).mkdir()
+            write_interaction(tmp_path / name / "m1.json", input_tokens, today_noon)
+        assert monitor._calculate_daily_cost() == Decimal("9")
+
+        shutil.rmtree(tmp_path / "ses2")
+        # Make the directory change visible even on coarse mtime filesystems
+        later = today_noon.timestamp() + 3600
+        os.utime(tmp_path, (later, later))
+
+        assert monitor._get_cached_session(str(tmp_path / "ses2")) is None
+        assert str(tmp_path / "ses2") not in monitor._session_cache
+        assert monitor._calculate_daily_cost() == Decimal("3")
+
+    def test_day_rollover_recounts_without_reloading(
+        self, tmp_path, monitor, data_source, monkeypatch, today_noon
+    ):
+        session_dir = tmp_path / "ses1"
+        session_dir.mkdir()
+        write_interaction(session_dir / "m1.json", 1_000_000, today_noon - timedelta(1))
+        write_interaction(session_dir / "m2.json", 2_000_000, today_noon)
+        # Keep the session newer than both day starts
+        os.utime(session_dir, (today_noon.timestamp(), today_noon.timestamp()))
+
+        # Late yesterday, then shortly after midnight
+        freeze_now(monkeypatch, today_noon - timedelta(hours=13))
+        assert monitor._calculate_daily_cost() == Decimal("3")
+
+        freeze_now(monkeypatch, today_noon - timedelta(hours=11))
+        assert monitor._calculate_daily_cost() == Decimal("6")
+        assert data_source.reads == 1
+
+    def test_sqlite_wal_changes_fingerprint(self, tmp_path):
+        db_path = tmp_path / "crush.db"
+        db_path.write_bytes(b"\0" * 4096)
+        before = LiveMonitor._session_fingerprint(db_path)
+
+        # New rows land in the write-ahead log before any checkpoint
+        (tmp_path / "crush.db-wal").write_bytes(b"\0" * 8192)
+
+        assert LiveMonitor._session_fingerprint(db_path) != before
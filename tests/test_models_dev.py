@@ -0,0 +1,95 @@
+"""Tests for the Models.dev pricing client."""
+
+from decimal import Decimal
+
+import pytest
+
+from omo_monitor.pricing import models_dev
+from omo_monitor.pricing.models_dev import ModelsDevClient
+
+
+API_RESPONSE = {
+    "anthropic": {
+        "id": "anthropic",
+        "models": {
+            "claude-sonnet-4-5-20250929": {
+                "cost": {"input": 3, "output": 15},
+                "limit": {"context": 200000},
+            },
+            "claude-opus-4-5": {
+                "cost": {"input": 5, "output": 25},
+                "limit": {"context": 200000},
+            },
+        },
+    },
+    "openrouter": {
+        "id": "openrouter",
+        "models": {
+            "anthropic/claude-opus-4-5": {
+                "cost": {"input": 6, "output": 30},
+                "limit": {"context": 200000},
+            },
+            "claude-sonnet-4-5-20250929": {
+                "cost": {"input": 4, "output": 20},
+                "limit": {"context": 200000},
+            },
+        },
+    },
+}
+
+# Name -> input price, as listed before aliases were split out
+EXPECTED_BY_NAME = {
+    "claude-sonnet-4-5-20250929": Decimal("4"),
+    "claude-sonnet-4.5": Decimal("3"),
+    "anthropic/claude-sonnet-4-5-20250929": Decimal("3"),
+    "claude-opus-4-5": Decimal("5"),
+    "claude-opus-4.5": Decimal("5"),
+    "anthropic/claude-opus-4-5": Decimal("6"),
+    "anthropic/claude-opus-4.5": Decimal("6"),
+    "openrouter/anthropic/claude-opus-4-5": Decimal("6"),
+    "openrouter/claude-sonnet-4-5-20250929": Decimal("4"),
+}
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    client = ModelsDevClient(cache_path=tmp_path / "models_dev_pricing.json")
+    monkeypatch.setattr(
+        client, "_fetch_from_api", lambda: client._parse_api_response(API_RESPONSE)
+    )
+    return client
+
+
+class TestModelsDevClient:
+    """Tests for ModelsDevClient pricing lookups."""
+
+    def test_fetch_pricing_is_keyed_by_provider(self, client):
+        pricing = client.fetch_pricing()
+        assert set(pricing) == {
+            "anthropic/claude-sonnet-4-5-20250929",
+            "anthropic/claude-opus-4-5",
+            "openrouter/anthropic/claude-opus-4-5",
+            "openrouter/claude-sonnet-4-5-20250929",
+        }
+
+    def test_fetch_pricing_by_name(self, client):
+        by_name = client.fetch_pricing_by_name()
+        assert {name: p.input for name, p in by_name.items()} == EXPECTED_BY_NAME
+        assert client.get_cache_info()["models_count"] == len(EXPECTED_BY_NAME)
+
+    def test_get_model_pricing_matches_listing(self, client):
+        for name, input_price in EXPECTED_BY_NAME.items():
+            assert client.get_model_pricing(name).input == input_price
+        assert client.get_model_pricing("Claude-Opus-4-5").input == Decimal("5")
+
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_file_cache_round_trip(self, client, tmp_path, monkeypatch, has_orjson):
+        if has_orjson and not models_dev.HAS_ORJSON:
+            pytest.skip("orjson is not installed")
+        monkeypatch.setattr(models_dev, "HAS_ORJSON", has_orjson)
+        client.fetch_pricing()
+        assert [p.name for p in tmp_path.iterdir()] == ["models_dev_pricing.json"]
+        reloaded = ModelsDevClient(cache_path=tmp_path / "models_dev_pricing.json")
+        by_name = reloaded.fetch_pricing_by_name()
+        assert {name: p.input for name, p in by_name.items()} == EXPECTED_BY_NAME
+        assert reloaded.get_cache_info()["models_count"] == len(EXPECTED_BY_NAME)
@@ -0,0 +1,118 @@
+"""Tests for report generation."""
+
+import csv
+import io
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
+from omo_monitor.cli import write_csv_rows
+from omo_monitor.config import ModelPricing
+from omo_monitor.models.session import (
+    InteractionFile,
+    SessionData,
+    TimeData,
+    TokenUsage,
+)
+from omo_monitor.services.report_generator import ReportGenerator
+from omo_monitor.services.session_analyzer import SessionAnalyzer
+
+# 2024-01-15 12:00 UTC in milliseconds, the same date in most timezones
+BASE_MS = 1705320000000
+DAY_MS = 86400000
+
+
+class FakeDataSource:
+    """Data source serving a fixed set of sessions."""
+
+    def __init__(self, sessions):
+        self.sessions = sessions
+
+    def load_all_sessions(self, base_path, limit=None):
+        return self.sessions[:limit] if limit else list(self.sessions)
+
+
+def make_session(index: int) -> SessionData:
+    files = []
+    for j, model in enumerate(["claude-sonnet-4", "gpt-4o", "claude-sonnet-4"]):
+        created = BASE_MS + (index % 3) * DAY_MS + j * 60000
+        files.append(
+            InteractionFile(
+                file_path=Path(f"/sessions/ses{index}/msg{j}.json"),
+                session_id=f"ses{index}",
+                model_id=model,
+                tokens=TokenUsage(input=1000 * (j + 1), output=200, cache_read=5000),
+                time_data=TimeData(created=created, completed=created + 1500),
+            )
+        )
+    return SessionData(
+        session_id=f"ses{index}",
+        session_path=Path(f"/sessions/ses{index}"),
+        files=files,
+    )
+
+
+@pytest.fixture
+def report_generator():
+    pricing = {
+        model: ModelPricing(
+            input=Decimal("3"),
+            output=Decimal("15"),
+            cacheWrite=Decimal("3.75"),
+            cacheRead=Decimal("0.3"),
+            contextWindow=200000,
+            sessionQuota=Decimal("5"),
+        )
+        for model in ["claude-sonnet-4", "gpt-4o"]
+    }
+    sessions = [make_session(i) for i in range(5)]
+    analyzer = SessionAnalyzer(pricing, data_source=FakeDataSource(sessions))
+    return ReportGenerator(analyzer, Console(file=io.StringIO()))
+
+
+class TestStreamingCsv:
+    """Tests for streamed CSV report rows."""
+
+    def test_sessions_summary_stream_matches_list(self, report_generator):
+        rows = report_generator.generate_sessions_summary_report(
+            "/sessions", output_format="csv"
+        )
+        streamed = report_generator.generate_sessions_summary_report(
+            "/sessions", output_format="csv", stream=True
+        )
+
+        assert not isinstance(streamed, list)
+        assert list(streamed) == rows
+        assert len(rows) == 10  # two models in each of five sessions
+
+    def test_daily_stream_matches_list(self, report_generator):
+        rows = report_generator.generate_daily_report("/sessions", output_format="csv")
+        streamed = report_generator.generate_daily_report(
+            "/sessions", output_format="csv", stream=True
+        )
+
+        assert not isinstance(streamed, list)
+        assert list(streamed) == rows
+        assert [row["date"] for row in rows] == [
+            "2024-01-15",
+            "2024-01-16",
+            "2024-01-17",
+        ]
+
+    def test_write_csv_rows(self, report_generator, capsys):
+        rows = report_generator.generate_daily_report("/sessions", output_format="csv")
+
+        write_csv_rows(
+            report_generator.generate_daily_report(
+                "/sessions", output_format="csv", stream=True
+            )
+        )
+
+        written = list(csv.DictReader(io.StringIO(capsys.readouterr().out)))
+        assert written == [{k: str(v) for k, v in row.items()} for row in rows]
+
+    def test_write_csv_rows_empty(self, capsys):
+        write_csv_rows(iter([]))
+        assert capsys.readouterr().out == ""